@@ -0,0 +1,106 @@
+"""
+Ingestion throughput and memory benchmark against the local HuggingFace stand-in.
+
+Points HuggingFaceDB at the fixture server, runs sync_papers into an empty
+window and reports papers/second and peak memory:
+
+    python infra/mock_servers/huggingface_server.py serve --papers-per-day 5000 --failure-rate 0.01 &
+    python infra/benchmarks/ingestion_throughput.py --tracemalloc
+
+Use a dedicated database (ingest_bench by default): the benchmark deletes
+the papers the fixture server generates (ids starting with ``bench.``)
+before every run. sync_papers fetches the last 7 days and today when the
+papers table is empty, so a run ingests 8 days of the server's scale.
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import time
+import tracemalloc
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mock-url", default="http://localhost:8082", help="base URL of the fixture server")
+    parser.add_argument("--database", default="ingest_bench", help="Postgres database to run in")
+    parser.add_argument("--tracemalloc", action="store_true", help="also trace the peak of Python allocations")
+    return parser.parse_args()
+
+
+ARGS = parse_args()
+
+# The bot reads its settings from the environment on import
+os.environ["POSTGRES_DB"] = ARGS.database
+os.environ["HF_API_BASE_URL"] = f"{ARGS.mock_url}/api"
+os.environ["JINA_READER_BASE_URL"] = f"{ARGS.mock_url}/jina"
+os.environ.setdefault("BOT_TOKEN", "0:benchmark")
+os.environ.setdefault("FSM_HOST", "localhost")
+os.environ.setdefault("FSM_PORT", "6379")
+os.environ.setdefault("FSM_PASSWORD", "")
+
+import asyncpg  # noqa: E402
+import structlog  # noqa: E402
+
+from telegram_bot.data import config  # noqa: E402
+from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB  # noqa: E402
+from telegram_bot.db.db_api.storages.postgres import PostgresConnection  # noqa: E402
+
+DEPENDENT_TABLES = ("summary_queue", "paper_summaries", "paper_fulltext")
+
+
+async def clear_bench_papers(db: PostgresConnection) -> None:
+    for table in DEPENDENT_TABLES:
+        exists = await db._fetchrow("SELECT to_regclass($1) IS NOT NULL AS exists;", (table,))
+        if exists.data["exists"]:
+            await db._execute(f"DELETE FROM {table} WHERE paper_id LIKE 'bench.%';")  # noqa: S608
+    await db._execute("DELETE FROM papers WHERE id LIKE 'bench.%';")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+    pool = await asyncpg.create_pool(
+        host=config.POSTGRES_HOST,
+        port=config.POSTGRES_PORT,
+        user=config.POSTGRES_USER,
+        password=config.POSTGRES_PASSWORD,
+        database=config.POSTGRES_DB,
+    )
+    db = PostgresConnection(connection_poll=pool, logger=structlog.get_logger())
+    hf_db = HuggingFaceDB(db)
+    await hf_db.init_db()
+    await clear_bench_papers(db)
+
+    others = await db._fetchrow("SELECT COUNT(*) AS count FROM papers;")
+    if others.data["count"]:
+        print(f"Warning: {others.data['count']} other papers in {ARGS.database}, the sync window is shorter")  # noqa: T201
+
+    rss_before = peak_rss_mb()
+    if ARGS.tracemalloc:
+        tracemalloc.start()
+    started = time.monotonic()
+    await hf_db.sync_papers()
+    elapsed = time.monotonic() - started
+    traced_peak = tracemalloc.get_traced_memory()[1] / 2**20 if ARGS.tracemalloc else None
+    tracemalloc.stop()
+
+    ingested = await db._fetchrow("SELECT COUNT(*) AS count FROM papers WHERE id LIKE 'bench.%';")
+    count = ingested.data["count"]
+
+    print(f"Papers ingested:      {count} in {elapsed:.1f}s")  # noqa: T201
+    print(f"Throughput:           {count / elapsed:.1f} papers/second")  # noqa: T201
+    print(f"Peak RSS:             {peak_rss_mb():.1f} MB (was {rss_before:.1f} MB before the sync)")  # noqa: T201
+    if traced_peak is not None:
+        print(f"Peak traced Python:   {traced_peak:.1f} MB")  # noqa: T201
+
+    await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Microbenchmark of daily_papers payload normalization, in records per second.
+
+Compares the dict path process_paper used before (json decoding, two
+strptime calls, counts stringified and converted back with int() for the
+insert) with PaperRecord decoded from orjson, on a synthetic payload:
+
+    python infra/benchmarks/paper_records.py --papers 10000
+
+A recorded daily_papers JSON file can be given instead of the synthetic payload.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from telegram_bot.models import PaperRecord
+
+
+def synthetic_payload(papers: int) -> bytes:
+    entries = []
+    for i in range(papers):
+        entries.append({
+            "paper": {
+                "id": f"2410.{i:05d}",
+                "authors": [{"name": f"Author {i}"}, {"name": "Second Author"}, {"name": "Hidden", "hidden": True}],
+                "publishedAt": "2024-10-30T00:00:00.000Z",
+                "title": f"Synthetic paper {i} on efficient language modeling",
+                "summary": "We propose a novel method for efficient training of large language models. " * 8,
+                "upvotes": i % 300,
+            },
+            "publishedAt": "2024-10-30T12:34:56.789Z",
+            "title": f"Synthetic paper {i} on efficient language modeling",
+            "thumbnail": f"https://example.com/{i}.png",
+            "numComments": i % 17,
+            "mediaUrls": [],
+            "submittedBy": {"fullname": "Benchmark Bot"},
+        })
+    return json.dumps(entries).encode()
+
+
+def legacy_process_paper(paper_data: dict[str, Any]) -> dict[str, Any]:
+    paper_id = paper_data['paper']['id']
+    paper_url = f"https://arxiv.org/pdf/{paper_id}"
+    authors = ", ".join([author['name'] for author in paper_data['paper']['authors'] if not author.get('hidden', False)])
+    return {
+        'id': paper_id,
+        'url': paper_url,
+        'title': paper_data['paper']['title'],
+        'authors': authors,
+        'abstract': paper_data['paper']['summary'],
+        'paper_published_at': datetime.strptime(paper_data['paper']['publishedAt'], "%Y-%m-%dT%H:%M:%S.%fZ"),
+        'published_at': datetime.strptime(paper_data['publishedAt'], "%Y-%m-%dT%H:%M:%S.%fZ"),
+        'upvotes': str(paper_data['paper']['upvotes']),
+        'num_comments': str(paper_data.get('numComments', 0)),
+        'thumbnail': paper_data.get('thumbnail', ''),
+        'media_urls': ", ".join(paper_data.get('mediaUrls', [])),
+        'submitted_by': paper_data['submittedBy']['fullname']
+    }
+
+
+def legacy_path(body: bytes) -> list[tuple[Any, ...]]:
+    papers = [legacy_process_paper(entry) for entry in json.loads(body)]
+    return [
+        (
+            paper['id'], paper['url'], paper['title'], paper['authors'], paper['abstract'],
+            paper['paper_published_at'], paper['published_at'], int(paper['upvotes']),
+            int(paper['num_comments']), paper['thumbnail'], paper['media_urls'], paper['submitted_by'],
+        )
+        for paper in papers
+    ]
+
+
+def record_path(body: bytes) -> list[tuple[Any, ...]]:
+    return [paper.as_row() for paper in PaperRecord.decode_daily_papers(body)]
+
+
+def measure(name: str, run: Callable[[bytes], list[Any]], body: bytes, repeat: int) -> list[Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = run(body)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<24} {len(rows) / best:>12,.0f} records/sec  ({best * 1000:.1f} ms)")  # noqa: T201
+    return rows
+
+
+def retained_bytes(build: Callable[[], list[Any]]) -> int:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--papers", type=int, default=10000, help="number of papers in the synthetic payload")
+    parser.add_argument("--input", help="recorded daily_papers JSON file instead of the synthetic payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "rb") as f:
+            body = f.read()
+    else:
+        body = synthetic_payload(args.papers)
+
+    legacy_rows = measure("dict path", legacy_path, body, args.repeat)
+    record_rows = measure("PaperRecord path", record_path, body, args.repeat)
+    if legacy_rows != record_rows:
+        print("warning: the two paths produced different rows")  # noqa: T201
+
+    count = len(record_rows)
+    legacy_size = retained_bytes(lambda: [legacy_process_paper(entry) for entry in json.loads(body)])
+    record_size = retained_bytes(lambda: PaperRecord.decode_daily_papers(body))
+    print(f"{'retained per paper':<24} dict {legacy_size / count:,.0f} B, PaperRecord {record_size / count:,.0f} B")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
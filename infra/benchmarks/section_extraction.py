@@ -0,0 +1,103 @@
+"""
+Benchmark of abstract extraction from large paper markdown, in MB per second.
+
+Compares the line loop get_paper_content used before (split into lines,
+abstract built with repeated string concatenation) with the single-pass
+extract_sections, on synthetic documents of growing size:
+
+    python infra/benchmarks/section_extraction.py --sizes 1 10 50 --abstract-share 0.5
+
+--abstract-share sets how much of each document is the abstract, which is
+where the old loop concatenated. A file can be given to run on real markdown.
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from telegram_bot.data_utils.huggingface.markdown_sections import extract_sections
+
+SENTENCE_WORDS = (
+    "we propose a novel method for efficient training of large language models and evaluate it "
+    "on reasoning translation and retrieval benchmarks where it outperforms strong baselines"
+).split()
+SECTIONS = ["Introduction", "Related Work", "Method", "Experiments", "Results", "Discussion", "Conclusion"]
+
+
+def synthetic_markdown(size_mb: float, abstract_share: float, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = [rng.choice(SENTENCE_WORDS).capitalize() + " " + " ".join(rng.choices(SENTENCE_WORDS, k=15)) + "."
+             for _ in range(2000)]
+    target = int(size_mb * 2**20)
+
+    def body(size: int) -> str:
+        parts, length = [], 0
+        while length < size:
+            line = rng.choice(lines)
+            parts.append(line)
+            length += len(line) + 1
+        return "\n".join(parts)
+
+    rest = target - int(target * abstract_share)
+    section_size = rest // len(SECTIONS)
+    parts = ["# A Synthetic Paper", "## Abstract", body(int(target * abstract_share))]
+    for number, title in enumerate(SECTIONS, 1):
+        parts += [f"## {number}. {title}", body(section_size)]
+    return "\n".join(parts)
+
+
+def legacy_abstract(markdown_content: str) -> str:
+    abstract = ""
+    lines = markdown_content.split('\n')
+    in_abstract = False
+    for line in lines:
+        if '## Abstract' in line:
+            in_abstract = True
+            continue
+        elif line.startswith('## ') and in_abstract:
+            break
+        elif in_abstract:
+            abstract += line + '\n'
+    return abstract.strip()
+
+
+def measure(name: str, run: Callable[[str], object], document: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run(document)
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"  {name:<36} {len(document) / 2**20 / elapsed:>10,.1f} MB/s  ({elapsed * 1000:.1f} ms)")  # noqa: T201
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10, 50], help="document sizes in MB")
+    parser.add_argument("--abstract-share", type=float, default=0.5, help="share of the document in the abstract")
+    parser.add_argument("--input", help="markdown file to run on instead of synthetic documents")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            documents = [(args.input, f.read())]
+    else:
+        documents = [(f"{size:g} MB synthetic", synthetic_markdown(size, args.abstract_share)) for size in args.sizes]
+
+    for name, document in documents:
+        print(name)  # noqa: T201
+        if extract_sections(document, ["abstract"]).get("abstract", "") != legacy_abstract(document):
+            print("  warning: the extractors disagree on this document")  # noqa: T201
+        measure("legacy line loop", legacy_abstract, document, args.repeat)
+        measure("extract_sections (abstract)", lambda doc: extract_sections(doc, ["abstract"]), document, args.repeat)
+        measure(
+            "extract_sections (3 sections)",
+            lambda doc: extract_sections(doc, ["abstract", "introduction", "conclusion"]),
+            document,
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+End-to-end summarization throughput benchmark against the local mock OpenAI server.
+
+Seeds synthetic papers into a local Postgres database, runs
+HuggingFaceManager.sync_papers_and_summaries without fetching from
+HuggingFace, and reports papers/minute, OpenAI call latency percentiles
+and how injected errors were recovered from:
+
+    python infra/mock_servers/openai_server.py --error-rate 0.02 --rate-limit-rate 0.02 &
+    python infra/benchmarks/summarization_throughput.py --papers 500 --keys key-a,key-b
+
+Use a dedicated database (papers_bench by default): the benchmark creates
+the bot's tables there and replaces the summaries of its seeded papers.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--papers", type=int, default=200, help="number of papers to summarize")
+    parser.add_argument("--mock-url", default="http://localhost:8081", help="base URL of the mock OpenAI server")
+    parser.add_argument("--keys", default="bench-key", help="comma-separated API keys sent to the mock server")
+    parser.add_argument("--database", default="papers_bench", help="Postgres database to run in")
+    parser.add_argument("--abstract-words", type=int, default=250)
+    return parser.parse_args()
+
+
+ARGS = parse_args()
+
+# The bot reads its settings from the environment on import
+os.environ["POSTGRES_DB"] = ARGS.database
+os.environ["OPENAI_BASE_URL"] = f"{ARGS.mock_url}/v1"
+os.environ["OPENAI_API_KEYS"] = ARGS.keys
+os.environ.setdefault("BOT_TOKEN", "0:benchmark")
+os.environ.setdefault("FSM_HOST", "localhost")
+os.environ.setdefault("FSM_PORT", "6379")
+os.environ.setdefault("FSM_PASSWORD", "")
+
+import asyncpg  # noqa: E402
+import structlog  # noqa: E402
+
+from telegram_bot.data import config  # noqa: E402
+from telegram_bot.data_utils.huggingface.huggingface_manager import HuggingFaceManager  # noqa: E402
+from telegram_bot.db.db_api.storages.postgres import PostgresConnection  # noqa: E402
+
+WORDS = (
+    "we propose a novel method for efficient training of large language models and evaluate it "
+    "on reasoning translation and retrieval benchmarks where it outperforms strong baselines"
+).split()
+
+
+def mock_stats() -> dict[str, int]:
+    with urllib.request.urlopen(f"{ARGS.mock_url}/stats") as response:  # noqa: S310
+        return json.loads(response.read())
+
+
+async def seed_papers(db: PostgresConnection) -> list[str]:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = [
+        (
+            f"bench-{i:06d}",
+            f"https://huggingface.co/papers/bench-{i:06d}",
+            f"Benchmark paper {i}",
+            "[]",
+            " ".join(rng.choices(WORDS, k=ARGS.abstract_words)),
+            now - timedelta(minutes=i),
+            rng.randint(0, 300),
+        )
+        for i in range(ARGS.papers)
+    ]
+    await db._execute(
+        """
+        INSERT INTO papers (id, url, title, authors, abstract, published_at, upvotes)
+        VALUES ($1, $2, $3, $4, $5, $6, $7)
+        ON CONFLICT (id) DO NOTHING;
+        """,
+        rows,
+    )
+    ids = [row[0] for row in rows]
+    await db._execute("DELETE FROM summary_queue WHERE paper_id = ANY($1);", (ids,))
+    await db._execute("DELETE FROM paper_summaries WHERE paper_id = ANY($1);", (ids,))
+    return ids
+
+
+async def main() -> None:
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(30))
+    pool = await asyncpg.create_pool(
+        host=config.POSTGRES_HOST,
+        port=config.POSTGRES_PORT,
+        user=config.POSTGRES_USER,
+        password=config.POSTGRES_PASSWORD,
+        database=config.POSTGRES_DB,
+    )
+    db = PostgresConnection(connection_poll=pool, logger=structlog.get_logger())
+    manager = HuggingFaceManager(db)
+    await manager.hf_db.init_db()
+    await manager.init_summaries_table()
+    ids = await seed_papers(db)
+
+    stats_before = mock_stats()
+    started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    started = time.monotonic()
+    await manager.sync_papers_and_summaries(lazy=False, fetch=False)
+    elapsed = time.monotonic() - started
+    await manager.usage_ledger.flush()
+    stats_after = mock_stats()
+
+    summarized = await db._fetchrow(
+        """
+        SELECT COUNT(*) AS count FROM paper_summaries
+        WHERE paper_id = ANY($1) AND summary_en IS NOT NULL AND summary_ru IS NOT NULL;
+        """,
+        (ids,),
+    )
+    latency = await db._fetchrow(
+        """
+        SELECT COUNT(*) AS calls,
+               percentile_cont(0.5) WITHIN GROUP (ORDER BY latency_ms) AS p50,
+               percentile_cont(0.99) WITHIN GROUP (ORDER BY latency_ms) AS p99
+        FROM openai_usage
+        WHERE created_at >= $1 AND NOT cache_hit;
+        """,
+        (started_at,),
+    )
+    responses = {key: stats_after.get(key, 0) - stats_before.get(key, 0) for key in stats_after}
+    done = summarized.data["count"]
+
+    print(f"Papers summarized:    {done}/{len(ids)} in {elapsed:.1f}s")  # noqa: T201
+    print(f"Throughput:           {done / elapsed * 60:.1f} papers/minute")  # noqa: T201
+    print(  # noqa: T201
+        f"Completed calls:      {latency.data['calls']}, "
+        f"p50 {latency.data['p50'] or 0:.0f} ms, p99 {latency.data['p99'] or 0:.0f} ms per successful attempt"
+    )
+    print(f"Mock server answers:  {json.dumps(responses, sort_keys=True)}")  # noqa: T201
+    print(f"Circuit breaker:      {manager.openai_client.circuit_breaker.state}")  # noqa: T201
+    for key in manager.openai_client.key_pool.keys:
+        print(f"Key {key.name}:          rate limited {key.rate_limited_count} times")  # noqa: T201
+
+    await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,181 @@
+"""
+Local stand-in for the HuggingFace daily papers API and the Jina reader.
+
+Replays recorded ``daily_papers`` payloads and markdown documents, scaled to
+any number of papers per day, so ingestion can be load-tested offline:
+
+    python infra/mock_servers/huggingface_server.py record --dates 2024-10-30 2024-10-31
+    python infra/mock_servers/huggingface_server.py serve --papers-per-day 5000 --failure-rate 0.01
+    HF_API_BASE_URL=http://localhost:8082/api JINA_READER_BASE_URL=http://localhost:8082/jina ...
+
+Recordings live in --fixtures (``daily_papers/<date>.json`` and
+``markdown/<paper id>.md``). Without recordings, a built-in paper is used.
+Every day gets ``--papers-per-day`` entries made by cycling through the
+recorded papers and giving them ids of the form ``bench.<yyyymmdd>.<n>``.
+daily_papers answers carry an ETag and conditional requests get 304.
+"""
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import pathlib
+import random
+from functools import lru_cache
+
+from aiohttp import ClientSession, web
+
+DEFAULT_FIXTURES = pathlib.Path(__file__).parent / "fixtures" / "huggingface"
+
+BUILTIN_PAPER = {
+    "paper": {
+        "id": "2410.00000",
+        "authors": [{"name": "Ada Lovelace"}, {"name": "Alan Turing"}, {"name": "Hidden Author", "hidden": True}],
+        "publishedAt": "2024-10-30T00:00:00.000Z",
+        "title": "A Benchmark Paper on Efficient Language Modeling",
+        "summary": (
+            "We propose a novel method for efficient training of large language models. "
+            "It reduces the memory footprint of attention and improves accuracy on reasoning, "
+            "translation and retrieval benchmarks, outperforming strong baselines with fewer parameters."
+        ),
+        "upvotes": 42,
+    },
+    "publishedAt": "2024-10-30T12:00:00.000Z",
+    "title": "A Benchmark Paper on Efficient Language Modeling",
+    "thumbnail": "https://example.com/thumbnail.png",
+    "numComments": 3,
+    "mediaUrls": [],
+    "submittedBy": {"fullname": "Benchmark Bot"},
+}
+
+BUILTIN_MARKDOWN = """# {title}
+
+## Abstract
+
+{summary}
+
+## Introduction
+
+{body}
+"""
+
+
+class Fixtures:
+    def __init__(self, directory: pathlib.Path, papers_per_day: int) -> None:
+        self.directory = directory
+        self.papers_per_day = papers_per_day
+        self.templates = self._load_templates()
+
+    def _load_templates(self) -> list[dict]:
+        templates = []
+        for path in sorted((self.directory / "daily_papers").glob("*.json")):
+            templates.extend(json.loads(path.read_text()))
+        return templates or [BUILTIN_PAPER]
+
+    @lru_cache(maxsize=32)  # noqa: B019
+    def daily_papers(self, date: str) -> bytes:
+        """Serialized payload of a day, built once per date."""
+        compact = date.replace("-", "")
+        papers = []
+        for i in range(self.papers_per_day):
+            entry = copy.deepcopy(self.templates[i % len(self.templates)])
+            entry["paper"]["id"] = f"bench.{compact}.{i:05d}"
+            entry["paper"]["upvotes"] = (entry["paper"].get("upvotes") or 0) + i % 100
+            entry["publishedAt"] = f"{date}T12:00:00.000Z"
+            papers.append(entry)
+        return json.dumps(papers).encode()
+
+    def template_for(self, paper_id: str) -> dict:
+        index = int(paper_id.rsplit(".", 1)[-1]) if paper_id.startswith("bench.") else 0
+        return self.templates[index % len(self.templates)]
+
+    def markdown(self, paper_id: str) -> str:
+        original_id = self.template_for(paper_id)["paper"]["id"]
+        path = self.directory / "markdown" / f"{original_id}.md"
+        if path.exists():
+            return path.read_text()
+        paper = self.template_for(paper_id)["paper"]
+        return BUILTIN_MARKDOWN.format(title=paper["title"], summary=paper["summary"], body=paper["summary"] * 20)
+
+
+def make_app(fixtures: Fixtures, latency: float, failure_rate: float) -> web.Application:
+    async def delay_or_fail() -> None:
+        if latency > 0:
+            await asyncio.sleep(random.expovariate(1 / latency))
+        if random.random() < failure_rate:
+            raise web.HTTPServiceUnavailable(text="Injected failure")
+
+    async def daily_papers(request: web.Request) -> web.Response:
+        await delay_or_fail()
+        date = request.query.get("date")
+        if not date:
+            raise web.HTTPBadRequest(text="date is required")
+        body = fixtures.daily_papers(date)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def paper(request: web.Request) -> web.Response:
+        await delay_or_fail()
+        template = fixtures.template_for(request.match_info["paper_id"])
+        return web.json_response({**template["paper"], "id": request.match_info["paper_id"]})
+
+    async def jina(request: web.Request) -> web.Response:
+        await delay_or_fail()
+        paper_id = request.match_info["url"].rstrip("/").rsplit("/", 1)[-1]
+        return web.Response(text=fixtures.markdown(paper_id), content_type="text/markdown")
+
+    app = web.Application()
+    app.router.add_get("/api/daily_papers", daily_papers)
+    app.router.add_get("/api/papers/{paper_id}", paper)
+    app.router.add_get("/jina/{url:.*}", jina)
+    return app
+
+
+async def record(directory: pathlib.Path, dates: list[str], with_markdown: bool) -> None:
+    (directory / "daily_papers").mkdir(parents=True, exist_ok=True)
+    (directory / "markdown").mkdir(parents=True, exist_ok=True)
+    async with ClientSession() as session:
+        for date in dates:
+            async with session.get("https://huggingface.co/api/daily_papers", params={"date": date}) as response:
+                response.raise_for_status()
+                papers = await response.json()
+            (directory / "daily_papers" / f"{date}.json").write_text(json.dumps(papers))
+            print(f"Recorded {len(papers)} papers of {date}")  # noqa: T201
+            if not with_markdown:
+                continue
+            for entry in papers:
+                paper_id = entry["paper"]["id"]
+                async with session.get(f"https://r.jina.ai/https://arxiv.org/pdf/{paper_id}") as response:
+                    if response.status == 200:
+                        (directory / "markdown" / f"{paper_id}.md").write_text(await response.text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", type=pathlib.Path, default=DEFAULT_FIXTURES)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="serve the recorded payloads")
+    serve.add_argument("--host", default="localhost")
+    serve.add_argument("--port", type=int, default=8082)
+    serve.add_argument("--papers-per-day", type=int, default=50)
+    serve.add_argument("--latency", type=float, default=0.05, help="mean seconds to wait before answering")
+    serve.add_argument("--failure-rate", type=float, default=0.0, help="share of requests failed with 503")
+
+    rec = commands.add_parser("record", help="record daily_papers payloads from huggingface.co")
+    rec.add_argument("--dates", nargs="+", required=True, help="dates as YYYY-MM-DD")
+    rec.add_argument("--markdown", action="store_true", help="also record the Jina markdown of every paper")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        asyncio.run(record(args.fixtures, args.dates, args.markdown))
+        return
+    fixtures = Fixtures(args.fixtures, args.papers_per_day)
+    web.run_app(make_app(fixtures, args.latency, args.failure_rate), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Local stand-in for the OpenAI chat completions and embeddings APIs.
+
+Run it and point the bot at it to load-test summarization without real keys:
+
+    python infra/mock_servers/openai_server.py --rpm 20 --tpm 20000
+    OPENAI_BASE_URL=http://localhost:8081/v1 OPENAI_API_KEYS=key-a,key-b ...
+
+Every API key gets its own request and token budget per minute. Responses
+carry ``x-ratelimit-*`` headers like the real API, and requests over budget
+are answered with 429 and ``retry-after``. Latency follows a log-normal
+distribution, and a share of requests can be failed with 500 or 429 on
+purpose. GET /stats returns the counters of answered requests.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+WINDOW_SECONDS = 60.0
+CHARS_PER_TOKEN = 4
+COMPLETION_TEXT = (
+    "This paper proposes a method and evaluates it on standard benchmarks, "
+    "reporting consistent improvements over strong baselines."
+)
+
+
+@dataclass
+class KeyBudget:
+    rpm: int
+    tpm: int
+    window_start: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    tokens: int = 0
+
+    def refill(self, now: float) -> None:
+        if now - self.window_start >= WINDOW_SECONDS:
+            self.window_start = now
+            self.requests = 0
+            self.tokens = 0
+
+    def reset_in(self, now: float) -> float:
+        return max(0.0, self.window_start + WINDOW_SECONDS - now)
+
+    def headers(self, now: float) -> dict[str, str]:
+        reset = f"{self.reset_in(now):.3f}s"
+        return {
+            "x-ratelimit-limit-requests": str(self.rpm),
+            "x-ratelimit-limit-tokens": str(self.tpm),
+            "x-ratelimit-remaining-requests": str(max(0, self.rpm - self.requests)),
+            "x-ratelimit-remaining-tokens": str(max(0, self.tpm - self.tokens)),
+            "x-ratelimit-reset-requests": reset,
+            "x-ratelimit-reset-tokens": reset,
+        }
+
+
+@dataclass
+class Faults:
+    latency_median: float
+    latency_sigma: float
+    error_rate: float
+    rate_limit_rate: float
+    retry_after: float
+
+    def latency(self) -> float:
+        if self.latency_median <= 0:
+            return 0.0
+        return random.lognormvariate(0.0, self.latency_sigma) * self.latency_median
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def make_app(rpm: int, tpm: int, faults: Faults) -> web.Application:
+    budgets: dict[str, KeyBudget] = {}
+    stats: Counter[str] = Counter()
+
+    def admit(request: web.Request, tokens: int) -> tuple[dict[str, str], web.Response | None]:
+        """Charge a request to its key's budget, or build the error response it gets instead."""
+        api_key = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not api_key:
+            stats["401"] += 1
+            error = {"error": {"message": "Missing API key", "type": "invalid_request_error"}}
+            return {}, web.json_response(error, status=401)
+
+        now = time.monotonic()
+        budget = budgets.setdefault(api_key, KeyBudget(rpm=rpm, tpm=tpm))
+        budget.refill(now)
+        headers = budget.headers(now)
+        if random.random() < faults.error_rate:
+            stats["500_injected"] += 1
+            error = {"error": {"message": "The server had an error", "type": "server_error"}}
+            return headers, web.json_response(error, status=500, headers=headers)
+        over_budget = budget.requests + 1 > budget.rpm or budget.tokens + tokens > budget.tpm
+        if over_budget or random.random() < faults.rate_limit_rate:
+            stats["429" if over_budget else "429_injected"] += 1
+            retry_after = budget.reset_in(now) if over_budget else faults.retry_after
+            headers["retry-after"] = f"{retry_after:.3f}"
+            error = {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}}
+            return headers, web.json_response(error, status=429, headers=headers)
+        budget.requests += 1
+        budget.tokens += tokens
+        stats["200"] += 1
+        return budget.headers(now), None
+
+    async def chat_completions(request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        prompt_tokens = sum(estimate_tokens(str(m.get("content", ""))) for m in body.get("messages", []))
+        completion_tokens = min(estimate_tokens(COMPLETION_TEXT), body.get("max_tokens") or 1000)
+
+        headers, error = admit(request, prompt_tokens + completion_tokens)
+        if error is not None:
+            return error
+
+        await asyncio.sleep(faults.latency())
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = body.get("model", "gpt-4-turbo-preview")
+        content = COMPLETION_TEXT
+        if (body.get("response_format") or {}).get("type") == "json_object":
+            content = json.dumps({"objective": COMPLETION_TEXT, "method": COMPLETION_TEXT, "results": COMPLETION_TEXT})
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+        if not body.get("stream"):
+            return web.json_response(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+                    ],
+                    "usage": usage,
+                },
+                headers=headers,
+            )
+
+        response = web.StreamResponse(headers={**headers, "Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for word in content.split(" "):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        if (body.get("stream_options") or {}).get("include_usage"):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [],
+                "usage": usage,
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def embeddings(request: web.Request) -> web.Response:
+        body = await request.json()
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = body.get("dimensions") or 1536
+        prompt_tokens = sum(estimate_tokens(str(text)) for text in inputs)
+
+        headers, error = admit(request, prompt_tokens)
+        if error is not None:
+            return error
+
+        await asyncio.sleep(faults.latency())
+        data = []
+        for index, text in enumerate(inputs):
+            rng = random.Random(str(text))
+            data.append({"object": "embedding", "index": index, "embedding": [rng.uniform(-1, 1) for _ in range(dimensions)]})
+        return web.json_response(
+            {
+                "object": "list",
+                "data": data,
+                "model": body.get("model", "text-embedding-3-small"),
+                "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+            },
+            headers=headers,
+        )
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(dict(stats))
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_post("/v1/embeddings", embeddings)
+    app.router.add_get("/stats", get_stats)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--rpm", type=int, default=60, help="requests per minute allowed per key")
+    parser.add_argument("--tpm", type=int, default=60000, help="tokens per minute allowed per key")
+    parser.add_argument("--latency", type=float, default=0.2, help="median seconds to wait before answering")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="log-normal sigma of the latency, 0 for fixed")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failed with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests failed with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="retry-after of injected 429s, in seconds")
+    args = parser.parse_args()
+    faults = Faults(
+        latency_median=args.latency,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+    )
+    web.run_app(make_app(args.rpm, args.tpm, faults), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
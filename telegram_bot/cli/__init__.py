@@ -0,0 +1,28 @@
+"""Maintenance commands run next to the bot, sharing its settings and database."""
+
+from telegram_bot import utils
+from telegram_bot.data import config
+from telegram_bot.db.db_api.storages.postgres import PostgresConnection
+
+
+async def connect_db() -> PostgresConnection:
+    """
+    Connect to the bot's PostgreSQL database.
+
+    Args:
+        None
+
+    Returns:
+        PostgresConnection: Connection over a new pool
+    """
+    logger = utils.logging.setup_logger().bind(type="db")
+    db_pool = await utils.connect_to_services.wait_postgres(
+        logger=logger,
+        host=config.POSTGRES_HOST,
+        port=config.POSTGRES_PORT,
+        user=config.POSTGRES_USER,
+        password=config.POSTGRES_PASSWORD,
+        database=config.POSTGRES_DB,
+    )
+    return PostgresConnection(connection_poll=db_pool, logger=logger)
+
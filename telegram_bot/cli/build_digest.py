@@ -0,0 +1,54 @@
+"""
+Build the digest of the papers published in a day or a week and print it.
+
+Papers are read from the database, most upvoted first; map and reduce
+completions are cached in digest_cache, so re-running a failed digest only
+redoes the missing steps:
+
+    build_digest --period weekly --end-date 2024-11-03 --focus "efficient inference"
+"""
+
+import argparse
+import asyncio
+from datetime import date
+from typing import List, Optional
+
+from telegram_bot import utils
+from telegram_bot.cli import connect_db
+from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
+from telegram_bot.data_utils.openai import get_openai_client
+from telegram_bot.data_utils.papers.digest import DIGEST_PERIODS, DigestEngine
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--period", choices=list(DIGEST_PERIODS), default="daily")
+    parser.add_argument("--end-date", type=date.fromisoformat, help="last day of the period (defaults to today)")
+    parser.add_argument("--max-papers", type=int, default=50, help="papers in the digest, most upvoted first")
+    parser.add_argument("--focus", help="topic the digest should focus on")
+    return parser.parse_args(argv)
+
+
+async def build(args: argparse.Namespace) -> None:
+    logger = utils.logging.setup_logger().bind(type="business")
+    db = await connect_db()
+    engine = DigestEngine(get_openai_client(), db=db)
+    digest = await engine.build_digest(
+        HuggingFaceDB(db),
+        period=args.period,
+        end_date=args.end_date,
+        max_papers=args.max_papers,
+        focus=args.focus,
+    )
+    if digest is None:
+        logger.warning("No papers were published in the period", period=args.period, end_date=str(args.end_date))
+        return
+    print(digest)  # noqa: T201
+
+
+def main() -> None:
+    asyncio.run(build(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
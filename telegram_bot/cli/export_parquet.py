@@ -0,0 +1,170 @@
+"""
+Export papers with their summaries to Parquet files partitioned by month.
+
+Rows are streamed from a server-side cursor in publication order and written
+batch by batch, one file per month (``month=YYYY-MM/part-0.parquet``, or
+``month=unknown`` for papers without a date), so memory stays the same
+whatever the size of the corpus:
+
+    export_parquet exports/papers --columns id title published_at upvotes summary_en --compression zstd
+
+Requires pyarrow, which is not installed with the bot; install it with the
+``export`` extra (``poetry install -E export``).
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+from telegram_bot import utils
+from telegram_bot.cli import connect_db
+
+# Exportable columns and the SQL expression they are read with
+EXPORT_COLUMNS: Dict[str, str] = {
+    "id": "p.id",
+    "url": "p.url",
+    "title": "p.title",
+    "authors": "p.authors",
+    "abstract": "p.abstract",
+    "paper_published_at": "p.paper_published_at",
+    "published_at": "p.published_at",
+    "upvotes": "p.upvotes",
+    "num_comments": "p.num_comments",
+    "thumbnail": "p.thumbnail",
+    "media_urls": "p.media_urls",
+    "submitted_by": "p.submitted_by",
+    "created_at": "p.created_at",
+    "summary_en": "s.summary_en",
+    "summary_ru": "s.summary_ru",
+    "summary_fields": "s.summary_fields::TEXT",
+    "summary_created_at": "s.created_at",
+}
+
+
+def arrow_schema(columns: List[str]) -> "pa.Schema":
+    """Arrow schema of the projected columns."""
+    types = {
+        "paper_published_at": pa.timestamp("us"),
+        "published_at": pa.timestamp("us"),
+        "created_at": pa.timestamp("us"),
+        "summary_created_at": pa.timestamp("us"),
+        "upvotes": pa.int32(),
+        "num_comments": pa.int32(),
+    }
+    return pa.schema([(column, types.get(column, pa.string())) for column in columns])
+
+
+class MonthlyParquetWriter:
+    """Writes row batches to one Parquet file per month, keeping a single file open."""
+
+    def __init__(self, output: str, schema: "pa.Schema", compression: str) -> None:
+        self.output = output
+        self.schema = schema
+        self.compression = compression
+        self.month: Optional[str] = None
+        self.writer: Optional["pq.ParquetWriter"] = None
+        self.files = 0
+
+    def write(self, month: str, rows: List[Dict[str, Any]]) -> None:
+        if month != self.month:
+            self.close()
+            directory = os.path.join(self.output, f"month={month}")
+            os.makedirs(directory, exist_ok=True)
+            self.writer = pq.ParquetWriter(
+                os.path.join(directory, "part-0.parquet"),
+                self.schema,
+                compression=self.compression,
+            )
+            self.month = month
+            self.files += 1
+        self.writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=self.schema))
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def build_query(columns: List[str]) -> str:
+    projection = ", ".join(f"{EXPORT_COLUMNS[column]} AS {column}" for column in columns)
+    return f"""
+    SELECT {projection},
+           COALESCE(to_char(p.published_at, 'YYYY-MM'), 'unknown') AS export_month
+    FROM papers p
+    LEFT JOIN paper_summaries s ON s.paper_id = p.id
+    WHERE ($1::DATE IS NULL OR p.published_at >= $1)
+      AND ($2::DATE IS NULL OR p.published_at < $2::DATE + 1)
+    ORDER BY p.published_at NULLS LAST, p.id;
+    """  # noqa: S608
+
+
+async def export(args: argparse.Namespace) -> None:
+    logger = utils.logging.setup_logger().bind(type="business")
+    db = await connect_db()
+    columns = list(dict.fromkeys(args.columns))
+    writer = MonthlyParquetWriter(args.output, arrow_schema(columns), args.compression)
+
+    rows_written = 0
+    started = time.perf_counter()
+    try:
+        sql = build_query(columns)
+        async for batch in db._iterate(sql, (args.since, args.until), batch_size=args.batch_rows):
+            # Rows come in publication order, so each month is a contiguous run
+            start = 0
+            for end in range(1, len(batch) + 1):
+                if end == len(batch) or batch[end]['export_month'] != batch[start]['export_month']:
+                    writer.write(batch[start]['export_month'], batch[start:end])
+                    start = end
+            rows_written += len(batch)
+            logger.debug("Exported rows", rows=rows_written, month=writer.month)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Finished exporting papers",
+        output=args.output,
+        rows=rows_written,
+        files=writer.files,
+        seconds=round(elapsed, 1),
+        rows_per_second=round(rows_written / elapsed) if elapsed else 0,
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", help="directory the month partitions are written to")
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        choices=list(EXPORT_COLUMNS),
+        default=list(EXPORT_COLUMNS),
+        metavar="COLUMN",
+        help=f"columns to export (default: all of {', '.join(EXPORT_COLUMNS)})",
+    )
+    parser.add_argument("--compression", default="zstd", choices=["zstd", "snappy", "gzip", "brotli", "lz4", "none"])
+    parser.add_argument("--since", type=date.fromisoformat, help="first publication day to export (YYYY-MM-DD)")
+    parser.add_argument("--until", type=date.fromisoformat, help="last publication day to export (YYYY-MM-DD)")
+    parser.add_argument("--batch-rows", type=int, default=10000, help="rows fetched from the cursor at once")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = parse_args()
+    if pa is None:
+        raise SystemExit("export_parquet requires pyarrow: poetry install -E export")
+    asyncio.run(export(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Seed papers from local JSONL/NDJSON exports instead of crawling HuggingFace.
+
+Every line holds one daily_papers entry, or a whole day's payload as a JSON
+array; ``.gz`` files are read transparently. Files are streamed in chunks of
+lines, the chunks are parsed in worker processes through the same normalizer
+as the API sync (PaperRecord), and the rows are loaded with COPY in large
+batches. Papers already stored are kept as they are:
+
+    load_jsonl dumps/*.jsonl.gz --processes 8 --batch-size 50000
+
+The byte offset reached in each file is checkpointed after every batch, so an
+interrupted load resumes where it stopped. --restart ignores the checkpoints.
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from telegram_bot import utils
+from telegram_bot.cli import connect_db
+from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB, paper_row
+from telegram_bot.data_utils.huggingface.job_checkpoints import JobCheckpoints
+from telegram_bot.models import PaperRecord
+
+JOB_NAME = "load_jsonl"
+
+
+def parse_lines(lines: List[bytes]) -> Tuple[List[Tuple[Any, ...]], int]:
+    """
+    Normalize a chunk of JSONL lines into papers rows.
+
+    Module-level so it can run in worker processes. Lines that are not valid
+    JSON or not valid daily_papers entries are counted and skipped.
+
+    Args:
+        lines: Raw lines of a dump
+
+    Returns:
+        Tuple[List[Tuple[Any, ...]], int]: Papers rows and number of invalid entries
+    """
+    rows: List[Tuple[Any, ...]] = []
+    invalid = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            decoded = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            invalid += 1
+            continue
+        for entry in decoded if isinstance(decoded, list) else [decoded]:
+            try:
+                rows.append(paper_row(PaperRecord.from_daily_paper(entry)))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                invalid += 1
+    return rows, invalid
+
+
+def open_dump(path: str) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")  # noqa: SIM115
+
+
+def read_chunks(f: IO[bytes], chunk_lines: int) -> Iterator[Tuple[List[bytes], int]]:
+    """Yield chunks of lines with the byte offset reached after each chunk."""
+    offset = f.tell()
+    chunk: List[bytes] = []
+    for line in f:
+        chunk.append(line)
+        offset += len(line)
+        if len(chunk) >= chunk_lines:
+            yield chunk, offset
+            chunk = []
+    if chunk:
+        yield chunk, offset
+
+
+class Progress:
+    """Counters of a load, logged as throughput after every batch."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.lines = 0
+        self.parsed = 0
+        self.invalid = 0
+        self.inserted = 0
+
+    def report(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "lines": self.lines,
+            "parsed": self.parsed,
+            "invalid": self.invalid,
+            "inserted": self.inserted,
+            "seconds": round(elapsed, 1),
+            "papers_per_second": round(self.parsed / elapsed) if elapsed else 0,
+        }
+
+
+class JsonlLoader:
+    """Loads dump files into papers, one COPY batch at a time."""
+
+    def __init__(
+        self,
+        hf_db: HuggingFaceDB,
+        checkpoints: JobCheckpoints,
+        pool: ProcessPoolExecutor,
+        args: argparse.Namespace,
+    ) -> None:
+        self.hf_db = hf_db
+        self.checkpoints = checkpoints
+        self.pool = pool
+        self.args = args
+        self.logger = utils.logging.setup_logger().bind(type="business")
+        self.progress = Progress()
+        self.state: Dict[str, Any] = {"files": {}}
+
+    async def load_file(self, path: str) -> None:
+        key = os.path.abspath(path)
+        size = os.path.getsize(path)
+        checkpoint = self.state["files"].get(key)
+        if checkpoint and checkpoint["size"] != size:
+            self.logger.warning("Dump changed since its checkpoint, loading it again", file=key)
+            checkpoint = None
+        if checkpoint and checkpoint["done"]:
+            self.logger.info("Dump already loaded, skipping", file=key)
+            return
+
+        offset = checkpoint["offset"] if checkpoint else 0
+        self.logger.info("Loading dump", file=key, offset=offset)
+        loop = asyncio.get_running_loop()
+        # Bounded so only a few chunks are held in memory whatever the file size
+        in_flight: Deque[Tuple[asyncio.Future, int, int]] = deque()
+        max_in_flight = 2 * (self.args.processes or os.cpu_count() or 1)
+        batch: List[Tuple[Any, ...]] = []
+
+        async def collect() -> None:
+            nonlocal batch, offset
+            future, lines, chunk_offset = in_flight.popleft()
+            rows, invalid = await future
+            batch.extend(rows)
+            self.progress.lines += lines
+            self.progress.parsed += len(rows)
+            self.progress.invalid += invalid
+            # Chunks are collected in file order, so everything before this offset is in the batch
+            offset = chunk_offset
+            if len(batch) >= self.args.batch_size:
+                await self.flush(key, size, offset, batch)
+                batch = []
+
+        with open_dump(path) as f:
+            f.seek(offset)
+            for chunk, chunk_offset in read_chunks(f, self.args.chunk_lines):
+                future: Future = self.pool.submit(parse_lines, chunk)
+                in_flight.append((asyncio.wrap_future(future, loop=loop), len(chunk), chunk_offset))
+                if len(in_flight) >= max_in_flight:
+                    await collect()
+            while in_flight:
+                await collect()
+
+        await self.flush(key, size, offset, batch, done=True)
+
+    async def flush(
+        self,
+        key: str,
+        size: int,
+        offset: int,
+        batch: List[Tuple[Any, ...]],
+        done: bool = False,
+    ) -> None:
+        self.progress.inserted += await self.hf_db.copy_papers(batch)
+        self.state["files"][key] = {"size": size, "offset": offset, "done": done}
+        await self.checkpoints.save(JOB_NAME, self.state)
+        self.logger.info("Loaded batch", file=key, **self.progress.report())
+
+    async def run(self) -> None:
+        await self.checkpoints.init_table()
+        if self.args.restart:
+            await self.checkpoints.clear(JOB_NAME)
+        self.state = await self.checkpoints.load(JOB_NAME) or {"files": {}}
+
+        for path in self.args.files:
+            await self.load_file(path)
+        self.logger.info("Finished loading dumps", **self.progress.report())
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="JSONL/NDJSON dump files, optionally gzipped")
+    parser.add_argument("--processes", type=int, default=None, help="parsing processes (defaults to the CPU count)")
+    parser.add_argument("--chunk-lines", type=int, default=2000, help="lines parsed per worker task")
+    parser.add_argument("--batch-size", type=int, default=50000, help="papers loaded per COPY")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoints and load every file again")
+    return parser.parse_args(argv)
+
+
+async def load(args: argparse.Namespace) -> None:
+    db = await connect_db()
+    hf_db = HuggingFaceDB(db)
+    await hf_db.init_db()
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        await JsonlLoader(hf_db, JobCheckpoints(db), pool, args).run()
+
+
+def main() -> None:
+    asyncio.run(load(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Re-apply the current paper normalizer to the archived daily_papers payloads.
+
+Reads the archive a few days at a time, decodes the payloads across worker
+processes and merges the resulting rows into papers, without any request
+to HuggingFace:
+
+    reprocess_archive --since 2024-01-01 --processes 8
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import List, Optional
+
+from telegram_bot import utils
+from telegram_bot.cli import connect_db
+from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
+from telegram_bot.data_utils.huggingface.payload_archive import decode_archived_payload
+from telegram_bot.models import PaperRecord
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--since", type=date.fromisoformat, help="first day to reprocess (YYYY-MM-DD)")
+    parser.add_argument("--until", type=date.fromisoformat, help="last day to reprocess (YYYY-MM-DD)")
+    parser.add_argument("--processes", type=int, default=None, help="decoding processes (defaults to the CPU count)")
+    parser.add_argument("--batch-days", type=int, default=16, help="archived days read and merged at once")
+    return parser.parse_args(argv)
+
+
+async def reprocess(args: argparse.Namespace) -> None:
+    logger = utils.logging.setup_logger().bind(type="business")
+    hf_db = HuggingFaceDB(await connect_db())
+    await hf_db.init_db()
+
+    loop = asyncio.get_running_loop()
+    days = papers = merged = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        async for batch in hf_db.archive.iter_batches(args.since, args.until, args.batch_days):
+            decoded = await asyncio.gather(*(
+                loop.run_in_executor(pool, decode_archived_payload, row['codec'], row['payload'])
+                for row in batch
+            ), return_exceptions=True)
+
+            records: List[PaperRecord] = []
+            for row, result in zip(batch, decoded):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to decode archived payload", day=str(row['day']), error=str(result))
+                    continue
+                records.extend(result)
+
+            merged += await hf_db.merge_papers(records)
+            days += len(batch)
+            papers += len(records)
+            logger.info("Reprocessed archived days", until=str(batch[-1]['day']), days=days, papers=papers)
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Finished reprocessing the archive",
+        days=days,
+        papers=papers,
+        merged=merged,
+        seconds=round(elapsed, 1),
+        papers_per_second=round(papers / elapsed) if elapsed else 0,
+    )
+
+
+def main() -> None:
+    asyncio.run(reprocess(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import pathlib
 import subprocess  # noqa: S404
 
 from environs import Env
@@ -14,7 +15,65 @@ env.read_env()
 BOT_TOKEN: str = env.str("BOT_TOKEN")
 BOT_ID: str = BOT_TOKEN.split(":")[0]
 
-OPENAI_API_KEY: str = env.str("OPENAI_API_KEY")
+OPENAI_API_KEY: str = env.str("OPENAI_API_KEY", "")
+# Pool of "key" or "key:organization" entries requests are spread across, overrides OPENAI_API_KEY
+OPENAI_API_KEYS: list[str] = env.list("OPENAI_API_KEYS", [])
+OPENAI_BASE_URL: str | None = env.str("OPENAI_BASE_URL", None)
+# Seconds a rate-limited key is sidelined when the 429 carries no retry hint
+OPENAI_KEY_COOLDOWN: float = env.float("OPENAI_KEY_COOLDOWN", 60.0)
+OPENAI_MODEL: str = env.str("OPENAI_MODEL", "gpt-4-turbo-preview")
+
+# Tokens OpenAI calls may use per UTC day before background summarization is paused (0 disables)
+OPENAI_DAILY_TOKEN_BUDGET: int = env.int("OPENAI_DAILY_TOKEN_BUDGET", 0)
+
+# Maximum tokens of paper text put into a summarization prompt
+SUMMARY_INPUT_TOKEN_BUDGET: int = env.int("SUMMARY_INPUT_TOKEN_BUDGET", 3000)
+
+# Request summaries as JSON objective/method/results fields and store them separately
+STRUCTURED_SUMMARIES: bool = env.bool("STRUCTURED_SUMMARIES", True)
+
+# Summarize in English only and derive other languages by translating that summary
+SUMMARY_TRANSLATE_MODE: bool = env.bool("SUMMARY_TRANSLATE_MODE", False)
+TRANSLATION_MODEL: str = env.str("TRANSLATION_MODEL", "gpt-4o-mini")
+
+# Seconds a replica may hold the lock while summarizing a paper
+SUMMARY_LOCK_TTL: int = env.int("SUMMARY_LOCK_TTL", 30)
+
+# Only enqueue summaries on sync and let the summary scheduler create them by popularity
+LAZY_SUMMARIES: bool = env.bool("LAZY_SUMMARIES", False)
+SUMMARY_WORKERS: int = env.int("SUMMARY_WORKERS", 4)
+
+# Re-summarize papers whose summaries were made with other prompts or another model, at most N per minute
+SUMMARY_BACKFILL: bool = env.bool("SUMMARY_BACKFILL", False)
+SUMMARY_BACKFILL_PER_MINUTE: int = env.int("SUMMARY_BACKFILL_PER_MINUTE", 10)
+
+# Stream missing summaries into the opened article, re-rendering at most once per interval (seconds)
+STREAM_SUMMARIES: bool = env.bool("STREAM_SUMMARIES", True)
+STREAM_EDIT_INTERVAL: float = env.float("STREAM_EDIT_INTERVAL", 1.5)
+
+# Re-fetch the last N days every interval (seconds) to update upvotes and comments (0 disables)
+METRICS_REFRESH_INTERVAL: float = env.float("METRICS_REFRESH_INTERVAL", 1800.0)
+METRICS_REFRESH_DAYS: int = env.int("METRICS_REFRESH_DAYS", 3)
+
+# Ingestion worker: fetch new papers every interval (seconds)
+INGEST_SYNC_INTERVAL: float = env.float("INGEST_SYNC_INTERVAL", 3600.0)
+# Seconds a worker replica leases a job for, renewed while the job runs
+JOB_LEASE_TTL: float = env.float("JOB_LEASE_TTL", 300.0)
+
+# Paper sources, overridable to point ingestion at local stand-ins
+HF_API_BASE_URL: str = env.str("HF_API_BASE_URL", "https://huggingface.co/api")
+JINA_READER_BASE_URL: str = env.str("JINA_READER_BASE_URL", "https://r.jina.ai")
+
+# On-disk cache of daily_papers responses revalidated with ETag/Last-Modified (empty disables)
+HTTP_CACHE_DIR: str = env.str("HTTP_CACHE_DIR", str(pathlib.Path(__file__).parent / "http_cache"))
+HTTP_CACHE_MAX_MB: int = env.int("HTTP_CACHE_MAX_MB", 256)
+
+# Store the full-text markdown of new papers after each sync, fetching N documents at once
+FULLTEXT_PREFETCH: bool = env.bool("FULLTEXT_PREFETCH", False)
+FULLTEXT_PREFETCH_CONCURRENCY: int = env.int("FULLTEXT_PREFETCH_CONCURRENCY", 4)
+
+# NLTK data (stopwords) bundled into the image at build time
+NLTK_DATA_DIR: str = env.str("NLTK_DATA_DIR", str(pathlib.Path(__file__).parent / "nltk_data"))
 
 LOGGING_LEVEL: int = env.int("LOGGING_LEVEL", 10)
 
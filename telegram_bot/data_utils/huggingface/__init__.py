@@ -7,6 +7,7 @@ from typing import Optional
 import logging
 import structlog
 import asyncpg
+from redis.asyncio import Redis
 
 from telegram_bot.data import config
 from telegram_bot.db.db_api.storages.postgres import PostgresConnection
@@ -15,14 +16,20 @@ from telegram_bot.data_utils.huggingface.huggingface_manager import HuggingFaceM
 
 async def get_huggingface_manager(
     db_pool: Optional[asyncpg.Pool] = None,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    redis: Optional[Redis] = None
 ) -> HuggingFaceManager:
     """
     Factory function to create an initialized HuggingFace manager.
 
+    The manager only serves reads and on-demand summaries; fetching papers,
+    refreshing metrics and the summary jobs run in the ingestion worker
+    (telegram_bot.worker).
+
     Args:
         db_pool: Optional existing database pool
         logger: Optional logger instance
+        redis: Optional Redis client for cross-replica summarization locks
 
     Returns:
         HuggingFaceManager: Initialized HuggingFace manager instance
@@ -65,11 +72,11 @@ async def get_huggingface_manager(
         )
 
         # Create and return manager instance
-        manager = HuggingFaceManager(db_connection)
+        manager = HuggingFaceManager(db_connection, redis=redis)
         
         # Initialize database tables
-        await manager.hf_db.init_db()
-        await manager.sync_papers_and_summaries()
+        await manager.init_tables()
+        manager.usage_ledger.start()
 
         return manager
 
@@ -82,9 +89,11 @@ async def get_huggingface_manager(
 # Export necessary classes and functions for convenient imports
 from telegram_bot.data_utils.huggingface.huggingface_manager import HuggingFaceManager
 from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
+from telegram_bot.data_utils.huggingface.huggingface_base import HuggingFaceAPI
 
 __all__ = [
     'get_huggingface_manager',
     'HuggingFaceManager',
-    'HuggingFaceDB'
+    'HuggingFaceDB',
+    'HuggingFaceAPI'
 ]
\ No newline at end of file
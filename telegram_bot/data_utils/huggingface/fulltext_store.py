@@ -0,0 +1,178 @@
+"""Module for storing the full-text markdown of papers."""
+
+import asyncio
+import hashlib
+import logging
+from typing import List, Optional
+
+from telegram_bot.data_utils.huggingface.huggingface_base import HuggingFaceAPI
+from telegram_bot.db.db_api.storages.base import BaseConnection
+from telegram_bot.utils.compression import compress, decompress
+
+
+class FullTextStore:
+    """
+    Persistent, compressed store of paper markdown fetched through the Jina reader.
+
+    Features needing a paper's full text read it from here, and the
+    network is only used for papers not stored yet. Texts are keyed by
+    paper id and carry the SHA-256 of their content, so re-fetching an
+    unchanged document does not rewrite its row. Texts are written with
+    zstd; rows stored with zlib before zstandard was required are still
+    read back through their codec column.
+    """
+
+    def __init__(
+        self,
+        db: BaseConnection,
+        api: HuggingFaceAPI,
+        max_concurrency: int = 4,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize FullTextStore instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+            api: API client the markdown is fetched with
+            max_concurrency: Maximum number of documents fetched at once while prefetching
+            logger: Optional logger instance
+        """
+        self.db = db
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def init_table(self) -> None:
+        """
+        Create paper_fulltext table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS paper_fulltext (
+            paper_id TEXT PRIMARY KEY REFERENCES papers(id),
+            content_hash TEXT NOT NULL,
+            codec TEXT NOT NULL,
+            content BYTEA NOT NULL,
+            raw_size INTEGER NOT NULL,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        ALTER TABLE paper_fulltext ALTER COLUMN content SET STORAGE EXTERNAL;
+        """
+        await self.db._execute(create_table_sql)
+
+    async def get(self, paper_id: str) -> Optional[str]:
+        """
+        Read a stored full text.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            Optional[str]: Markdown of the paper or None if it is not stored
+        """
+        sql = "SELECT codec, content FROM paper_fulltext WHERE paper_id = $1;"
+        result = await self.db._fetchrow(sql, (paper_id,))
+        if not result.data:
+            return None
+        return decompress(result.data['codec'], result.data['content']).decode()
+
+    async def save(self, paper_id: str, text: str) -> None:
+        """
+        Store a full text, leaving the row untouched if the content did not change.
+
+        Args:
+            paper_id: Paper ID
+            text: Markdown of the paper
+
+        Returns:
+            None
+        """
+        sql = """
+        INSERT INTO paper_fulltext (paper_id, content_hash, codec, content, raw_size)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (paper_id) DO UPDATE
+        SET content_hash = EXCLUDED.content_hash,
+            codec = EXCLUDED.codec,
+            content = EXCLUDED.content,
+            raw_size = EXCLUDED.raw_size,
+            fetched_at = CURRENT_TIMESTAMP
+        WHERE paper_fulltext.content_hash <> EXCLUDED.content_hash;
+        """
+        codec, content = compress(text.encode())
+        content_hash = hashlib.sha256(text.encode()).hexdigest()
+        await self.db._execute(sql, (paper_id, content_hash, codec, content, len(text)))
+
+    async def get_or_fetch(self, paper_id: str) -> Optional[str]:
+        """
+        Read a full text, fetching and storing it first if it is not stored yet.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            Optional[str]: Markdown of the paper or None if it is unknown or could not be fetched
+        """
+        text = await self.get(paper_id)
+        if text is not None:
+            return text
+
+        result = await self.db._fetchrow("SELECT url FROM papers WHERE id = $1;", (paper_id,))
+        if not result.data:
+            return None
+        text = await self.api.get_markdown_content(result.data['url'])
+        if text:
+            await self.save(paper_id, text)
+        return text
+
+    async def get_missing(self, limit: int) -> List[str]:
+        """
+        Get the newest papers without a stored full text.
+
+        Args:
+            limit: Maximum number of papers
+
+        Returns:
+            List[str]: Paper IDs, newest first
+        """
+        sql = """
+        SELECT p.id
+        FROM papers p
+        LEFT JOIN paper_fulltext f ON f.paper_id = p.id
+        WHERE f.paper_id IS NULL
+        ORDER BY p.published_at DESC
+        LIMIT $1;
+        """
+        result = await self.db._fetch(sql, (limit,))
+        return [row['id'] for row in result.data]
+
+    async def prefetch_missing(self, limit: int = 200) -> int:
+        """
+        Fetch and store the full texts of the newest papers that have none, a few at a time.
+
+        Args:
+            limit: Maximum number of papers to fetch
+
+        Returns:
+            int: Number of full texts stored
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def prefetch(paper_id: str) -> bool:
+            async with semaphore:
+                try:
+                    return bool(await self.get_or_fetch(paper_id))
+                except Exception as e:
+                    self.logger.error(f"Error prefetching full text of paper {paper_id}: {e}")
+                    return False
+
+        paper_ids = await self.get_missing(limit)
+        stored = sum(await asyncio.gather(*(prefetch(paper_id) for paper_id in paper_ids)))
+        if paper_ids:
+            self.logger.info(f"Prefetched {stored}/{len(paper_ids)} paper full texts")
+        return stored
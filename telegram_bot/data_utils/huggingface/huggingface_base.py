@@ -1,9 +1,15 @@
+import hashlib
 import logging
-import asyncio
 import aiohttp
 import ssl
-from datetime import datetime
-from typing import List, Dict, Optional
+import zlib
+from typing import Any, List, Dict, Optional
+
+from telegram_bot.data import config
+from telegram_bot.data_utils.huggingface.markdown_sections import extract_sections
+from telegram_bot.data_utils.openai.tokens import truncate_to_budget
+from telegram_bot.models import PaperRecord
+from telegram_bot.utils.http_cache import HTTPCache
 
 class HuggingFaceAPI:
     """
@@ -11,13 +17,21 @@ class HuggingFaceAPI:
     """
 
     def __init__(self):
-        self.base_url = "https://huggingface.co/api"
+        self.base_url = config.HF_API_BASE_URL.rstrip("/")
         self.papers_endpoint = f"{self.base_url}/daily_papers"
         self.papers_data: List[Dict[str, str]] = []
         self.logger = logging.getLogger(__name__)
         self.ssl_context = ssl.create_default_context()
         self.ssl_context.check_hostname = False
         self.ssl_context.verify_mode = ssl.CERT_NONE
+        # Daily payloads are revalidated with conditional requests instead of re-downloaded
+        self.http_cache = HTTPCache(
+            config.HTTP_CACHE_DIR,
+            max_bytes=config.HTTP_CACHE_MAX_MB * 2**20,
+            logger=self.logger,
+        ) if config.HTTP_CACHE_DIR else None
+        # SHA-256 of the payload last applied to the database, per date
+        self._applied_payloads: Dict[str, str] = {}
 
     async def get_markdown_content(self, url: str) -> Optional[str]:
         """
@@ -29,7 +43,7 @@ class HuggingFaceAPI:
         Returns:
             Optional[str]: The markdown content of the paper or None if the content is not found.
         """
-        full_url = f"https://r.jina.ai/{url}"
+        full_url = f"{config.JINA_READER_BASE_URL.rstrip('/')}/{url}"
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(full_url, ssl=self.ssl_context) as response:
@@ -56,56 +70,113 @@ class HuggingFaceAPI:
                 self.logger.error(f"Failed to retrieve markdown content for {paper_url}")
                 return None
 
-            # Now, we need to extract the abstract from the markdown content
-            # Let's assume that the abstract is under the '## Abstract' heading
-            abstract = ""
-            lines = markdown_content.split('\n')
-            in_abstract = False
-            for line in lines:
-                if '## Abstract' in line:
-                    in_abstract = True
-                    continue
-                elif line.startswith('## ') and in_abstract:
-                    # Reached the next section
-                    break
-                elif in_abstract:
-                    abstract += line + '\n'
-            if abstract.strip() == "":
-                # If no abstract found, use the entire markdown content as fallback
-                abstract = markdown_content
+            abstract = extract_sections(markdown_content, ["abstract"]).get("abstract", "")
+            if abstract == "":
+                # If no abstract found, fall back to the head of the document within the token budget
+                abstract = truncate_to_budget(
+                    markdown_content,
+                    config.SUMMARY_INPUT_TOKEN_BUDGET,
+                    config.OPENAI_MODEL,
+                )
             return abstract.strip()
         except Exception as e:
             self.logger.error(f"An error occurred while processing the paper content from {paper_url}: {e}")
             return None
 
-    async def fetch_papers_for_date(self, date_str: str) -> List[Dict[str, str]]:
+    async def fetch_daily_payload(self, date_str: str, skip_unchanged: bool = False) -> Optional[bytes]:
         """
-        Asynchronously fetches papers for a specific date from the Hugging Face API.
-        
+        Asynchronously fetches the raw daily_papers payload of a specific date.
+
+        With the HTTP cache enabled, a day fetched before is requested
+        conditionally and a 304 answer is served from the cache. When
+        ``skip_unchanged`` is set, a 304 is skipped instead, but only if the
+        cached payload was marked applied with ``mark_payload_applied``, so a
+        payload whose processing failed is processed again.
+
         Args:
             date_str (str): Date in YYYY-MM-DD format (e.g., "2024-10-31")
-        
+            skip_unchanged (bool): Return None if the payload did not change since it was last applied
+
         Returns:
-            List[Dict[str, str]]: List of processed papers data
+            Optional[bytes]: JSON payload, or None if it could not be fetched or was skipped as unchanged
         """
         try:
             url = f"{self.papers_endpoint}?date={date_str}"
+            cached = self.http_cache.get(url) if self.http_cache else None
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, ssl=self.ssl_context) as response:
-                    response.raise_for_status()
-                    raw_data = await response.json()
-                
-                tasks = []
-                for paper_data in raw_data:
-                    tasks.append(self.process_paper(session, paper_data))
-                
-                papers_data = await asyncio.gather(*tasks)
-            
-            self.logger.info(f"Successfully fetched and processed {len(papers_data)} papers for date {date_str}")
-            return papers_data
+                while True:
+                    headers = cached.conditional_headers() if cached else {}
+                    async with session.get(url, ssl=self.ssl_context, headers=headers) as response:
+                        if response.status == 304 and cached:
+                            try:
+                                body = self.http_cache.read(cached)
+                            except (OSError, zlib.error) as e:
+                                # Drop the corrupt entry and request the payload again, unconditionally
+                                self.logger.warning(f"Dropping corrupt cached papers for date {date_str}: {e}")
+                                self.http_cache.discard(cached)
+                                cached = None
+                                continue
+                            if skip_unchanged and self._applied_payloads.get(date_str) == hashlib.sha256(body).hexdigest():
+                                self.logger.info(f"Papers for date {date_str} unchanged since last applied")
+                                return None
+                            return body
+                        response.raise_for_status()
+                        body = await response.read()
+                        break
+            if self.http_cache:
+                self.http_cache.store(
+                    url,
+                    body,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            return body
         except aiohttp.ClientError as e:
             self.logger.error(f"Error fetching papers for date {date_str}: {e}")
+            return None
+
+    def mark_payload_applied(self, date_str: str, body: bytes) -> None:
+        """
+        Remember that a payload was fully applied, so an unchanged copy of it can be skipped.
+
+        Args:
+            date_str (str): Date in YYYY-MM-DD format
+            body (bytes): JSON payload
+
+        Returns:
+            None
+        """
+        self._applied_payloads[date_str] = hashlib.sha256(body).hexdigest()
+
+    def parse_daily_payload(self, body: bytes) -> List[PaperRecord]:
+        """
+        Normalize a raw daily_papers payload into paper records.
+
+        Args:
+            body (bytes): JSON payload
+
+        Returns:
+            List[PaperRecord]: List of processed papers data
+        """
+        return PaperRecord.decode_daily_papers(body)
+
+    async def fetch_papers_for_date(self, date_str: str, skip_unchanged: bool = False) -> List[PaperRecord]:
+        """
+        Asynchronously fetches papers for a specific date from the Hugging Face API.
+        
+        Args:
+            date_str (str): Date in YYYY-MM-DD format (e.g., "2024-10-31")
+            skip_unchanged (bool): Return no papers if the payload did not change since it was cached
+        
+        Returns:
+            List[PaperRecord]: List of processed papers data
+        """
+        body = await self.fetch_daily_payload(date_str, skip_unchanged=skip_unchanged)
+        if body is None:
             return []
+        papers_data = self.parse_daily_payload(body)
+        self.logger.info(f"Successfully fetched and processed {len(papers_data)} papers for date {date_str}")
+        return papers_data
 
     async def fetch_daily_papers(self) -> None:
         """
@@ -115,37 +186,18 @@ class HuggingFaceAPI:
         today = datetime.now().strftime("%Y-%m-%d")
         await self.fetch_papers_for_date(today)
 
-    async def process_paper(self, session: aiohttp.ClientSession, paper_data: Dict) -> Dict[str, str]:
+    def process_paper(self, paper_data: Dict[str, Any]) -> PaperRecord:
         """
         Processes a single paper by extracting relevant information.
 
         Args:
-            session (aiohttp.ClientSession): The aiohttp session to use for requests
             paper_data (Dict): The raw paper data from the API
 
         Returns:
-            Dict[str, str]: A dictionary containing the paper's URL, title, authors, abstract, and other relevant information
+            PaperRecord: The paper's URL, title, authors, abstract and other relevant information,
+                with native int and datetime fields
         """
-        paper_id = paper_data['paper']['id']
-        paper_url = f"https://arxiv.org/pdf/{paper_id}"
-        
-        # Extract authors
-        authors = ", ".join([author['name'] for author in paper_data['paper']['authors'] if not author.get('hidden', False)])
-
-        return {
-            'id': paper_id,
-            'url': paper_url,
-            'title': paper_data['paper']['title'],
-            'authors': authors,
-            'abstract': paper_data['paper']['summary'],
-            'paper_published_at': datetime.strptime(paper_data['paper']['publishedAt'], "%Y-%m-%dT%H:%M:%S.%fZ"),
-            'published_at': datetime.strptime(paper_data['publishedAt'], "%Y-%m-%dT%H:%M:%S.%fZ"),
-            'upvotes': str(paper_data['paper']['upvotes']),
-            'num_comments': str(paper_data.get('numComments', 0)),
-            'thumbnail': paper_data.get('thumbnail', ''),
-            'media_urls': ", ".join(paper_data.get('mediaUrls', [])),
-            'submitted_by': paper_data['submittedBy']['fullname']
-        }
+        return PaperRecord.from_daily_paper(paper_data)
 
     async def get_paper_abstract(self, session: aiohttp.ClientSession, paper_id: str) -> Optional[str]:
         """
@@ -1,12 +1,49 @@
 """Module for handling HuggingFace papers data storage in PostgreSQL database."""
 
+import hashlib
 from datetime import datetime, timedelta, date, timezone
-from typing import Optional, List, Dict, Union
+from typing import Any, Optional, List, Dict, Tuple, Union
 
 from telegram_bot.data_utils.huggingface.huggingface_base import HuggingFaceAPI
+from telegram_bot.data_utils.huggingface.payload_archive import PayloadArchive
 from telegram_bot.db.db_api.storages.base import BaseConnection
+from telegram_bot.models import PaperRecord
 
 
+# Columns filled from a PaperRecord row followed by its metrics hash
+PAPER_COLUMNS = [
+    "id", "url", "title", "authors", "abstract", "paper_published_at", "published_at",
+    "upvotes", "num_comments", "thumbnail", "media_urls", "submitted_by", "metrics_hash",
+]
+
+
+def metrics_hash(upvotes: Union[int, str], num_comments: Union[int, str]) -> str:
+    """
+    Hash the mutable metrics of a paper, so changed rows can be found without comparing every column.
+
+    Args:
+        upvotes: Number of upvotes
+        num_comments: Number of comments
+
+    Returns:
+        str: Hex digest of the metrics
+    """
+    return hashlib.md5(f"{int(upvotes)}:{int(num_comments)}".encode()).hexdigest()  # noqa: S324
+
+
+
+def paper_row(paper: PaperRecord) -> Tuple[Any, ...]:
+    """
+    Build the papers row of a record, in PAPER_COLUMNS order.
+
+    Args:
+        paper: Paper record
+
+    Returns:
+        Tuple[Any, ...]: Column values
+    """
+    return (*paper.as_row(), metrics_hash(paper.upvotes, paper.num_comments))
+
 class HuggingFaceDB(HuggingFaceAPI):
     """Class for managing HuggingFace papers data in PostgreSQL database."""
 
@@ -19,6 +56,7 @@ class HuggingFaceDB(HuggingFaceAPI):
         """
         super().__init__()
         self.db = db
+        self.archive = PayloadArchive(db)
 
     async def init_db(self) -> None:
         """
@@ -44,10 +82,18 @@ class HuggingFaceDB(HuggingFaceAPI):
             thumbnail TEXT,
             media_urls TEXT,
             submitted_by TEXT,
+            metrics_hash TEXT,
+            metrics_updated_at TIMESTAMP,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """
         await self.db._execute(create_table_sql)
+        await self.db._execute("""
+        ALTER TABLE papers
+            ADD COLUMN IF NOT EXISTS metrics_hash TEXT,
+            ADD COLUMN IF NOT EXISTS metrics_updated_at TIMESTAMP;
+        """)
+        await self.archive.init_table()
 
     async def get_last_paper_date(self) -> Optional[datetime]:
         """
@@ -70,12 +116,15 @@ class HuggingFaceDB(HuggingFaceAPI):
             return result.data['published_at']
         return None
 
-    async def save_papers(self, papers: List[Dict]) -> None:
+    async def save_papers(self, papers: List[PaperRecord]) -> None:
         """
         Save papers to database.
 
+        All papers are inserted in one executemany batch; if the batch fails,
+        they are retried one by one so a single bad row does not drop the rest.
+
         Args:
-            papers: List of paper dictionaries containing paper details
+            papers: List of paper records
 
         Returns:
             None
@@ -87,31 +136,24 @@ class HuggingFaceDB(HuggingFaceAPI):
         INSERT INTO papers (
             id, url, title, authors, abstract, paper_published_at, published_at,
             upvotes, num_comments, thumbnail, media_urls, 
-            submitted_by
+            submitted_by, metrics_hash
         ) 
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
         ON CONFLICT (id) DO NOTHING;
         """
 
-        for paper in papers:
+        rows = [paper_row(paper) for paper in papers]
+        try:
+            await self.db._execute(insert_sql, rows)
+            return
+        except Exception as e:
+            self.logger.error(f"Error saving a batch of {len(rows)} papers, saving them one by one: {e}")
+
+        for paper, row in zip(papers, rows):
             try:
-                params = (
-                    paper['id'],
-                    paper['url'],
-                    paper['title'],
-                    paper['authors'],
-                    paper['abstract'],
-                    paper['paper_published_at'],
-                    paper['published_at'],
-                    int(paper['upvotes']),
-                    int(paper['num_comments']),
-                    paper['thumbnail'],
-                    paper['media_urls'],
-                    paper['submitted_by']
-                )
-                await self.db._execute(insert_sql, params)
+                await self.db._execute(insert_sql, row)
             except Exception as e:
-                self.logger.error(f"Error saving paper {paper['id']}: {e}")
+                self.logger.error(f"Error saving paper {paper.id}: {e}")
                 continue
 
     async def sync_papers(self) -> None:
@@ -146,14 +188,208 @@ class HuggingFaceDB(HuggingFaceAPI):
         total_papers = 0
         while start_date <= today:
             date_str = start_date.strftime("%Y-%m-%d")
-            papers = await self.fetch_papers_for_date(date_str)  # Get papers from API
+            body = await self.fetch_daily_payload(date_str)  # Get papers from API
+            papers = await self._archive_and_parse(start_date.date(), body)
             if papers:  # Only try to save if we got papers
                 await self.save_papers(papers)  # Save to database
+                # Known papers keep their row, apply and record the metrics of this payload
+                await self.update_paper_metrics(papers)
                 total_papers += len(papers)
+            if body is not None:
+                self.mark_payload_applied(date_str, body)
             start_date += timedelta(days=1)
         
         self.logger.info(f"Synced total of {total_papers} papers to database")
 
+    async def _archive_and_parse(self, day: date, body: Optional[bytes]) -> List[PaperRecord]:
+        """
+        Archive a fetched daily_papers payload and parse it.
+
+        A failed archive write is logged and does not stop the sync.
+
+        Args:
+            day: Date of the payload
+            body: Raw payload or None if nothing was fetched
+
+        Returns:
+            List[PaperRecord]: Parsed papers
+        """
+        if body is None:
+            return []
+        try:
+            await self.archive.save(day, body)
+        except Exception as e:
+            self.logger.error(f"Error archiving daily papers of {day}: {e}")
+        return self.parse_daily_payload(body)
+
+    async def copy_papers(self, rows: List[Tuple[Any, ...]]) -> int:
+        """
+        Bulk-load paper rows with COPY, keeping papers that are already stored.
+
+        COPY cannot skip conflicting rows, so the rows are copied into a
+        temporary table first and moved into papers with one INSERT ... SELECT,
+        all in a single transaction.
+
+        Args:
+            rows: Rows in PAPER_COLUMNS order
+
+        Returns:
+            int: Number of papers inserted
+        """
+        if not rows:
+            return 0
+
+        columns = ", ".join(PAPER_COLUMNS)
+        insert_sql = f"""
+        WITH inserted AS (
+            INSERT INTO papers ({columns})
+            SELECT {columns} FROM papers_load
+            ON CONFLICT (id) DO NOTHING
+            RETURNING 1
+        )
+        SELECT COUNT(*) AS count FROM inserted;
+        """  # noqa: S608
+        async with self.db._transaction() as con:
+            await self.db._execute(
+                "CREATE TEMP TABLE papers_load (LIKE papers INCLUDING DEFAULTS) ON COMMIT DROP;",
+                con=con,
+            )
+            await self.db._copy_records("papers_load", rows, PAPER_COLUMNS, con=con)
+            result = await self.db._fetchrow(insert_sql, con=con)
+        return result.data['count']
+
+    async def merge_papers(self, papers: List[PaperRecord]) -> int:
+        """
+        Insert papers or overwrite the stored ones with these values.
+
+        Used to re-apply the normalizer to archived payloads: every column is
+        sent as an array in one statement, and rows whose values did not
+        change are skipped by the WHERE clause and not rewritten.
+
+        Args:
+            papers: Paper records, a later record of the same paper wins
+
+        Returns:
+            int: Number of papers inserted or changed
+        """
+        if not papers:
+            return 0
+
+        sql = """
+        INSERT INTO papers (
+            id, url, title, authors, abstract, paper_published_at, published_at,
+            upvotes, num_comments, thumbnail, media_urls,
+            submitted_by, metrics_hash
+        )
+        SELECT * FROM unnest(
+            $1::TEXT[], $2::TEXT[], $3::TEXT[], $4::TEXT[], $5::TEXT[], $6::TIMESTAMP[], $7::TIMESTAMP[],
+            $8::INTEGER[], $9::INTEGER[], $10::TEXT[], $11::TEXT[], $12::TEXT[], $13::TEXT[]
+        )
+        ON CONFLICT (id) DO UPDATE
+        SET url = EXCLUDED.url,
+            title = EXCLUDED.title,
+            authors = EXCLUDED.authors,
+            abstract = EXCLUDED.abstract,
+            paper_published_at = EXCLUDED.paper_published_at,
+            published_at = EXCLUDED.published_at,
+            upvotes = EXCLUDED.upvotes,
+            num_comments = EXCLUDED.num_comments,
+            thumbnail = EXCLUDED.thumbnail,
+            media_urls = EXCLUDED.media_urls,
+            submitted_by = EXCLUDED.submitted_by,
+            metrics_hash = EXCLUDED.metrics_hash
+        WHERE (
+            papers.url, papers.title, papers.authors, papers.abstract, papers.paper_published_at,
+            papers.published_at, papers.upvotes, papers.num_comments, papers.thumbnail,
+            papers.media_urls, papers.submitted_by
+        ) IS DISTINCT FROM (
+            EXCLUDED.url, EXCLUDED.title, EXCLUDED.authors, EXCLUDED.abstract, EXCLUDED.paper_published_at,
+            EXCLUDED.published_at, EXCLUDED.upvotes, EXCLUDED.num_comments, EXCLUDED.thumbnail,
+            EXCLUDED.media_urls, EXCLUDED.submitted_by
+        )
+        RETURNING id;
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement
+        unique = {paper.id: paper for paper in papers}
+        rows = [paper_row(paper) for paper in unique.values()]
+        columns = [list(column) for column in zip(*rows)]
+        result = await self.db._fetch(sql, tuple(columns))
+        return len(result.data)
+
+    async def update_paper_metrics(self, papers: List[PaperRecord]) -> List[Dict]:
+        """
+        Update upvotes and comments of known papers whose metrics changed.
+
+        All papers are sent in one statement as arrays; rows with an unchanged
+        metrics hash are skipped by the WHERE clause and not rewritten. The new
+        values are appended to paper_metrics by the same statement, so the hash
+        only advances once the time series point is stored.
+
+        Args:
+            papers: Freshly fetched paper records
+
+        Returns:
+            List[Dict]: Updated papers with id, upvotes and num_comments
+        """
+        if not papers:
+            return []
+
+        sql = """
+        WITH updated AS (
+            UPDATE papers p
+            SET upvotes = u.upvotes,
+                num_comments = u.num_comments,
+                metrics_hash = u.metrics_hash,
+                metrics_updated_at = CURRENT_TIMESTAMP
+            FROM unnest($1::TEXT[], $2::INTEGER[], $3::INTEGER[], $4::TEXT[])
+                AS u(id, upvotes, num_comments, metrics_hash)
+            WHERE p.id = u.id
+              AND p.metrics_hash IS DISTINCT FROM u.metrics_hash
+            RETURNING p.id, p.upvotes, p.num_comments
+        ),
+        recorded AS (
+            INSERT INTO paper_metrics (paper_id, observed_at, upvotes, num_comments)
+            SELECT id, (NOW() AT TIME ZONE 'UTC'), COALESCE(upvotes, 0), COALESCE(num_comments, 0)
+            FROM updated
+        )
+        SELECT id, upvotes, num_comments FROM updated;
+        """
+        ids, upvotes, comments, hashes = [], [], [], []
+        for paper in papers:
+            ids.append(paper.id)
+            upvotes.append(paper.upvotes)
+            comments.append(paper.num_comments)
+            hashes.append(metrics_hash(paper.upvotes, paper.num_comments))
+        result = await self.db._fetch(sql, (ids, upvotes, comments, hashes))
+        return result.data
+
+    async def refresh_recent_metrics(self, days: int) -> List[Dict]:
+        """
+        Re-fetch the last days from the API and update the metrics that changed.
+
+        Only papers already in the database are touched, new ones are left to sync_papers.
+
+        Args:
+            days: Number of days to revisit, today included
+
+        Returns:
+            List[Dict]: Updated papers with id, upvotes and num_comments
+        """
+        today = datetime.now()
+        updated: List[Dict] = []
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            date_str = day.strftime("%Y-%m-%d")
+            # A payload unchanged since it was last applied cannot carry new metrics
+            body = await self.fetch_daily_payload(date_str, skip_unchanged=True)
+            papers = await self._archive_and_parse(day.date(), body)
+            updated.extend(await self.update_paper_metrics(papers))
+            if body is not None:
+                self.mark_payload_applied(date_str, body)
+
+        self.logger.info(f"Refreshed metrics of the last {days} days, {len(updated)} papers changed")
+        return updated
+
     async def get_papers_by_date(self, date_str: str) -> List[Dict]:
         """
         Get papers for specific date from database.
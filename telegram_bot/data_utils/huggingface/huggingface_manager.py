@@ -2,24 +2,95 @@
 import asyncio
 
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple, Union
+from typing import Callable, Optional, List, Dict, Tuple, Union
 
+from redis.asyncio import Redis
+
+from telegram_bot.data import config
+from telegram_bot.data_utils.huggingface.fulltext_store import FullTextStore
 from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
-from telegram_bot.data_utils.openai import get_openai_client, Language, OpenAIError
+from telegram_bot.data_utils.huggingface.job_checkpoints import JobCheckpoints
+from telegram_bot.data_utils.huggingface.metrics_refresh import MetricsRefresh
+from telegram_bot.data_utils.huggingface.paper_metrics import PaperMetrics
+from telegram_bot.data_utils.huggingface.summary_backfill import SummaryBackfill
+from telegram_bot.data_utils.huggingface.summary_scheduler import SummaryQueue, SummaryScheduler
+from telegram_bot.data_utils.huggingface.trending import LEADERBOARD_PERIODS, TrendingRanker
+from telegram_bot.data_utils.openai import (
+    CompletionResult,
+    DailyTokenBudget,
+    get_openai_client,
+    Language,
+    OpenAIError,
+    UsageLedger,
+    background_usage,
+    summary_prompt_version,
+)
+from telegram_bot.models import SummaryFields
+from telegram_bot.utils.single_flight import SingleFlight
 
 
 class HuggingFaceManager:
     """Class for managing HuggingFace papers and their summaries."""
 
-    def __init__(self, db_connection) -> None:
+    def __init__(self, db_connection, redis: Optional[Redis] = None) -> None:
         """
         Initialize HuggingFace manager.
 
         Args:
             db_connection: Database connection instance
+            redis: Optional Redis client used to deduplicate summarization across replicas
         """
         self.hf_db = HuggingFaceDB(db_connection)
-        self.openai_client = get_openai_client()
+        self.usage_ledger = UsageLedger(db_connection, logger=self.hf_db.logger)
+        self.openai_client = get_openai_client(
+            usage_ledger=self.usage_ledger,
+            token_budget=DailyTokenBudget(
+                self.usage_ledger,
+                config.OPENAI_DAILY_TOKEN_BUDGET,
+                logger=self.hf_db.logger,
+            ) if config.OPENAI_DAILY_TOKEN_BUDGET else None,
+        )
+        # Stamped on every summary (see summary_version_for), summaries stamped differently are recreated by the backfill job
+        self.summary_version = {
+            "prompt_version": summary_prompt_version(self.openai_client.structured_output),
+            "model": self.openai_client.model,
+        }
+        self.summary_flight: SingleFlight[str] = SingleFlight(
+            redis=redis,
+            lock_ttl=config.SUMMARY_LOCK_TTL,
+            key_prefix="summary_lock",
+            logger=self.hf_db.logger,
+        )
+        self.summary_queue = SummaryQueue(db_connection)
+        self.summary_scheduler = SummaryScheduler(
+            self,
+            self.summary_queue,
+            workers=config.SUMMARY_WORKERS,
+            logger=self.hf_db.logger,
+        )
+        self.summary_backfill = SummaryBackfill(
+            self,
+            JobCheckpoints(db_connection),
+            papers_per_minute=config.SUMMARY_BACKFILL_PER_MINUTE,
+            logger=self.hf_db.logger,
+        )
+        self.fulltext = FullTextStore(
+            db_connection,
+            self.hf_db,
+            max_concurrency=config.FULLTEXT_PREFETCH_CONCURRENCY,
+            logger=self.hf_db.logger,
+        )
+        self._fulltext_prefetch: Optional[asyncio.Task] = None
+        self.paper_metrics = PaperMetrics(db_connection)
+        self.trending = TrendingRanker(db_connection, self.paper_metrics, logger=self.hf_db.logger)
+        self.metrics_refresh = MetricsRefresh(
+            self.hf_db,
+            self.paper_metrics,
+            ranker=self.trending,
+            window_days=config.METRICS_REFRESH_DAYS,
+            interval=config.METRICS_REFRESH_INTERVAL,
+            logger=self.hf_db.logger,
+        )
 
     async def init_summaries_table(self) -> None:
         """
@@ -36,40 +107,79 @@ class HuggingFaceManager:
             paper_id TEXT PRIMARY KEY,
             summary_en TEXT,
             summary_ru TEXT,
+            usage JSONB,
+            summary_fields JSONB,
+            versions JSONB,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (paper_id) REFERENCES papers (id)
         );
+        ALTER TABLE paper_summaries ADD COLUMN IF NOT EXISTS usage JSONB;
+        ALTER TABLE paper_summaries ADD COLUMN IF NOT EXISTS summary_fields JSONB;
+        ALTER TABLE paper_summaries ADD COLUMN IF NOT EXISTS versions JSONB;
         """
         await self.hf_db.db._execute(create_table_sql)
+        await self.summary_queue.init_table()
+        await self.usage_ledger.init_table()
 
     async def save_summary(
         self,
         paper_id: str,
-        summaries: Dict[Language, str]
+        summaries: Dict[Language, str],
+        usage: Optional[Dict[Language, CompletionResult]] = None,
+        fields: Optional[Dict[Language, SummaryFields]] = None
     ) -> None:
         """
-        Save paper summaries to database.
+        Save paper summaries to database, stamping them with the prompt version and model that made them.
 
         Args:
             paper_id: Paper ID
             summaries: Dictionary with summaries in different languages
+            usage: Optional per-language token usage and latency of the calls that produced them
+            fields: Optional per-language structured summary fields
 
         Returns:
             None
         """
         insert_sql = """
-        INSERT INTO paper_summaries (paper_id, summary_en, summary_ru)
-        VALUES ($1, $2, $3)
+        INSERT INTO paper_summaries (paper_id, summary_en, summary_ru, usage, summary_fields, versions)
+        VALUES ($1, $2, $3, $4, $5, $6)
         ON CONFLICT (paper_id) DO UPDATE 
-        SET summary_en = $2, summary_ru = $3;
+        SET summary_en = COALESCE($2, paper_summaries.summary_en),
+            summary_ru = COALESCE($3, paper_summaries.summary_ru),
+            usage = COALESCE(paper_summaries.usage, '{}'::jsonb) || COALESCE($4, '{}'::jsonb),
+            summary_fields = COALESCE(paper_summaries.summary_fields, '{}'::jsonb) || COALESCE($5, '{}'::jsonb),
+            versions = COALESCE(paper_summaries.versions, '{}'::jsonb) || COALESCE($6, '{}'::jsonb);
         """
         params = (
             paper_id,
             summaries.get(Language.EN),
-            summaries.get(Language.RU)
+            summaries.get(Language.RU),
+            {lang.code: result.to_dict() for lang, result in (usage or {}).items()},
+            {lang.code: summary_fields.model_dump() for lang, summary_fields in (fields or {}).items()},
+            {lang.code: self.summary_version_for(lang) for lang, summary in summaries.items() if summary is not None}
         )
         await self.hf_db.db._execute(insert_sql, params)
 
+    def summary_version_for(self, language: Language) -> Dict[str, str]:
+        """
+        Get the version stamp of a summary created now in a language.
+
+        In translate mode the non-English summaries are made by the translation model,
+        so their prompt version also covers the translation prompts.
+
+        Args:
+            language: Summary language
+
+        Returns:
+            Dict[str, str]: Prompt version and model
+        """
+        if config.SUMMARY_TRANSLATE_MODE and language != Language.EN:
+            return {
+                "prompt_version": summary_prompt_version(self.openai_client.structured_output, translated=True),
+                "model": config.TRANSLATION_MODEL,
+            }
+        return self.summary_version
+
     async def get_paper_summary(self, paper_id: str) -> Optional[Dict[Language, str]]:
         """
         Get paper summaries from database.
@@ -93,10 +203,59 @@ class HuggingFaceManager:
             }
         return None
 
+    async def get_summary_fields(self, paper_id: str, language: Language) -> Optional[SummaryFields]:
+        """
+        Get the structured summary fields of a paper in one language.
+
+        Args:
+            paper_id: Paper ID
+            language: Summary language
+
+        Returns:
+            Optional[SummaryFields]: Stored fields or None if the summary is not structured
+        """
+        sql = """
+        SELECT summary_fields -> $2 AS fields
+        FROM paper_summaries
+        WHERE paper_id = $1;
+        """
+        result = await self.hf_db.db._fetchrow(sql, (paper_id, language.code))
+        if result.data and result.data['fields']:
+            return SummaryFields(**result.data['fields'])
+        return None
+
+    def _split_structured(
+        self,
+        contents: Dict[Language, str]
+    ) -> Tuple[Dict[Language, str], Dict[Language, SummaryFields]]:
+        """
+        Turn structured completions into rendered summaries and their fields.
+
+        Completions that are not valid summary JSON are kept as free text.
+
+        Args:
+            contents: Completion contents by language
+
+        Returns:
+            Tuple[Dict[Language, str], Dict[Language, SummaryFields]]: Rendered
+            summaries and the fields of those that parsed
+        """
+        summaries: Dict[Language, str] = {}
+        fields: Dict[Language, SummaryFields] = {}
+        for lang, content in contents.items():
+            parsed = SummaryFields.from_json(content) if self.openai_client.structured_output else None
+            if parsed is None:
+                summaries[lang] = content
+            else:
+                summaries[lang] = parsed.render()
+                fields[lang] = parsed
+        return summaries, fields
+
     async def create_summaries_for_paper(
         self,
         paper_id: str,
-        abstract: str
+        abstract: str,
+        languages: Optional[List[Language]] = None
     ) -> Dict[Language, str]:
         """
         Create summaries for a paper using OpenAI.
@@ -104,21 +263,256 @@ class HuggingFaceManager:
         Args:
             paper_id: Paper ID
             abstract: Paper abstract
+            languages: Languages to summarize in (defaults to all supported)
 
         Returns:
             Dict[Language, str]: Dictionary with summaries
         """
+        languages = languages or list(Language)
         try:
-            summaries = await self.openai_client.summarize_paper(abstract)
-            await self.save_summary(paper_id, summaries)
+            if config.SUMMARY_TRANSLATE_MODE:
+                contents, results = await self._summarize_via_translation(paper_id, abstract, languages)
+            else:
+                results = await self.openai_client.summarize_paper_with_usage(abstract, languages=languages)
+                contents = {lang: result.content for lang, result in results.items()}
+            summaries, fields = self._split_structured(contents)
+            await self.save_summary(paper_id, summaries, usage=results, fields=fields)
+            if Language.EN in languages and Language.EN not in summaries:
+                # Translated from the stored English summary, which was not regenerated here
+                summaries[Language.EN] = await self._get_stored_summary(paper_id, Language.EN)
             return summaries
         except OpenAIError as e:
             self.hf_db.logger.error(f"Error creating summaries for paper {paper_id}: {e}")
             raise
 
-    async def sync_papers_and_summaries(self) -> None:
+    async def _summarize_via_translation(
+        self,
+        paper_id: str,
+        abstract: str,
+        languages: List[Language]
+    ) -> Tuple[Dict[Language, str], Dict[Language, CompletionResult]]:
         """
-        Sync papers and create summaries for new papers.
+        Summarize a paper in English and translate that summary into the other languages.
+
+        The English summary is reused when it is already stored, so each extra
+        language only costs a short translation with the cheaper translation model.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+            languages: Languages to produce
+
+        Returns:
+            Tuple[Dict[Language, str], Dict[Language, CompletionResult]]: Completion
+            contents and results of the calls made here. The English summary is
+            only included if it was generated here, a stored one is left as it
+            is with its version stamp
+        """
+        source = Language.EN
+        targets = [lang for lang in languages if lang != source]
+        if not targets:
+            results = await self.openai_client.summarize_paper_with_usage(abstract, languages=[source])
+            return {source: results[source].content}, results
+
+        source_summary, structured = await self._get_translation_source(paper_id, abstract)
+        translations = await asyncio.gather(*(
+            self.openai_client.translate_summary(
+                source_summary,
+                source,
+                target,
+                model=config.TRANSLATION_MODEL,
+                abstract=abstract,
+                structured=structured,
+            )
+            for target in targets
+        ))
+        results = dict(zip(targets, translations))
+        contents = {lang: result.content for lang, result in results.items()}
+        return contents, results
+
+    async def _get_translation_source(self, paper_id: str, abstract: str) -> Tuple[str, bool]:
+        """
+        Get the English summary that other languages are translated from.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+
+        Returns:
+            Tuple[str, bool]: The summary fields as JSON if they are stored, otherwise
+            the summary text, and whether the JSON form is returned
+        """
+        summary = await self.get_or_create_summary(paper_id, abstract, Language.EN)
+        fields = await self.get_summary_fields(paper_id, Language.EN)
+        if fields is not None:
+            return fields.model_dump_json(), True
+        return summary, False
+
+    async def get_or_create_summary(
+        self,
+        paper_id: str,
+        abstract: str,
+        language: Language,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Get a paper summary, creating it if missing.
+
+        Concurrent requests for the same paper and language, in this process or
+        on other replicas sharing Redis, are coalesced into a single OpenAI call
+        and all callers receive its result.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+            language: Summary language
+            on_progress: Optional callback receiving the partial summary as it is
+                streamed; only called if this caller ends up running the request
+
+        Returns:
+            str: Summary in the requested language
+        """
+        cached = await self._get_stored_summary(paper_id, language)
+        if cached:
+            self.usage_ledger.record_cache_hit(self.openai_client.model, "summary")
+            return cached
+
+        async def create() -> str:
+            # Another replica may have finished right before we took the lock.
+            stored = await self._get_stored_summary(paper_id, language)
+            if stored:
+                return stored
+            if on_progress is not None:
+                return await self.stream_summary_for_paper(paper_id, abstract, language, on_progress)
+            summaries = await self.create_summaries_for_paper(paper_id, abstract, [language])
+            return summaries[language]
+
+        return await self.summary_flight.do(
+            self._summary_key(paper_id, language),
+            create,
+            wait_for_remote=lambda: self._get_stored_summary(paper_id, language),
+        )
+
+    async def recreate_summary(self, paper_id: str, abstract: str, language: Language) -> str:
+        """
+        Replace a paper summary in one language, even if one is stored.
+
+        Runs under the same single-flight key as get_or_create_summary, so it
+        never races a user-triggered creation of the same summary.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+            language: Summary language
+
+        Returns:
+            str: The new summary
+        """
+        async def create() -> str:
+            summaries = await self.create_summaries_for_paper(paper_id, abstract, [language])
+            return summaries[language]
+
+        return await self.summary_flight.do(self._summary_key(paper_id, language), create)
+
+    @staticmethod
+    def _summary_key(paper_id: str, language: Language) -> str:
+        """Single-flight key of a paper summary in one language."""
+        return f"{paper_id}:{language.value}"
+
+    async def stream_summary_for_paper(
+        self,
+        paper_id: str,
+        abstract: str,
+        language: Language,
+        on_progress: Callable[[str], None]
+    ) -> str:
+        """
+        Create a summary in one language by streaming it from OpenAI.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+            language: Summary language
+            on_progress: Callback receiving the accumulated text after every delta
+
+        Returns:
+            str: The complete summary, persisted to the database
+        """
+        parts: List[str] = []
+        usage: Dict[Language, CompletionResult] = {}
+        structured = self.openai_client.structured_output
+        if config.SUMMARY_TRANSLATE_MODE and language != Language.EN:
+            source_summary, structured = await self._get_translation_source(paper_id, abstract)
+            stream = self.openai_client.stream_translation(
+                source_summary,
+                Language.EN,
+                language,
+                model=config.TRANSLATION_MODEL,
+                on_complete=lambda result: usage.update({language: result}),
+                structured=structured,
+                abstract=abstract,
+            )
+        else:
+            stream = self.openai_client.stream_summary(
+                abstract,
+                language,
+                on_complete=lambda result: usage.update({language: result}),
+            )
+        try:
+            async for delta in stream:
+                parts.append(delta)
+                text = "".join(parts)
+                on_progress(SummaryFields.from_partial_json(text).render() if structured else text)
+        except OpenAIError as e:
+            self.hf_db.logger.error(f"Error streaming summary for paper {paper_id}: {e}")
+            raise
+
+        summaries, fields = self._split_structured({language: "".join(parts)})
+        await self.save_summary(paper_id, summaries, usage=usage, fields=fields)
+        return summaries[language]
+
+    async def _get_stored_summary(self, paper_id: str, language: Language) -> Optional[str]:
+        """
+        Get a stored summary in a single language.
+
+        Args:
+            paper_id: Paper ID
+            language: Summary language
+
+        Returns:
+            Optional[str]: Stored summary or None if it does not exist yet
+        """
+        summaries = await self.get_paper_summary(paper_id)
+        if summaries:
+            return summaries.get(language)
+        return None
+
+    async def summarize_all_languages(self, paper_id: str, abstract: str) -> None:
+        """
+        Create missing summaries in every supported language.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+        """
+        for language in Language:
+            await self.get_or_create_summary(paper_id, abstract, language)
+
+    async def request_summary(self, paper_id: str) -> None:
+        """
+        Prioritize summarization of a paper a user has opened.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            None
+        """
+        await self.summary_scheduler.request(paper_id)
+
+    async def init_tables(self) -> None:
+        """
+        Create every table the manager and its jobs use, if they don't exist.
 
         Args:
             None
@@ -126,33 +520,65 @@ class HuggingFaceManager:
         Returns:
             None
         """
-        # Initialize tables
         await self.hf_db.init_db()
         await self.init_summaries_table()
+        await self.paper_metrics.init_table()
+        await self.trending.init_table()
+        await self.fulltext.init_table()
+
+    async def sync_papers_and_summaries(self, lazy: Optional[bool] = None, fetch: bool = True) -> None:
+        """
+        Sync papers and create summaries for new papers.
+
+        Args:
+            lazy: Only enqueue missing summaries for the summary scheduler instead
+                of creating them right away (defaults to config.LAZY_SUMMARIES)
+            fetch: Fetch new papers from HuggingFace first; benchmarks turn it off
+                to summarize papers seeded into the database
+
+        Returns:
+            None
+        """
+        await self.init_tables()
 
         # Sync papers
-        await self.hf_db.sync_papers()
+        if fetch:
+            await self.hf_db.sync_papers()
+            try:
+                await self.trending.refresh()
+            except Exception as e:
+                self.hf_db.logger.error(f"Error refreshing trending leaderboards: {e}")
+            if config.FULLTEXT_PREFETCH and (self._fulltext_prefetch is None or self._fulltext_prefetch.done()):
+                # Store the new papers' markdown in the background, it is not needed for summaries
+                self._fulltext_prefetch = asyncio.create_task(self.fulltext.prefetch_missing())
+
+        if config.LAZY_SUMMARIES if lazy is None else lazy:
+            await self.summary_queue.enqueue_missing()
+            return
 
         # Get papers without summaries
         sql = """
         SELECT p.id, p.abstract 
         FROM papers p 
         LEFT JOIN paper_summaries ps ON p.id = ps.paper_id 
-        WHERE ps.paper_id IS NULL;
+        WHERE ps.paper_id IS NULL
+           OR ps.summary_en IS NULL
+           OR ps.summary_ru IS NULL;
         """
         result = await self.hf_db.db._fetch(sql)
         
         # Create summaries for new papers
         tasks = []
         for paper in result.data:
-            tasks.append(self.create_summaries_for_paper(paper['id'], paper['abstract']))
+            tasks.append(self.summarize_all_languages(paper['id'], paper['abstract']))
         
-        for task in asyncio.as_completed(tasks):
-            try:
-                await task
-            except Exception as e:
-                self.hf_db.logger.error(f"Error processing paper: {e}")
-                continue
+        with background_usage():
+            for task in asyncio.as_completed(tasks):
+                try:
+                    await task
+                except Exception as e:
+                    self.hf_db.logger.error(f"Error processing paper: {e}")
+                    continue
 
     async def get_paper_info(
         self,
@@ -172,7 +598,9 @@ class HuggingFaceManager:
                 - title: Paper title
                 - authors: Paper authors
                 - url: Paper URL
-                - summary: Paper summary in selected language
+                - abstract: Paper abstract
+                - summary: Paper summary in selected language, None until it is created
+                - summary_fields: Structured summary fields, None for free-text summaries
 
         Raises:
             ValueError: If language code is not supported
@@ -188,10 +616,12 @@ class HuggingFaceManager:
             p.title,
             p.authors,
             p.url,
+            p.abstract,
             CASE 
                 WHEN $2 = 'en' THEN ps.summary_en 
                 ELSE ps.summary_ru 
-            END as summary
+            END as summary,
+            ps.summary_fields -> $2 AS summary_fields
         FROM papers p
         LEFT JOIN paper_summaries ps ON p.id = ps.paper_id
         WHERE p.id = $1;
@@ -206,19 +636,23 @@ class HuggingFaceManager:
             'title': result.data['title'],
             'authors': result.data['authors'],
             'url': result.data['url'],
-            'summary': result.data['summary']
+            'abstract': result.data['abstract'],
+            'summary': result.data['summary'],
+            'summary_fields': self._to_summary_fields(result.data['summary_fields'])
         }
 
     async def get_latest_papers(
         self,
         limit: int = 10,
+        offset: int = 0,
         lang: str = "en"
     ) -> List[Dict[str, str]]:
         """
-        Get latest papers with summaries.
+        Get a page of the latest papers with summaries.
 
         Args:
             limit: Maximum number of papers to return (default: 10)
+            offset: Number of newer papers to skip
             lang: Language code ("en" or "ru", default: "en")
 
         Returns:
@@ -230,25 +664,103 @@ class HuggingFaceManager:
             p.title,
             p.authors,
             p.url,
+            p.abstract,
             CASE 
                 WHEN $2 = 'en' THEN ps.summary_en 
                 ELSE ps.summary_ru 
-            END as summary
+            END as summary,
+            ps.summary_fields -> $2 AS summary_fields
         FROM papers p
         LEFT JOIN paper_summaries ps ON p.id = ps.paper_id
-        ORDER BY p.published_at DESC
-        LIMIT $1;
+        ORDER BY p.published_at DESC, p.id DESC
+        LIMIT $1 OFFSET $3;
         """
         
-        result = await self.hf_db.db._fetch(sql, (limit, lang.lower()))
+        result = await self.hf_db.db._fetch(sql, (limit, lang.lower(), offset))
         
-        return [{
+        return [self._to_article(paper) for paper in result.data]
+
+    async def get_trending_papers(
+        self,
+        period: str = "day",
+        limit: int = 10,
+        offset: int = 0,
+        lang: str = "en"
+    ) -> List[Dict[str, str]]:
+        """
+        Get a page of a trending leaderboard with summaries.
+
+        Pages are read by rank range from the precomputed leaderboard,
+        so deep pages cost the same as the first one.
+
+        Args:
+            period: Leaderboard period, one of LEADERBOARD_PERIODS ("day", "week", "month")
+            limit: Maximum number of papers to return (default: 10)
+            offset: Number of top-ranked papers to skip
+            lang: Language code ("en" or "ru", default: "en")
+
+        Returns:
+            List[Dict]: List of paper information with summaries in requested language, best ranked first
+
+        Raises:
+            ValueError: If the period is unknown
+        """
+        if period not in LEADERBOARD_PERIODS:
+            raise ValueError(f"Unknown leaderboard period: {period}")
+
+        sql = """
+        SELECT 
+            p.id,
+            p.title,
+            p.authors,
+            p.url,
+            p.abstract,
+            CASE 
+                WHEN $4 = 'en' THEN ps.summary_en 
+                ELSE ps.summary_ru 
+            END as summary,
+            ps.summary_fields -> $4 AS summary_fields
+        FROM paper_leaderboards lb
+        JOIN papers p ON p.id = lb.paper_id
+        LEFT JOIN paper_summaries ps ON p.id = ps.paper_id
+        WHERE lb.period = $1 AND lb.rank > $2 AND lb.rank <= $2 + $3
+        ORDER BY lb.rank;
+        """
+        result = await self.hf_db.db._fetch(sql, (period, offset, limit, lang.lower()))
+        return [self._to_article(paper) for paper in result.data]
+
+    def _to_article(self, paper: Dict) -> Dict[str, str]:
+        """
+        Shape a paper row joined with its summary for the article dialog.
+
+        Args:
+            paper: Row with paper fields, summary and summary_fields
+
+        Returns:
+            Dict[str, str]: Paper information with summary
+        """
+        return {
             'id': paper['id'],
             'title': paper['title'],
             'authors': paper['authors'],
             'url': paper['url'],
-            'summary': paper['summary']
-        } for paper in result.data]
+            'abstract': paper['abstract'],
+            'summary': paper['summary'],
+            'summary_fields': self._to_summary_fields(paper['summary_fields'])
+        }
+
+    @staticmethod
+    def _to_summary_fields(raw: Optional[Dict[str, str]]) -> Optional[SummaryFields]:
+        """
+        Convert stored summary fields to a model.
+
+        Args:
+            raw: Fields as decoded from jsonb, or None
+
+        Returns:
+            Optional[SummaryFields]: Structured summary or None for free-text summaries
+        """
+        return SummaryFields(**raw) if raw else None
 
 
 # if __name__ == "__main__":
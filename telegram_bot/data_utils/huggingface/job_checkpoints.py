@@ -0,0 +1,82 @@
+"""Module for persisting the progress of resumable background jobs."""
+
+from typing import Any, Dict, Optional
+
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+
+class JobCheckpoints:
+    """Stores a JSON checkpoint per job name, so jobs resume where they stopped after a restart."""
+
+    def __init__(self, db: BaseConnection) -> None:
+        """
+        Initialize JobCheckpoints instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+        """
+        self.db = db
+
+    async def init_table(self) -> None:
+        """
+        Create job_checkpoints table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS job_checkpoints (
+            job_name TEXT PRIMARY KEY,
+            state JSONB NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        await self.db._execute(create_table_sql)
+
+    async def load(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the last checkpoint of a job.
+
+        Args:
+            job_name: Job name
+
+        Returns:
+            Optional[Dict[str, Any]]: Checkpoint state or None if the job never saved one
+        """
+        sql = "SELECT state FROM job_checkpoints WHERE job_name = $1;"
+        result = await self.db._fetchrow(sql, (job_name,))
+        return result.data['state'] if result.data else None
+
+    async def save(self, job_name: str, state: Dict[str, Any]) -> None:
+        """
+        Save the checkpoint of a job, replacing the previous one.
+
+        Args:
+            job_name: Job name
+            state: JSON-serializable checkpoint state
+
+        Returns:
+            None
+        """
+        sql = """
+        INSERT INTO job_checkpoints (job_name, state, updated_at)
+        VALUES ($1, $2, CURRENT_TIMESTAMP)
+        ON CONFLICT (job_name) DO UPDATE
+        SET state = EXCLUDED.state, updated_at = EXCLUDED.updated_at;
+        """
+        await self.db._execute(sql, (job_name, state))
+
+    async def clear(self, job_name: str) -> None:
+        """
+        Remove the checkpoint of a job, so it starts from the beginning next time.
+
+        Args:
+            job_name: Job name
+
+        Returns:
+            None
+        """
+        await self.db._execute("DELETE FROM job_checkpoints WHERE job_name = $1;", (job_name,))
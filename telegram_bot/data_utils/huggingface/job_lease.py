@@ -0,0 +1,100 @@
+"""Module for leasing background jobs to a single replica."""
+
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+
+class JobLease:
+    """
+    Time-limited leases on job names, so each job runs on one replica at a time.
+
+    A replica may only take a lease that is free or expired. The holder
+    renews it while the job runs, and after a run keeps it until the job is
+    due again, so the lease also spaces the runs across replicas. A crashed
+    holder stops renewing and its lease expires.
+    """
+
+    def __init__(self, db: BaseConnection) -> None:
+        """
+        Initialize JobLease instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+        """
+        self.db = db
+
+    async def init_table(self) -> None:
+        """
+        Create job_leases table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS job_leases (
+            job_name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            leased_until TIMESTAMP NOT NULL
+        );
+        """
+        await self.db._execute(create_table_sql)
+
+    async def acquire(self, job_name: str, holder: str, seconds: float) -> bool:
+        """
+        Take the lease of a job if it is free or expired.
+
+        Args:
+            job_name: Job name
+            holder: Unique name of the replica taking the lease
+            seconds: Lease duration
+
+        Returns:
+            bool: True if the lease was taken
+        """
+        sql = """
+        INSERT INTO job_leases (job_name, holder, leased_until)
+        VALUES ($1, $2, NOW() + make_interval(secs => $3))
+        ON CONFLICT (job_name) DO UPDATE
+        SET holder = EXCLUDED.holder, leased_until = EXCLUDED.leased_until
+        WHERE job_leases.leased_until < NOW()
+        RETURNING job_name;
+        """
+        result = await self.db._fetchrow(sql, (job_name, holder, seconds))
+        return result.data is not None
+
+    async def renew(self, job_name: str, holder: str, seconds: float) -> bool:
+        """
+        Extend a lease held by the replica, counting from now.
+
+        Args:
+            job_name: Job name
+            holder: Unique name of the replica holding the lease
+            seconds: New lease duration
+
+        Returns:
+            bool: False if the lease was lost to another replica
+        """
+        sql = """
+        UPDATE job_leases
+        SET leased_until = NOW() + make_interval(secs => $3)
+        WHERE job_name = $1 AND holder = $2
+        RETURNING job_name;
+        """
+        result = await self.db._fetchrow(sql, (job_name, holder, seconds))
+        return result.data is not None
+
+    async def release(self, job_name: str, holder: str) -> None:
+        """
+        Give a lease up, so another replica can take the job right away.
+
+        Args:
+            job_name: Job name
+            holder: Unique name of the replica holding the lease
+
+        Returns:
+            None
+        """
+        sql = "DELETE FROM job_leases WHERE job_name = $1 AND holder = $2;"
+        await self.db._execute(sql, (job_name, holder))
@@ -0,0 +1,81 @@
+"""Module for extracting named sections from paper markdown."""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# ATX headings: level and title. Anchoring on a literal newline instead of
+# ^ with MULTILINE lets the regex engine skip ahead with a fast substring
+# search rather than trying the pattern at every line start.
+_HEADING_RE = re.compile(r"\n(#{1,6})[ \t]+([^\n]*)")
+_FIRST_HEADING_RE = re.compile(r"(#{1,6})[ \t]+([^\n]*)")
+# Emphasis markers and leading section numbers of heading titles, e.g. "**", "1.", "2.3", "IV."
+_EMPHASIS_RE = re.compile(r"[*_`]")
+_NUMBERING_RE = re.compile(r"^(?:\d+(?:\.\d+)*\.?|[ivxlc]+\.)\s+", re.IGNORECASE)
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a heading title for matching, e.g. "**1. Introduction**" -> "introduction".
+
+    Args:
+        title: Heading title
+
+    Returns:
+        str: Lowercase title without numbering and emphasis
+    """
+    return _NUMBERING_RE.sub("", _EMPHASIS_RE.sub("", title).strip(" \t#")).lower()
+
+
+def _headings(markdown: str) -> Iterator[Tuple[int, str, int, int]]:
+    """Yield level, title, start and end offsets of every heading line, in order."""
+    first = _FIRST_HEADING_RE.match(markdown)
+    if first:
+        yield len(first.group(1)), first.group(2), first.start(), first.end()
+    for heading in _HEADING_RE.finditer(markdown):
+        yield len(heading.group(1)), heading.group(2), heading.start(), heading.end()
+
+
+def extract_sections(markdown: str, names: Iterable[str]) -> Dict[str, str]:
+    """
+    Extract the bodies of named sections in a single scan over the headings.
+
+    A section matches a name when its normalized title starts with it as a
+    whole word, optionally plural, so "conclusion" also matches
+    "5. Conclusions and Future Work" but "abstract" does not match
+    "Abstractive Methods". The first
+    matching section wins. Its body runs from the end of its heading line
+    to the next heading of the same or a higher level, and is sliced from
+    the document once.
+
+    Args:
+        markdown: Markdown document
+        names: Lowercase section names, e.g. ["abstract", "introduction", "conclusion"]
+
+    Returns:
+        Dict[str, str]: Stripped bodies of the found sections, keyed by name
+    """
+    wanted = list(dict.fromkeys(names))
+    patterns = {name: re.compile(rf"{re.escape(name)}s?\b") for name in wanted}
+    sections: Dict[str, str] = {}
+    # Sections still open: (name, heading level, body start)
+    open_sections: List[Tuple[str, int, int]] = []
+
+    for level, raw_title, heading_start, heading_end in _headings(markdown):
+        still_open = []
+        for name, open_level, start in open_sections:
+            if level <= open_level:
+                sections[name] = markdown[start:heading_start].strip()
+            else:
+                still_open.append((name, open_level, start))
+        open_sections = still_open
+
+        title = normalize_title(raw_title)
+        for name in wanted:
+            if patterns[name].match(title) and name not in sections and all(name != n for n, _, _ in open_sections):
+                open_sections.append((name, level, heading_end))
+        if len(sections) == len(wanted):
+            break
+
+    for name, _, start in open_sections:
+        sections[name] = markdown[start:].strip()
+    return sections
@@ -0,0 +1,92 @@
+"""Module for keeping upvotes and comments of recent papers current."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
+from telegram_bot.data_utils.huggingface.paper_metrics import PaperMetrics
+from telegram_bot.data_utils.huggingface.trending import TrendingRanker
+
+JOB_NAME = "metrics_refresh"
+DOWNSAMPLE_INTERVAL = 24 * 3600.0
+
+
+class MetricsRefresh:
+    """
+    Background job re-fetching a sliding window of recent days to update paper metrics.
+
+    sync_papers only inserts new papers, so their upvotes and comments would
+    stay as first seen. This job revisits the last ``window_days`` days on an
+    interval and bulk-updates the papers whose metrics hash changed. The
+    update also appends the new values to the metrics time series, which
+    this job downsamples at most once a day, and the trending leaderboards
+    are re-ranked when anything changed.
+    """
+
+    def __init__(
+        self,
+        hf_db: HuggingFaceDB,
+        metrics: PaperMetrics,
+        window_days: int = 3,
+        interval: float = 1800.0,
+        ranker: Optional[TrendingRanker] = None,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            hf_db: Papers storage
+            metrics: Time series of the paper metrics, downsampled by the job
+            window_days: Number of recent days to revisit, today included
+            interval: Seconds between refreshes
+            ranker: Optional ranker of the trending leaderboards
+            logger: Optional logger instance
+        """
+        self.hf_db = hf_db
+        self.metrics = metrics
+        self.window_days = window_days
+        self.interval = interval
+        self.ranker = ranker
+        self.logger = logger or logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        self._downsampled_at: Optional[float] = None
+
+    async def run_once(self) -> List[Dict]:
+        """
+        Refresh the metrics of the window once; the changes are recorded by update_paper_metrics.
+
+        Returns:
+            List[Dict]: Changed papers with id, upvotes and num_comments
+        """
+        changed = await self.hf_db.refresh_recent_metrics(self.window_days)
+        if changed and self.ranker is not None:
+            await self.ranker.refresh()
+        if self._downsampled_at is None or time.monotonic() - self._downsampled_at >= DOWNSAMPLE_INTERVAL:
+            await self.metrics.downsample()
+            self._downsampled_at = time.monotonic()
+        return changed
+
+    def start(self) -> None:
+        """Run the job in the background if it is not running yet."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=JOB_NAME)
+
+    async def stop(self) -> None:
+        """Cancel the job."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Metrics refresh failed: {e}")
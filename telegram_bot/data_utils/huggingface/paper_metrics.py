@@ -0,0 +1,148 @@
+"""Module for storing the history of paper upvotes and comments."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+
+class PaperMetrics:
+    """
+    Append-only time series of paper metrics.
+
+    A point is written only when a paper's metrics change, by the same
+    statement that updates the paper (HuggingFaceDB.update_paper_metrics),
+    and old points are downsampled to the last one per paper and day, so
+    the table stays small while velocities can still be computed.
+    """
+
+    def __init__(self, db: BaseConnection, downsample_after: timedelta = timedelta(days=7)) -> None:
+        """
+        Initialize PaperMetrics instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+            downsample_after: Age after which points are reduced to one per paper and day
+        """
+        self.db = db
+        self.downsample_after = downsample_after
+
+    async def init_table(self) -> None:
+        """
+        Create paper_metrics table if it doesn't exist.
+
+        Rows are appended in time order, so a BRIN index on observed_at
+        narrows window scans at a tiny fraction of a B-tree's size. A B-tree
+        on (paper_id, observed_at) serves the per-paper baseline lookups.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS paper_metrics (
+            paper_id TEXT NOT NULL,
+            observed_at TIMESTAMP NOT NULL,
+            upvotes INTEGER NOT NULL,
+            num_comments INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS paper_metrics_observed_at_brin
+            ON paper_metrics USING BRIN (observed_at);
+        CREATE INDEX IF NOT EXISTS paper_metrics_paper_id_observed_at
+            ON paper_metrics (paper_id, observed_at DESC);
+        """
+        await self.db._execute(create_table_sql)
+
+    async def downsample(self) -> None:
+        """
+        Keep only the last point per paper and day among points older than downsample_after.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sql = """
+        DELETE FROM paper_metrics m
+        USING (
+            SELECT ctid
+            FROM (
+                SELECT ctid, row_number() OVER (
+                    PARTITION BY paper_id, date_trunc('day', observed_at)
+                    ORDER BY observed_at DESC
+                ) AS position
+                FROM paper_metrics
+                WHERE observed_at < $1
+            ) ranked
+            WHERE position > 1
+        ) stale
+        WHERE m.ctid = stale.ctid;
+        """
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - self.downsample_after
+        await self.db._execute(sql, (cutoff,))
+
+    async def get_velocities(
+        self,
+        window: timedelta,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Compute the upvote velocity of every paper active in a window, in one query.
+
+        Papers with points in the window or published inside it are included.
+        The gain is measured from the last point before the window, however
+        old it is, from zero for papers published inside
+        the window, or else from the first point in it. It is divided by the
+        hours the paper spent in the window, at least one. Papers published
+        inside the window without points yet count with their stored upvotes.
+
+        Args:
+            window: Length of the window
+            end: End of the window (defaults to now, UTC)
+            limit: Optional maximum number of papers, fastest first
+
+        Returns:
+            List[Dict]: Papers with paper_id, upvotes, published_at and velocity (upvotes/hour), fastest first
+        """
+        sql = """
+        WITH windowed AS (
+            SELECT paper_id,
+                   (array_agg(upvotes ORDER BY observed_at DESC))[1] AS latest,
+                   (array_agg(upvotes ORDER BY observed_at))[1] AS earliest
+            FROM paper_metrics
+            WHERE observed_at >= $1 AND observed_at <= $2
+            GROUP BY paper_id
+        ),
+        candidates AS (
+            SELECT paper_id FROM windowed
+            UNION
+            SELECT id FROM papers WHERE published_at >= $1 AND published_at <= $2
+        )
+        SELECT c.paper_id,
+               COALESCE(w.latest, p.upvotes, 0) AS upvotes,
+               p.published_at,
+               (
+                   COALESCE(w.latest, p.upvotes, 0)
+                   - COALESCE(b.upvotes, CASE WHEN p.published_at >= $1 THEN 0 END, w.earliest)
+               )::FLOAT
+                   / GREATEST(EXTRACT(EPOCH FROM ($2 - GREATEST($1, p.published_at))) / 3600, 1) AS velocity
+        FROM candidates c
+        JOIN papers p ON p.id = c.paper_id
+        LEFT JOIN windowed w ON w.paper_id = c.paper_id
+        LEFT JOIN LATERAL (
+            SELECT upvotes
+            FROM paper_metrics
+            WHERE paper_id = c.paper_id AND observed_at < $1
+            ORDER BY observed_at DESC
+            LIMIT 1
+        ) b ON TRUE
+        ORDER BY velocity DESC NULLS LAST, c.paper_id
+        LIMIT $3;
+        """
+        end = end or datetime.now(timezone.utc).replace(tzinfo=None)
+        result = await self.db._fetch(sql, (end - window, end, limit))
+        return result.data
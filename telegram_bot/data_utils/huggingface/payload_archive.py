@@ -0,0 +1,128 @@
+"""Module for archiving raw daily_papers payloads for offline reprocessing."""
+
+import hashlib
+from datetime import date, timedelta
+from typing import AsyncIterator, Dict, List, Optional
+
+from telegram_bot.db.db_api.storages.base import BaseConnection
+from telegram_bot.models import PaperRecord
+from telegram_bot.utils.compression import compress, decompress
+
+
+def decode_archived_payload(codec: str, payload: bytes) -> List[PaperRecord]:
+    """
+    Decompress an archived payload and normalize it like freshly fetched papers.
+
+    Module-level so it can run in worker processes.
+
+    Args:
+        codec: Compression codec of the payload
+        payload: Compressed JSON payload
+
+    Returns:
+        List[PaperRecord]: Normalized papers
+    """
+    return PaperRecord.decode_daily_papers(decompress(codec, payload))
+
+
+class PayloadArchive:
+    """
+    Keeps the latest raw daily_papers payload of every day, compressed.
+
+    Changes to paper normalization can then be applied to the whole
+    history from the archive instead of re-crawling HuggingFace.
+    """
+
+    def __init__(self, db: BaseConnection) -> None:
+        """
+        Initialize PayloadArchive instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+        """
+        self.db = db
+
+    async def init_table(self) -> None:
+        """
+        Create daily_papers_archive table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS daily_papers_archive (
+            day DATE PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            codec TEXT NOT NULL,
+            payload BYTEA NOT NULL,
+            raw_size INTEGER NOT NULL,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        ALTER TABLE daily_papers_archive ALTER COLUMN payload SET STORAGE EXTERNAL;
+        """
+        await self.db._execute(create_table_sql)
+
+    async def save(self, day: date, body: bytes) -> None:
+        """
+        Archive the payload of a day, replacing an older one only if the content changed.
+
+        Args:
+            day: Date of the payload
+            body: Raw JSON payload
+
+        Returns:
+            None
+        """
+        sql = """
+        INSERT INTO daily_papers_archive (day, content_hash, codec, payload, raw_size)
+        VALUES ($1, $2, $3, $4, $5)
+        ON CONFLICT (day) DO UPDATE
+        SET content_hash = EXCLUDED.content_hash,
+            codec = EXCLUDED.codec,
+            payload = EXCLUDED.payload,
+            raw_size = EXCLUDED.raw_size,
+            fetched_at = CURRENT_TIMESTAMP
+        WHERE daily_papers_archive.content_hash <> EXCLUDED.content_hash;
+        """
+        codec, payload = compress(body)
+        content_hash = hashlib.sha256(body).hexdigest()
+        await self.db._execute(sql, (day, content_hash, codec, payload, len(body)))
+
+    async def iter_batches(
+        self,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        batch_size: int = 8
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Stream archived payloads in date order, a few days per query.
+
+        Batches are read with keyset pagination on the day, so no cursor or
+        transaction stays open while the caller processes them.
+
+        Args:
+            since: First day to read (defaults to the oldest archived day)
+            until: Last day to read (defaults to the newest archived day)
+            batch_size: Number of days per batch
+
+        Yields:
+            List[Dict]: Archived days with day, codec and payload
+        """
+        sql = """
+        SELECT day, codec, payload
+        FROM daily_papers_archive
+        WHERE ($1::DATE IS NULL OR day > $1)
+          AND ($2::DATE IS NULL OR day <= $2)
+        ORDER BY day
+        LIMIT $3;
+        """
+        after = since - timedelta(days=1) if since else None
+        while True:
+            result = await self.db._fetch(sql, (after, until, batch_size))
+            if not result.data:
+                return
+            yield result.data
+            after = result.data[-1]['day']
@@ -0,0 +1,178 @@
+"""Module for recreating summaries made with outdated prompts or models."""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from telegram_bot.data_utils.huggingface.job_checkpoints import JobCheckpoints
+from telegram_bot.data_utils.openai import Language, OpenAICircuitOpenError, OpenAIError, background_usage
+
+if TYPE_CHECKING:
+    from telegram_bot.data_utils.huggingface.huggingface_manager import HuggingFaceManager
+
+JOB_NAME = "summary_backfill"
+
+
+class SummaryBackfill:
+    """
+    Background job re-summarizing papers whose summaries have an outdated version stamp.
+
+    Outdated papers are read in batches, most upvoted first, using keyset
+    pagination so no cursor or transaction is held open between batches.
+    The position is checkpointed after every paper, and the job resumes from
+    it after a restart as long as the target version has not changed again.
+
+    Papers are processed one at a time under a per-minute cap and as
+    background OpenAI usage, so the job never competes with users for
+    rate limits or the daily budget. Old summaries stay readable until
+    their replacement is saved.
+    """
+
+    def __init__(
+        self,
+        manager: "HuggingFaceManager",
+        checkpoints: JobCheckpoints,
+        batch_size: int = 50,
+        papers_per_minute: int = 10,
+        idle_interval: float = 3600.0,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            manager: HuggingFace manager used to create summaries
+            checkpoints: Storage of the job's progress
+            batch_size: Number of outdated papers read per query
+            papers_per_minute: Maximum number of papers re-summarized per minute
+            idle_interval: Seconds to wait after a full pass before looking for outdated papers again
+            logger: Optional logger instance
+        """
+        self.manager = manager
+        self.checkpoints = checkpoints
+        self.batch_size = batch_size
+        self.min_interval = 60.0 / papers_per_minute
+        self.idle_interval = idle_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def target_version(self) -> Dict[str, Dict[str, str]]:
+        """Version stamps an up-to-date paper has, by language code."""
+        return {lang.code: self.manager.summary_version_for(lang) for lang in Language}
+
+    async def fetch_outdated(self, after: Optional[Dict[str, Any]], limit: int) -> List[Dict]:
+        """
+        Get the next batch of papers with outdated summaries.
+
+        Args:
+            after: Upvotes and id of the last processed paper, or None to start from the top
+            limit: Maximum number of papers
+
+        Returns:
+            List[Dict]: Papers with id, abstract and upvotes, most upvoted first
+        """
+        sql = """
+        SELECT p.id, p.abstract, COALESCE(p.upvotes, 0) AS upvotes
+        FROM papers p
+        JOIN paper_summaries ps ON ps.paper_id = p.id
+        WHERE NOT (COALESCE(ps.versions, '{}'::jsonb) @> $1)
+          AND ($2::INTEGER IS NULL OR (COALESCE(p.upvotes, 0), p.id) < ($2, $3))
+        ORDER BY COALESCE(p.upvotes, 0) DESC, p.id DESC
+        LIMIT $4;
+        """
+        after = after or {}
+        result = await self.manager.hf_db.db._fetch(
+            sql, (self.target_version, after.get('upvotes'), after.get('id'), limit)
+        )
+        return result.data
+
+    async def resummarize(self, paper_id: str, abstract: str) -> None:
+        """
+        Recreate a paper's summaries in every language.
+
+        English goes first, so in translate mode the other languages are
+        translated from the new English summary rather than the outdated one.
+        Each summary is recreated under its single-flight key, so the job
+        never runs alongside a user-triggered creation of the same summary.
+
+        Args:
+            paper_id: Paper ID
+            abstract: Paper abstract
+        """
+        for language in [Language.EN] + [lang for lang in Language if lang != Language.EN]:
+            await self.manager.recreate_summary(paper_id, abstract, language)
+
+    async def run_pass(self) -> int:
+        """
+        Re-summarize every outdated paper, resuming from the last checkpoint.
+
+        Returns:
+            int: Number of papers re-summarized in this call
+
+        Raises:
+            OpenAICircuitOpenError: If the API is failing; the paper is retried on the next call
+        """
+        target = self.target_version
+        state = await self.checkpoints.load(JOB_NAME)
+        if not state or state.get('target') != target:
+            state = {'target': target, 'after': None, 'done': 0}
+
+        processed = 0
+        with background_usage():
+            while True:
+                batch = await self.fetch_outdated(state['after'], self.batch_size)
+                if not batch:
+                    break
+                for paper in batch:
+                    started = time.monotonic()
+                    try:
+                        await self.resummarize(paper['id'], paper['abstract'])
+                    except OpenAICircuitOpenError:
+                        raise
+                    except OpenAIError as e:
+                        self.logger.error(f"Summary backfill failed for paper {paper['id']}: {e}")
+                    else:
+                        processed += 1
+                        state['done'] += 1
+                    state['after'] = {'upvotes': paper['upvotes'], 'id': paper['id']}
+                    await self.checkpoints.save(JOB_NAME, state)
+                    await asyncio.sleep(max(0.0, self.min_interval - (time.monotonic() - started)))
+
+        # Start the next pass from the top, picking up papers whose upvotes moved past the cursor
+        state['after'] = None
+        await self.checkpoints.save(JOB_NAME, state)
+        if processed:
+            self.logger.info(f"Summary backfill pass re-summarized {processed} papers, {state['done']} in total")
+        return processed
+
+    def start(self) -> None:
+        """Run the job in the background if it is not running yet."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=JOB_NAME)
+
+    async def stop(self) -> None:
+        """Cancel the job; it resumes from its checkpoint when started again."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        await self.checkpoints.init_table()
+        while True:
+            try:
+                processed = await self.run_pass()
+            except asyncio.CancelledError:
+                raise
+            except OpenAICircuitOpenError as e:
+                # The checkpoint still points before the failed paper, let the API recover and resume
+                self.logger.warning(f"Summary backfill paused: {e}")
+                await asyncio.sleep(e.retry_after or self.min_interval)
+                continue
+            except Exception as e:
+                self.logger.error(f"Summary backfill pass failed: {e}")
+                processed = 0
+            if not processed:
+                await asyncio.sleep(self.idle_interval)
@@ -0,0 +1,324 @@
+"""Module for lazy, popularity-prioritized paper summarization."""
+
+import asyncio
+import logging
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from telegram_bot.data_utils.openai import background_usage
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+if TYPE_CHECKING:
+    from telegram_bot.data_utils.huggingface.huggingface_manager import HuggingFaceManager
+
+# Priority given to papers a user has opened, above any upvote count.
+USER_REQUEST_PRIORITY = 1_000_000_000
+
+# Postgres channel notified when a user request is enqueued, so idle workers in any process wake up
+NOTIFY_CHANNEL = "summary_queue"
+
+
+class SummaryQueue:
+    """Persistent priority queue of papers waiting for summaries."""
+
+    def __init__(self, db: BaseConnection) -> None:
+        """
+        Initialize SummaryQueue instance.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+        """
+        self.db = db
+
+    async def init_table(self) -> None:
+        """
+        Create summary_queue table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS summary_queue (
+            paper_id TEXT PRIMARY KEY,
+            priority INTEGER NOT NULL DEFAULT 0,
+            enqueued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            claimed_until TIMESTAMP,
+            FOREIGN KEY (paper_id) REFERENCES papers (id)
+        );
+        CREATE INDEX IF NOT EXISTS summary_queue_priority_idx
+            ON summary_queue (priority DESC, enqueued_at);
+        """
+        await self.db._execute(create_table_sql)
+
+    async def enqueue_missing(self) -> None:
+        """
+        Enqueue every paper that lacks a summary, prioritized by upvotes.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sql = """
+        INSERT INTO summary_queue (paper_id, priority)
+        SELECT p.id, COALESCE(p.upvotes, 0)
+        FROM papers p
+        LEFT JOIN paper_summaries ps ON p.id = ps.paper_id
+        WHERE ps.paper_id IS NULL
+           OR ps.summary_en IS NULL
+           OR ps.summary_ru IS NULL
+        ON CONFLICT (paper_id) DO UPDATE
+        SET priority = GREATEST(summary_queue.priority, EXCLUDED.priority);
+        """
+        await self.db._execute(sql)
+
+    async def enqueue(self, paper_id: str, priority: int) -> None:
+        """
+        Enqueue a paper or raise its priority if it is already queued.
+
+        Args:
+            paper_id: Paper ID
+            priority: Queue priority, higher values are processed first
+
+        Returns:
+            None
+        """
+        sql = """
+        INSERT INTO summary_queue (paper_id, priority)
+        VALUES ($1, $2)
+        ON CONFLICT (paper_id) DO UPDATE
+        SET priority = GREATEST(summary_queue.priority, EXCLUDED.priority);
+        """
+        await self.db._execute(sql, (paper_id, priority))
+
+    async def notify(self, paper_id: str) -> None:
+        """
+        Wake up the schedulers listening to the queue, in every process.
+
+        Args:
+            paper_id: Paper ID sent as the notification payload
+
+        Returns:
+            None
+        """
+        await self.db._execute("SELECT pg_notify($1, $2);", (NOTIFY_CHANNEL, paper_id))
+
+    def listen(self, callback: Callable[..., None]) -> AbstractAsyncContextManager[Any]:
+        """
+        Call ``callback`` on every notification of the queue while the context is open.
+
+        Args:
+            callback: Listener receiving connection, pid, channel and payload
+
+        Returns:
+            AbstractAsyncContextManager[Any]: Context holding the listening connection
+        """
+        return self.db._listen(NOTIFY_CHANNEL, callback)
+
+    async def claim(self, limit: int = 1, lease_seconds: int = 300) -> List[Dict]:
+        """
+        Claim the highest-priority unclaimed papers.
+
+        Claims expire after the lease, so papers held by a crashed worker are
+        picked up again. ``SKIP LOCKED`` lets several workers and replicas
+        claim concurrently without blocking each other.
+
+        Args:
+            limit: Maximum number of papers to claim
+            lease_seconds: How long the claim is held
+
+        Returns:
+            List[Dict]: Claimed papers with id, abstract and priority
+        """
+        sql = """
+        WITH claimed AS (
+            UPDATE summary_queue
+            SET claimed_until = NOW() + make_interval(secs => $2)
+            WHERE paper_id IN (
+                SELECT paper_id
+                FROM summary_queue
+                WHERE claimed_until IS NULL OR claimed_until < NOW()
+                ORDER BY priority DESC, enqueued_at
+                LIMIT $1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING paper_id, priority
+        )
+        SELECT c.paper_id AS id, c.priority, p.abstract
+        FROM claimed c
+        JOIN papers p ON p.id = c.paper_id
+        ORDER BY c.priority DESC;
+        """
+        result = await self.db._fetch(sql, (limit, lease_seconds))
+        return result.data
+
+    async def complete(self, paper_id: str) -> None:
+        """
+        Remove a summarized paper from the queue.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            None
+        """
+        sql = "DELETE FROM summary_queue WHERE paper_id = $1;"
+        await self.db._execute(sql, (paper_id,))
+
+    async def release(self, paper_id: str, retry_after_seconds: int) -> None:
+        """
+        Return a failed paper to the queue after a delay.
+
+        Args:
+            paper_id: Paper ID
+            retry_after_seconds: Delay before the paper can be claimed again
+
+        Returns:
+            None
+        """
+        sql = """
+        UPDATE summary_queue
+        SET claimed_until = NOW() + make_interval(secs => $2)
+        WHERE paper_id = $1;
+        """
+        await self.db._execute(sql, (paper_id, retry_after_seconds))
+
+
+class SummaryScheduler:
+    """
+    Background workers draining the summary queue in priority order.
+
+    Idle workers poll the queue every ``poll_interval`` and are woken up
+    right away by user requests, made in this process or, through a
+    Postgres notification, in any other one such as the bot.
+    """
+
+    def __init__(
+        self,
+        manager: "HuggingFaceManager",
+        queue: SummaryQueue,
+        workers: int = 4,
+        poll_interval: float = 5.0,
+        retry_after_seconds: int = 60,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            manager: HuggingFace manager used to create summaries
+            queue: Queue to drain
+            workers: Number of concurrent summarization workers
+            poll_interval: Seconds an idle worker waits before checking the queue again
+            retry_after_seconds: Delay before a failed paper is retried
+            logger: Optional logger instance
+        """
+        self.manager = manager
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retry_after_seconds = retry_after_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are running."""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """Start the background workers if they are not running yet."""
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"summary-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._listen(), name="summary-listener"))
+
+    async def stop(self) -> None:
+        """Cancel the background workers and wait for them to exit."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def request(self, paper_id: str) -> None:
+        """
+        Move a paper a user has opened to the front of the queue.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            None
+        """
+        await self.queue.enqueue(paper_id, USER_REQUEST_PRIORITY)
+        self._wakeup.set()
+        await self.queue.notify(paper_id)
+
+    async def run_once(self) -> bool:
+        """
+        Claim and summarize a single queued paper.
+
+        Returns:
+            bool: True if a paper was processed, False if the queue was empty
+        """
+        claimed = await self.queue.claim(limit=1)
+        if not claimed:
+            return False
+
+        paper = claimed[0]
+        try:
+            if paper['priority'] >= USER_REQUEST_PRIORITY:
+                # A user is waiting for this paper, keep it out of the budget throttling
+                await self.manager.summarize_all_languages(paper['id'], paper['abstract'])
+            else:
+                with background_usage():
+                    await self.manager.summarize_all_languages(paper['id'], paper['abstract'])
+        except Exception as e:
+            self.logger.error(f"Error summarizing queued paper {paper['id']}: {e}")
+            await self.queue.release(paper['id'], self.retry_after_seconds)
+        else:
+            await self.queue.complete(paper['id'])
+        return True
+
+    async def _listen(self) -> None:
+        """Wake the workers up on queue notifications until cancelled, polling still works without them."""
+        while True:
+            try:
+                async with self.queue.listen(lambda *_: self._wakeup.set()):
+                    await asyncio.get_running_loop().create_future()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Failed to listen to summary queue notifications: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _worker(self, worker_id: int) -> None:
+        """
+        Drain the queue until cancelled, idling while it is empty.
+
+        Args:
+            worker_id: Index of the worker, used for logging
+        """
+        while True:
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Summary worker {worker_id} failed to poll the queue: {e}")
+                processed = False
+
+            if not processed:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,136 @@
+"""Module for ranking trending papers into precomputed leaderboards."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from telegram_bot.data_utils.huggingface.paper_metrics import PaperMetrics
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+# Leaderboard period: (velocity window, half-life of the recency decay)
+LEADERBOARD_PERIODS: Dict[str, Tuple[timedelta, timedelta]] = {
+    "day": (timedelta(days=1), timedelta(hours=12)),
+    "week": (timedelta(days=7), timedelta(days=3, hours=12)),
+    "month": (timedelta(days=30), timedelta(days=15)),
+}
+
+
+class TrendingRanker:
+    """
+    Scores papers by recency-decayed upvote velocity and stores ranked leaderboards.
+
+    Every period keeps at most ``max_size`` ranks in paper_leaderboards,
+    keyed by (period, rank), so a page is a primary key range read no
+    matter how deep it is. Refreshes upsert the ranks and skip those whose
+    paper and score did not change.
+    """
+
+    def __init__(
+        self,
+        db: BaseConnection,
+        metrics: PaperMetrics,
+        max_size: int = 500,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the ranker.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+            metrics: Metrics time series the velocities are computed from
+            max_size: Maximum number of ranked papers per period
+            logger: Optional logger instance
+        """
+        self.db = db
+        self.metrics = metrics
+        self.max_size = max_size
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def init_table(self) -> None:
+        """
+        Create paper_leaderboards table if it doesn't exist.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS paper_leaderboards (
+            period TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            paper_id TEXT NOT NULL,
+            score DOUBLE PRECISION NOT NULL,
+            PRIMARY KEY (period, rank)
+        );
+        """
+        await self.db._execute(create_table_sql)
+
+    @staticmethod
+    def score(velocity: float, published_at: Optional[datetime], half_life: timedelta, now: datetime) -> float:
+        """
+        Decay a paper's upvote velocity by its age.
+
+        Args:
+            velocity: Upvotes per hour over the period's window
+            published_at: Publication time of the paper
+            half_life: Age at which the score is halved
+            now: Current time, UTC
+
+        Returns:
+            float: Trending score
+        """
+        if published_at is None:
+            return velocity
+        age = max(now - published_at, timedelta(0))
+        return velocity * 0.5 ** (age / half_life)
+
+    async def refresh(self, periods: Optional[Iterable[str]] = None) -> None:
+        """
+        Recompute the leaderboards of the given periods.
+
+        Args:
+            periods: Period names (defaults to all of LEADERBOARD_PERIODS)
+
+        Returns:
+            None
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for period in periods or LEADERBOARD_PERIODS:
+            window, half_life = LEADERBOARD_PERIODS[period]
+            velocities = await self.metrics.get_velocities(window, end=now)
+            ranked = sorted(
+                (
+                    (self.score(paper['velocity'], paper['published_at'], half_life, now), paper['paper_id'])
+                    for paper in velocities
+                    if paper['velocity'] and paper['velocity'] > 0
+                ),
+                reverse=True,
+            )[:self.max_size]
+            await self._store(period, ranked)
+            self.logger.info(f"Trending leaderboard '{period}' refreshed with {len(ranked)} papers")
+
+    async def _store(self, period: str, ranked: List[Tuple[float, str]]) -> None:
+        upsert_sql = """
+        INSERT INTO paper_leaderboards (period, rank, paper_id, score)
+        SELECT $1, u.rank, u.paper_id, u.score
+        FROM unnest($2::INTEGER[], $3::TEXT[], $4::DOUBLE PRECISION[]) AS u(rank, paper_id, score)
+        ON CONFLICT (period, rank) DO UPDATE
+        SET paper_id = EXCLUDED.paper_id, score = EXCLUDED.score
+        WHERE (paper_leaderboards.paper_id, paper_leaderboards.score)
+            IS DISTINCT FROM (EXCLUDED.paper_id, EXCLUDED.score);
+        """
+        # One transaction, so readers never see a leaderboard with stale ranks past its new end
+        async with self.db._transaction() as con:
+            await self.db._execute(upsert_sql, (
+                period,
+                list(range(1, len(ranked) + 1)),
+                [paper_id for _, paper_id in ranked],
+                [score for score, _ in ranked],
+            ), con=con)
+            await self.db._execute(
+                "DELETE FROM paper_leaderboards WHERE period = $1 AND rank > $2;",
+                (period, len(ranked)),
+                con=con,
+            )
@@ -7,59 +7,90 @@ from typing import Optional
 import logging
 
 from telegram_bot.data import config
+from telegram_bot.data_utils.openai.key_pool import OpenAIKeyPool
 from telegram_bot.data_utils.openai.openai_client import OpenAIClient
+from telegram_bot.data_utils.openai.usage_ledger import DailyTokenBudget, UsageLedger
 
 
 def get_openai_client(
-    model: str = "gpt-4-turbo-preview",
+    model: str = config.OPENAI_MODEL,
     temperature: float = 0.7,
     max_tokens: int = 1000,
+    input_token_budget: Optional[int] = None,
+    usage_ledger: Optional[UsageLedger] = None,
+    token_budget: Optional[DailyTokenBudget] = None,
     logger: Optional[logging.Logger] = None
 ) -> OpenAIClient:
     """
     Factory function to create an initialized OpenAI client.
 
     Args:
-        model: OpenAI model to use (default: "gpt-4-turbo-preview")
+        model: OpenAI model to use (default: config.OPENAI_MODEL)
         temperature: Sampling temperature between 0.0 and 2.0 (default: 0.7)
         max_tokens: Maximum tokens in response (default: 1000)
+        input_token_budget: Maximum tokens of paper text per prompt (default: config.SUMMARY_INPUT_TOKEN_BUDGET)
+        usage_ledger: Optional ledger every completed call is recorded in
+        token_budget: Optional daily budget background calls are throttled by
         logger: Optional logger instance
 
     Returns:
         OpenAIClient: Initialized OpenAI client instance
 
     Raises:
-        ValueError: If OPENAI_API_KEY is not set in config
+        ValueError: If neither OPENAI_API_KEYS nor OPENAI_API_KEY is set in config
         ValueError: If temperature is not in valid range
     """
-    if not config.OPENAI_API_KEY:
+    key_entries = config.OPENAI_API_KEYS or ([config.OPENAI_API_KEY] if config.OPENAI_API_KEY else [])
+    if not key_entries:
         raise ValueError(
             "OPENAI_API_KEY is not set in config. "
-            "Please set it in your environment variables."
+            "Please set it or OPENAI_API_KEYS in your environment variables."
         )
 
     return OpenAIClient(
-        api_key=config.OPENAI_API_KEY,
+        key_pool=OpenAIKeyPool.from_config_entries(
+            key_entries,
+            base_url=config.OPENAI_BASE_URL,
+            cooldown_seconds=config.OPENAI_KEY_COOLDOWN,
+            logger=logger
+        ),
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
+        input_token_budget=input_token_budget or config.SUMMARY_INPUT_TOKEN_BUDGET,
+        structured_output=config.STRUCTURED_SUMMARIES,
+        usage_ledger=usage_ledger,
+        token_budget=token_budget,
         logger=logger
     )
 
 
 # Export necessary classes and enums for convenient imports
 from telegram_bot.data_utils.openai.openai_client import (
+    CompletionResult,
+    OpenAICircuitOpenError,
     OpenAIError,
     OpenAIRateLimitError,
+    OpenAIServerError,
     OpenAITimeoutError
 )
-from telegram_bot.data_utils.openai.prompts import Language
+from telegram_bot.data_utils.openai.usage_ledger import UsageRecord, background_usage
+from telegram_bot.data_utils.openai.prompts import Language, summary_prompt_version
 
 __all__ = [
     'get_openai_client',
     'OpenAIClient',
+    'OpenAIKeyPool',
+    'UsageLedger',
+    'UsageRecord',
+    'DailyTokenBudget',
+    'background_usage',
+    'CompletionResult',
     'OpenAIError',
     'OpenAIRateLimitError',
     'OpenAITimeoutError',
-    'Language'
+    'OpenAIServerError',
+    'OpenAICircuitOpenError',
+    'Language',
+    'summary_prompt_version'
 ]
@@ -0,0 +1,238 @@
+"""Module for routing OpenAI requests across a pool of API keys."""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional, Tuple
+
+from openai import OpenAI
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate limit reset duration such as "1s", "6m0s" or "20ms".
+
+    Args:
+        value: Header value
+
+    Returns:
+        Optional[float]: Duration in seconds or None if it cannot be parsed
+    """
+    if not value:
+        return None
+    matches = _DURATION_RE.findall(value)
+    if not matches:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Read the server's retry hint from response headers.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Optional[float]: Seconds to wait or None if the server gave no hint
+    """
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass
+class PooledKey:
+    """An API key with its client and the rate limit budget last reported for it."""
+    api_key: str
+    organization: Optional[str]
+    client: OpenAI
+    remaining_requests: Optional[int] = None
+    remaining_tokens: Optional[int] = None
+    requests_reset_at: float = 0.0
+    tokens_reset_at: float = 0.0
+    cooldown_until: float = 0.0
+    in_flight: int = 0
+    rate_limited_count: int = field(default=0)
+
+    @property
+    def name(self) -> str:
+        """Short key identifier that is safe to log."""
+        return f"...{self.api_key[-4:]}"
+
+    def headroom(self, estimated_tokens: int, now: float) -> float:
+        """
+        Estimate how many more requests of the given size the key can take now.
+
+        Budgets whose reset time has passed are treated as refilled, and keys
+        that have not reported a budget yet are considered unlimited.
+
+        Args:
+            estimated_tokens: Expected tokens of the request
+            now: Current monotonic time
+
+        Returns:
+            float: Number of requests of that size that fit into the remaining budget
+        """
+        requests_room = math.inf
+        if self.remaining_requests is not None and now < self.requests_reset_at:
+            requests_room = self.remaining_requests - self.in_flight
+        tokens_room = math.inf
+        if self.remaining_tokens is not None and now < self.tokens_reset_at:
+            tokens_room = self.remaining_tokens / max(estimated_tokens, 1) - self.in_flight
+        return min(requests_room, tokens_room)
+
+
+class OpenAIKeyPool:
+    """
+    Pool of OpenAI keys/organizations routing each request to the key with most headroom.
+
+    Remaining request and token budgets are tracked from the ``x-ratelimit-*``
+    response headers. A key answering 429 is sidelined until its cool-off ends.
+    """
+
+    def __init__(
+        self,
+        keys: List[Tuple[str, Optional[str]]],
+        base_url: Optional[str] = None,
+        cooldown_seconds: float = 60.0,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            keys: Pairs of API key and optional organization
+            base_url: Optional API base URL, e.g. a local mock server
+            cooldown_seconds: Cool-off for a rate-limited key when the server gives no retry hint
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If no keys are given
+        """
+        if not keys:
+            raise ValueError("OpenAI key pool needs at least one API key")
+
+        self.keys = [
+            PooledKey(
+                api_key=api_key,
+                organization=organization,
+                # The SDK must not retry on its own: every 429 has to reach the pool to sideline the key
+                client=OpenAI(api_key=api_key, organization=organization, base_url=base_url, max_retries=0)
+            )
+            for api_key, organization in keys
+        ]
+        self.cooldown_seconds = cooldown_seconds
+        self.logger = logger or logging.getLogger(__name__)
+
+    @classmethod
+    def from_config_entries(
+        cls,
+        entries: List[str],
+        **kwargs: Any
+    ) -> "OpenAIKeyPool":
+        """
+        Create a pool from "key" or "key:organization" entries.
+
+        Args:
+            entries: Key entries as given in the configuration
+            **kwargs: Additional pool parameters
+
+        Returns:
+            OpenAIKeyPool: The pool
+        """
+        keys = []
+        for entry in entries:
+            api_key, _, organization = entry.partition(":")
+            keys.append((api_key.strip(), organization.strip() or None))
+        return cls(keys, **kwargs)
+
+    async def acquire(self, estimated_tokens: int = 0) -> PooledKey:
+        """
+        Pick the key with the most headroom, waiting while every key is cooling off.
+
+        Callers must hand the key back with ``release``.
+
+        Args:
+            estimated_tokens: Expected prompt plus completion tokens of the request
+
+        Returns:
+            PooledKey: The selected key
+        """
+        while True:
+            now = time.monotonic()
+            available = [key for key in self.keys if key.cooldown_until <= now]
+            if available:
+                key = max(
+                    available,
+                    key=lambda k: (k.headroom(estimated_tokens, now), -k.in_flight)
+                )
+                key.in_flight += 1
+                return key
+
+            wait = min(key.cooldown_until for key in self.keys) - now
+            self.logger.warning(f"All OpenAI keys are rate limited, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+    def release(self, key: PooledKey) -> None:
+        """
+        Return a key acquired with ``acquire``.
+
+        Args:
+            key: The key
+        """
+        key.in_flight = max(0, key.in_flight - 1)
+
+    def update_from_headers(self, key: PooledKey, headers: Mapping[str, str]) -> None:
+        """
+        Record the remaining budget a response reported for a key.
+
+        Args:
+            key: Key the request was made with
+            headers: Response headers
+        """
+        now = time.monotonic()
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        if remaining_requests is not None:
+            key.remaining_requests = int(remaining_requests)
+            reset = parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+            key.requests_reset_at = now + (reset if reset is not None else 60.0)
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        if remaining_tokens is not None:
+            key.remaining_tokens = int(remaining_tokens)
+            reset = parse_reset_duration(headers.get("x-ratelimit-reset-tokens"))
+            key.tokens_reset_at = now + (reset if reset is not None else 60.0)
+
+    def mark_rate_limited(self, key: PooledKey, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Sideline a key that answered 429 for its cool-off period.
+
+        Args:
+            key: Key the request was made with
+            headers: Headers of the 429 response, used for the server's retry hint
+        """
+        cooldown = parse_retry_after(headers) or self.cooldown_seconds
+        key.cooldown_until = time.monotonic() + cooldown
+        key.rate_limited_count += 1
+        self.logger.warning(f"OpenAI key {key.name} rate limited, sidelined for {cooldown:.1f}s")
@@ -1,116 +1,686 @@
 """Module for handling interactions with OpenAI API."""
 
 import asyncio
-from typing import Dict, Optional, Any, List, Union
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Callable, Dict, Optional, Any, List, Union
 import logging
 
-from openai import OpenAI, APIError, RateLimitError, APITimeoutError
+from openai import APIConnectionError, APIError, APIStatusError, APITimeoutError, RateLimitError
 from tenacity import (
     retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
+    retry_if_exception,
+    stop_after_attempt
 )
 
 from telegram_bot.data_utils.openai.prompts import (
     ARTICLE_SUMMARY_PROMPTS,
+    STRUCTURED_SUMMARY_PROMPTS,
+    STRUCTURED_TRANSLATION_PROMPT,
     SYSTEM_PROMPTS,
+    TRANSLATION_PROMPT,
+    TRANSLATION_SYSTEM_PROMPT,
     Language
 )
+from telegram_bot.data_utils.openai.key_pool import OpenAIKeyPool, parse_retry_after
+from telegram_bot.data_utils.openai.retry import (
+    CircuitBreaker,
+    openai_circuit_breaker,
+    WaitRetryAfterOrJitter
+)
+from telegram_bot.data_utils.openai.tokens import count_tokens, truncate_to_budget
+from telegram_bot.data_utils.openai.usage_ledger import DailyTokenBudget, UsageLedger, UsageRecord
 
 
 class OpenAIError(Exception):
     """Base exception for OpenAI-related errors."""
-    pass
+    retryable = False
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class OpenAIRateLimitError(OpenAIError):
     """Exception for rate limit errors."""
-    pass
+    retryable = True
 
 
 class OpenAITimeoutError(OpenAIError):
     """Exception for timeout errors."""
+    retryable = True
+
+
+class OpenAIServerError(OpenAIError):
+    """Exception for server errors and failed connections."""
+    retryable = True
+
+
+class OpenAICircuitOpenError(OpenAIError):
+    """Exception raised without calling the API while the circuit breaker is open."""
     pass
 
 
+def _is_retryable(exception: BaseException) -> bool:
+    return isinstance(exception, OpenAIError) and exception.retryable
+
+
+@dataclass
+class CompletionResult:
+    """Content of a completion together with its token usage and latency."""
+    content: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    translated_from: Optional[str] = None
+    saved_prompt_tokens: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result's accounting fields to a JSON-serializable dictionary."""
+        usage = asdict(self)
+        del usage['content']
+        return usage
+
+
 class OpenAIClient:
     """Class for managing interactions with OpenAI API."""
 
     def __init__(
         self,
-        api_key: str,
+        api_key: Optional[str] = None,
         model: str = "gpt-4-turbo-preview",
         temperature: float = 0.7,
         max_tokens: int = 500,
+        input_token_budget: Optional[int] = None,
+        structured_output: bool = False,
+        key_pool: Optional[OpenAIKeyPool] = None,
+        usage_ledger: Optional[UsageLedger] = None,
+        token_budget: Optional[DailyTokenBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
         logger: Optional[logging.Logger] = None
     ) -> None:
         """
         Initialize OpenAI client.
 
         Args:
-            api_key: OpenAI API key
+            api_key: OpenAI API key, used when no key pool is given
             model: Model to use for completions
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum tokens in response
+            input_token_budget: Maximum tokens of paper text put into a prompt (no limit if None)
+            structured_output: Request summaries as JSON objects with objective/method/results fields
+            key_pool: Optional pool of keys/organizations requests are routed across
+            usage_ledger: Optional ledger every completed call is recorded in
+            token_budget: Optional daily budget background calls are throttled by
+            circuit_breaker: Breaker stopping calls during an outage (defaults to the process-wide one)
             logger: Optional logger instance
 
         Raises:
             ValueError: If temperature is not in valid range
+            ValueError: If neither an API key nor a key pool is given
         """
         if not 0.0 <= temperature <= 2.0:
             raise ValueError("Temperature must be between 0.0 and 2.0")
+        if key_pool is None and not api_key:
+            raise ValueError("Either api_key or key_pool must be given")
 
-        self.client = OpenAI(api_key=api_key)
+        self.key_pool = key_pool or OpenAIKeyPool([(api_key, None)], logger=logger)
+        self.client = self.key_pool.keys[0].client
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.input_token_budget = input_token_budget
+        self.structured_output = structured_output
+        self.usage_ledger = usage_ledger
+        self.token_budget = token_budget
+        self.circuit_breaker = circuit_breaker or openai_circuit_breaker
         self.logger = logger or logging.getLogger(__name__)
 
+    def _completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completion parameters, applying per-call overrides.
+
+        Args:
+            messages: List of message dictionaries
+            **kwargs: Overrides for model, temperature, max_tokens and response_format
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for chat.completions.create
+        """
+        params = {
+            'model': kwargs.get('model', self.model),
+            'messages': messages,
+            'temperature': kwargs.get('temperature', self.temperature),
+            'max_tokens': kwargs.get('max_tokens', self.max_tokens),
+        }
+        if kwargs.get('response_format'):
+            params['response_format'] = kwargs['response_format']
+        return params
+
+    def _estimate_request_tokens(self, params: Dict[str, Any]) -> int:
+        """
+        Estimate the tokens a request consumes from a key's token budget.
+
+        Args:
+            params: Chat completion parameters
+
+        Returns:
+            int: Estimated prompt tokens plus the completion token limit
+        """
+        return self.estimate_prompt_tokens(params['messages']) + params['max_tokens']
+
+    def _record_usage(self, result: CompletionResult, purpose: str) -> None:
+        """
+        Record the usage of a completed call in the ledger, if one is configured.
+
+        Args:
+            result: Completed call
+            purpose: What the call was made for, e.g. "summary" or "translation"
+        """
+        if self.usage_ledger is not None:
+            self.usage_ledger.record(UsageRecord(
+                model=result.model,
+                purpose=purpose,
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+                latency_ms=result.latency_ms
+            ))
+
+    def _check_circuit(self) -> None:
+        """
+        Fail fast instead of calling the API while the circuit breaker is open.
+
+        Raises:
+            OpenAICircuitOpenError: If the breaker does not let the call through
+        """
+        if not self.circuit_breaker.allow_call():
+            raise OpenAICircuitOpenError(
+                f"OpenAI API is failing, calls are paused for {self.circuit_breaker.retry_in:.1f}s",
+                retry_after=self.circuit_breaker.retry_in
+            )
+
+    def _wrap_api_error(self, error: Exception) -> OpenAIError:
+        """
+        Convert an SDK error to the client's error type and count it in the circuit breaker.
+
+        Only rate limits, timeouts, connection failures and 5xx responses count
+        as failures of the API; other errors are caused by the request itself
+        and show the API is answering.
+
+        Args:
+            error: Error raised by the SDK
+
+        Returns:
+            OpenAIError: Error to raise, carrying the server's retry hint if any
+        """
+        if isinstance(error, RateLimitError):
+            retry_after = parse_retry_after(error.response.headers)
+            self.circuit_breaker.record_failure(retry_after)
+            self.logger.error(f"Rate limit exceeded: {error}")
+            return OpenAIRateLimitError(f"Rate limit exceeded: {error}", retry_after=retry_after)
+        if isinstance(error, APITimeoutError):
+            self.circuit_breaker.record_failure()
+            self.logger.error(f"Request timed out: {error}")
+            return OpenAITimeoutError(f"Request timed out: {error}")
+        if isinstance(error, APIConnectionError) or (
+            isinstance(error, APIStatusError) and error.status_code >= 500
+        ):
+            retry_after = parse_retry_after(error.response.headers) if isinstance(error, APIStatusError) else None
+            self.circuit_breaker.record_failure(retry_after)
+            self.logger.error(f"Server error occurred: {error}")
+            return OpenAIServerError(f"Server error occurred: {error}", retry_after=retry_after)
+        self.circuit_breaker.record_success()
+        self.logger.error(f"API error occurred: {error}")
+        return OpenAIError(f"API error occurred: {error}")
+
+    async def _make_request(
+        self,
+        messages: List[Dict[str, str]],
+        purpose: str = "summary",
+        **kwargs: Any
+    ) -> CompletionResult:
+        """
+        Make request to OpenAI API, waiting for the token budget first.
+
+        The budget is waited for once per call, so retries of the request do
+        not queue for it again.
+
+        Args:
+            messages: List of message dictionaries
+            purpose: What the call is made for, recorded in the usage ledger
+            **kwargs: Additional parameters for completion
+
+        Returns:
+            CompletionResult: Response content with token usage and latency
+
+        Raises:
+            OpenAIRateLimitError: If rate limit is exceeded
+            OpenAITimeoutError: If request times out
+            OpenAIServerError: If the API fails or cannot be reached
+            OpenAICircuitOpenError: If calls are paused by the circuit breaker
+            OpenAIError: For other API errors
+        """
+        if self.token_budget is not None:
+            await self.token_budget.admit()
+        return await self._request_with_retry(messages, purpose=purpose, **kwargs)
+
+    # The only retry layer: pooled SDK clients are built with max_retries=0
     @retry(
-        retry=retry_if_exception_type((APIError, RateLimitError, APITimeoutError)),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        stop=stop_after_attempt(3)
+        retry=retry_if_exception(_is_retryable),
+        wait=WaitRetryAfterOrJitter(multiplier=1, max_wait=60),
+        stop=stop_after_attempt(4),
+        reraise=True
     )
-    async def _make_request(
+    async def _request_with_retry(
         self,
         messages: List[Dict[str, str]],
+        purpose: str = "summary",
         **kwargs: Any
-    ) -> str:
+    ) -> CompletionResult:
         """
         Make request to OpenAI API with retry logic.
 
+        Rate limits, timeouts and server errors are retried after the server's
+        Retry-After, or after an exponential backoff with full jitter.
+
         Args:
             messages: List of message dictionaries
+            purpose: What the call is made for, recorded in the usage ledger
             **kwargs: Additional parameters for completion
 
         Returns:
-            str: Response content
+            CompletionResult: Response content with token usage and latency
 
         Raises:
             OpenAIRateLimitError: If rate limit is exceeded
             OpenAITimeoutError: If request times out
+            OpenAIServerError: If the API fails or cannot be reached
+            OpenAICircuitOpenError: If calls are paused by the circuit breaker
             OpenAIError: For other API errors
         """
+        self._check_circuit()
+        started = time.monotonic()
+        params = self._completion_params(messages, **kwargs)
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=self.model,
-                messages=messages,
-                temperature=kwargs.get('temperature', self.temperature),
-                max_tokens=kwargs.get('max_tokens', self.max_tokens)
-            )
-            return response.choices[0].message.content
-
-        except RateLimitError as e:
-            self.logger.error(f"Rate limit exceeded: {e}")
-            raise OpenAIRateLimitError(f"Rate limit exceeded: {e}")
-        except APITimeoutError as e:
-            self.logger.error(f"Request timed out: {e}")
-            raise OpenAITimeoutError(f"Request timed out: {e}")
+            # A 429 sidelines the key, so try the other keys of the pool before giving up
+            for attempt in range(len(self.key_pool.keys)):
+                key = await self.key_pool.acquire(self._estimate_request_tokens(params))
+                try:
+                    raw = await asyncio.to_thread(key.client.chat.completions.with_raw_response.create, **params)
+                except RateLimitError as e:
+                    self.key_pool.mark_rate_limited(key, e.response.headers)
+                    if attempt == len(self.key_pool.keys) - 1:
+                        raise
+                    continue
+                finally:
+                    self.key_pool.release(key)
+                self.key_pool.update_from_headers(key, raw.headers)
+                response = raw.parse()
+                result = CompletionResult(
+                    content=response.choices[0].message.content,
+                    model=response.model,
+                    prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+                    completion_tokens=response.usage.completion_tokens if response.usage else 0,
+                    latency_ms=(time.monotonic() - started) * 1000
+                )
+                self.circuit_breaker.record_success()
+                self._record_usage(result, purpose)
+                return result
+
         except APIError as e:
-            self.logger.error(f"API error occurred: {e}")
-            raise OpenAIError(f"API error occurred: {e}")
+            raise self._wrap_api_error(e) from e
+
+    async def _stream_request(
+        self,
+        messages: List[Dict[str, str]],
+        on_complete: Optional[Callable[[CompletionResult], None]] = None,
+        purpose: str = "summary",
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from OpenAI API, yielding content deltas as they arrive.
+
+        The blocking SDK stream is consumed in a worker thread and handed over
+        to the event loop through a queue. Streams are not retried, since part
+        of the output may already have been shown.
+
+        Args:
+            messages: List of message dictionaries
+            on_complete: Optional callback receiving the full result with usage once the stream ends
+            purpose: What the call is made for, recorded in the usage ledger
+            **kwargs: Additional parameters for completion
+
+        Yields:
+            str: Content deltas
+
+        Raises:
+            OpenAIRateLimitError: If rate limit is exceeded
+            OpenAITimeoutError: If request times out
+            OpenAIServerError: If the API fails or cannot be reached
+            OpenAICircuitOpenError: If calls are paused by the circuit breaker
+            OpenAIError: For other API errors
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        stop = threading.Event()
+        usage: Dict[str, Any] = {'model': kwargs.get('model', self.model)}
+        params = self._completion_params(messages, **kwargs)
+        if self.token_budget is not None:
+            await self.token_budget.admit()
+        self._check_circuit()
+        key = await self.key_pool.acquire(self._estimate_request_tokens(params))
+
+        def produce() -> None:
+            try:
+                raw = key.client.chat.completions.with_raw_response.create(
+                    **params,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                loop.call_soon_threadsafe(self.key_pool.update_from_headers, key, raw.headers)
+                stream = raw.parse()
+                with stream:
+                    for chunk in stream:
+                        if stop.is_set():
+                            break
+                        usage['model'] = chunk.model
+                        if chunk.usage:
+                            usage['prompt_tokens'] = chunk.usage.prompt_tokens
+                            usage['completion_tokens'] = chunk.usage.completion_tokens
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            loop.call_soon_threadsafe(queue.put_nowait, chunk.choices[0].delta.content)
+            except Exception as e:
+                if isinstance(e, RateLimitError):
+                    loop.call_soon_threadsafe(self.key_pool.mark_rate_limited, key, e.response.headers)
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+        started = time.monotonic()
+        parts: List[str] = []
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise self._wrap_api_error(item) from item
+                parts.append(item)
+                yield item
+        finally:
+            stop.set()
+            await producer
+            self.key_pool.release(key)
+
+        self.circuit_breaker.record_success()
+        result = CompletionResult(
+            content="".join(parts),
+            model=usage['model'],
+            prompt_tokens=usage.get('prompt_tokens', 0),
+            completion_tokens=usage.get('completion_tokens', 0),
+            latency_ms=(time.monotonic() - started) * 1000
+        )
+        self._record_usage(result, purpose)
+        if on_complete is not None:
+            on_complete(result)
+
+    def _build_summary_messages(
+        self,
+        abstract: str,
+        lang: Language,
+        custom_prompts: Optional[Dict[Language, str]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages requesting a summary in one language.
+
+        The paper text is truncated to the client's input token budget.
+
+        Args:
+            abstract: Paper abstract text
+            lang: Summary language
+            custom_prompts: Optional dictionary of custom prompts by language
+
+        Returns:
+            List[Dict[str, str]]: Messages for the completion request
+        """
+        if self.input_token_budget is not None:
+            budgeted = truncate_to_budget(abstract, self.input_token_budget, self.model)
+            if len(budgeted) < len(abstract):
+                self.logger.info(
+                    f"Truncated paper text from {count_tokens(abstract, self.model)} "
+                    f"to {self.input_token_budget} tokens"
+                )
+            abstract = budgeted
+
+        default_prompts = STRUCTURED_SUMMARY_PROMPTS if self.structured_output else ARTICLE_SUMMARY_PROMPTS
+        prompt = (custom_prompts or {}).get(lang) or default_prompts[lang]
+        return [
+            {"role": "system", "content": SYSTEM_PROMPTS[lang]},
+            {"role": "user", "content": prompt.format(abstract=abstract)}
+        ]
+
+    async def stream_summary(
+        self,
+        abstract: str,
+        language: Language,
+        custom_prompts: Optional[Dict[Language, str]] = None,
+        on_complete: Optional[Callable[[CompletionResult], None]] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream a summary of a paper abstract in a single language.
+
+        Args:
+            abstract: Paper abstract text
+            language: Summary language
+            custom_prompts: Optional dictionary of custom prompts by language
+            on_complete: Optional callback receiving the full result with usage once the stream ends
+            **kwargs: Additional parameters for completion (temperature, max_tokens)
+
+        Yields:
+            str: Summary content deltas
+
+        Raises:
+            OpenAIError: If API request fails
+            ValueError: If abstract is empty
+        """
+        if not abstract:
+            raise ValueError("Abstract cannot be empty")
+
+        messages = self._build_summary_messages(abstract, language, custom_prompts)
+        async for delta in self._stream_request(
+            messages,
+            on_complete=on_complete,
+            **self._summary_kwargs(kwargs, self.structured_output and not custom_prompts)
+        ):
+            yield delta
+
+    def _build_translation_messages(
+        self,
+        summary: str,
+        target: Language,
+        structured: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages requesting a translation of a summary.
+
+        Args:
+            summary: Summary text, or summary fields as a JSON object if structured
+            target: Target language
+            structured: Whether the summary is a JSON object whose values are translated
+
+        Returns:
+            List[Dict[str, str]]: Messages for the completion request
+        """
+        prompt = STRUCTURED_TRANSLATION_PROMPT if structured else TRANSLATION_PROMPT
+        return [
+            {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt.format(language=target.value, summary=summary)}
+        ]
+
+    def _summary_kwargs(self, kwargs: Dict[str, Any], structured: bool) -> Dict[str, Any]:
+        """
+        Add JSON mode to the completion parameters of structured requests.
+
+        Args:
+            kwargs: Completion parameters given by the caller
+            structured: Whether the request expects a JSON object
+
+        Returns:
+            Dict[str, Any]: Completion parameters
+        """
+        if structured:
+            return {'response_format': {"type": "json_object"}, **kwargs}
+        return kwargs
+
+    def estimate_prompt_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Estimate the prompt tokens of a request before sending it.
+
+        Args:
+            messages: List of message dictionaries
+
+        Returns:
+            int: Estimated prompt tokens, including per-message overhead
+        """
+        return sum(count_tokens(message["content"], self.model) + 4 for message in messages)
+
+    async def translate_summary(
+        self,
+        summary: str,
+        source: Language,
+        target: Language,
+        model: Optional[str] = None,
+        abstract: Optional[str] = None,
+        structured: bool = False,
+        **kwargs: Any
+    ) -> CompletionResult:
+        """
+        Derive a summary in another language by translating an existing one.
+
+        Args:
+            summary: Summary text in the source language
+            source: Language of the summary
+            target: Language to translate into
+            model: Model to use for the translation (defaults to the client's model)
+            abstract: Optional abstract, used to report the prompt tokens saved
+                compared to summarizing it directly in the target language
+            structured: Whether the summary is a JSON object of summary fields
+            **kwargs: Additional parameters for completion (temperature, max_tokens)
+
+        Returns:
+            CompletionResult: The translated summary with usage
+
+        Raises:
+            OpenAIError: If API request fails
+        """
+        messages = self._build_translation_messages(summary, target, structured)
+        try:
+            result = await self._make_request(
+                messages,
+                purpose="translation",
+                model=model or self.model,
+                **self._summary_kwargs(kwargs, structured)
+            )
+        except OpenAIError as e:
+            self.logger.error(f"Error translating summary to {target.value}: {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error translating summary to {target.value}: {e}")
+            raise OpenAIError(f"Error translating summary to {target.value}: {e}")
+
+        result.translated_from = source.code
+        if abstract:
+            direct_tokens = self.estimate_prompt_tokens(self._build_summary_messages(abstract, target))
+            result.saved_prompt_tokens = direct_tokens - result.prompt_tokens
+        self.logger.info(
+            f"Translated {source.value} summary to {target.value} in {result.latency_ms:.0f} ms "
+            f"using {result.prompt_tokens} prompt tokens"
+            + (f", {result.saved_prompt_tokens} fewer than direct summarization"
+               if result.saved_prompt_tokens is not None else "")
+        )
+        return result
+
+    async def stream_translation(
+        self,
+        summary: str,
+        source: Language,
+        target: Language,
+        model: Optional[str] = None,
+        on_complete: Optional[Callable[[CompletionResult], None]] = None,
+        structured: bool = False,
+        abstract: Optional[str] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream the translation of an existing summary into another language.
+
+        Args:
+            summary: Summary text in the source language
+            source: Language of the summary
+            target: Language to translate into
+            model: Model to use for the translation (defaults to the client's model)
+            on_complete: Optional callback receiving the full result with usage once the stream ends
+            structured: Whether the summary is a JSON object of summary fields
+            abstract: Optional abstract, used to report the prompt tokens saved
+                compared to summarizing it directly in the target language
+            **kwargs: Additional parameters for completion (temperature, max_tokens)
+
+        Yields:
+            str: Translated content deltas
+
+        Raises:
+            OpenAIError: If API request fails
+        """
+        def complete(result: CompletionResult) -> None:
+            result.translated_from = source.code
+            if abstract and result.prompt_tokens:
+                # prompt_tokens comes from the usage chunk that ends the stream, 0 if it was missing
+                direct_tokens = self.estimate_prompt_tokens(self._build_summary_messages(abstract, target))
+                result.saved_prompt_tokens = direct_tokens - result.prompt_tokens
+            if on_complete is not None:
+                on_complete(result)
+
+        messages = self._build_translation_messages(summary, target, structured)
+        async for delta in self._stream_request(
+            messages,
+            on_complete=complete,
+            purpose="translation",
+            model=model or self.model,
+            **self._summary_kwargs(kwargs, structured)
+        ):
+            yield delta
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        purpose: str = "chat",
+        **kwargs: Any
+    ) -> str:
+        """
+        Generate a completion for arbitrary chat messages.
+
+        Args:
+            messages: List of message dictionaries
+            purpose: What the call is made for, recorded in the usage ledger
+            **kwargs: Additional parameters for completion (model, temperature, max_tokens)
+
+        Returns:
+            str: Completion content
+
+        Raises:
+            OpenAIError: If API request fails
+        """
+        result = await self._make_request(messages, purpose=purpose, **kwargs)
+        return result.content
 
     async def summarize_paper(
         self,
@@ -131,6 +701,32 @@ class OpenAIClient:
         Returns:
             Dict[Language, str]: Dictionary mapping languages to their summaries
 
+        Raises:
+            OpenAIError: If API request fails
+            ValueError: If abstract is empty or invalid language specified
+        """
+        results = await self.summarize_paper_with_usage(abstract, languages, custom_prompts, **kwargs)
+        return {lang: result.content for lang, result in results.items()}
+
+    async def summarize_paper_with_usage(
+        self,
+        abstract: str,
+        languages: Optional[List[Language]] = None,
+        custom_prompts: Optional[Dict[Language, str]] = None,
+        **kwargs: Any
+    ) -> Dict[Language, CompletionResult]:
+        """
+        Generate summaries of a paper abstract along with per-call token usage and latency.
+
+        Args:
+            abstract: Paper abstract text
+            languages: List of languages to generate summaries in (defaults to [EN, RU])
+            custom_prompts: Optional dictionary of custom prompts by language
+            **kwargs: Additional parameters for completion (temperature, max_tokens)
+
+        Returns:
+            Dict[Language, CompletionResult]: Dictionary mapping languages to their results
+
         Raises:
             OpenAIError: If API request fails
             ValueError: If abstract is empty or invalid language specified
@@ -139,22 +735,22 @@ class OpenAIClient:
             raise ValueError("Abstract cannot be empty")
 
         languages = languages or [Language.EN, Language.RU]
-        summaries = {}
+        results = {}
 
         for lang in languages:
             try:
-                prompt = (custom_prompts or {}).get(lang) or ARTICLE_SUMMARY_PROMPTS[lang]
-                messages = [
-                    {"role": "system", "content": SYSTEM_PROMPTS[lang]},
-                    {"role": "user", "content": prompt.format(abstract=abstract)}
-                ]
-                summaries[lang] = await self._make_request(messages, **kwargs)
+                messages = self._build_summary_messages(abstract, lang, custom_prompts)
+                results[lang] = await self._make_request(
+                    messages, **self._summary_kwargs(kwargs, self.structured_output and not custom_prompts)
+                )
+            except OpenAIError as e:
+                self.logger.error(f"Error generating {lang.value} summary: {e}")
+                raise
             except Exception as e:
                 self.logger.error(f"Error generating {lang.value} summary: {e}")
                 raise OpenAIError(f"Error generating {lang.value} summary: {e}")
 
-        return summaries
-
+        return results
 
 if __name__ == "__main__":
     import os
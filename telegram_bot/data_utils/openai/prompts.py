@@ -1,5 +1,6 @@
 """Module containing prompts for OpenAI interactions."""
 
+import hashlib
 from enum import Enum
 from typing import Dict
 
@@ -9,6 +10,17 @@ class Language(Enum):
     EN = "english"
     RU = "russian"
 
+    @property
+    def code(self) -> str:
+        """Two-letter language code used in storage and user settings."""
+        return LANGUAGE_CODES[self]
+
+
+LANGUAGE_CODES: Dict[Language, str] = {
+    Language.EN: "en",
+    Language.RU: "ru",
+}
+
 
 ARTICLE_SUMMARY_PROMPTS: Dict[Language, str] = {
     Language.EN: """You are a scientific paper summarizer. Your task is to create a clear, concise summary of the provided research paper. 
@@ -49,6 +61,38 @@ Paper abstract:
 """
 }
 
+STRUCTURED_SUMMARY_PROMPTS: Dict[Language, str] = {
+    Language.EN: """You are a scientific paper summarizer. Summarize the provided research paper as a JSON object with exactly these keys:
+"objective": one sentence on the main research goal
+"method": one sentence on the key methodology
+"results": one sentence on the main findings
+
+Guidelines:
+- Use simple, clear language and avoid technical jargon unless essential
+- Be specific and concrete
+- Keep every value under 40 words
+- Respond with the JSON object only
+
+Paper abstract:
+{abstract}
+""",
+    Language.RU: """You are a scientific paper summarizer. Summarize the provided research paper in Russian as a JSON object with exactly these keys:
+"objective": one sentence on the main research goal
+"method": one sentence on the key methodology
+"results": one sentence on the main findings
+
+Guidelines:
+- Use simple, clear language and avoid technical jargon unless essential
+- Be specific and concrete
+- Keep every value under 40 words
+- Write the values in Russian, keep the keys in English
+- Respond with the JSON object only
+
+Paper abstract:
+{abstract}
+"""
+}
+
 SYSTEM_PROMPTS: Dict[Language, str] = {
     Language.EN: """You are a specialized AI research assistant focused on academic paper summarization. Your core strengths are:
 1. Identifying the key points in complex research
@@ -67,3 +111,60 @@ Always maintain a professional, clear, and helpful tone.""",
 Always maintain a professional, clear, and helpful tone. Provide responses in Russian."""
 }
 
+
+TRANSLATION_SYSTEM_PROMPT = """You are a professional translator of scientific texts. Translate faithfully and concisely, keeping technical terms accurate."""
+
+TRANSLATION_PROMPT = """Translate the following research paper summary into {language}.
+
+Keep the structure, emojis and line breaks exactly as they are. Do not add, remove or explain anything.
+
+Summary:
+{summary}
+"""
+
+STRUCTURED_TRANSLATION_PROMPT = """Translate the values of the following JSON object with a research paper summary into {language}.
+
+Respond with a JSON object with the same keys. Keep the keys in English and do not add, remove or explain anything.
+
+Summary:
+{summary}
+"""
+
+
+def summary_prompt_version(structured: bool, translated: bool = False) -> str:
+    """
+    Get a short hash of the prompts summaries are created with.
+
+    It changes whenever one of those prompts is edited, so summaries created
+    with older prompts can be found and recreated.
+
+    Args:
+        structured: Whether summaries are requested as JSON fields
+        translated: Whether summaries are translated from the English one
+
+    Returns:
+        str: Prompt version
+    """
+    summary_prompts = STRUCTURED_SUMMARY_PROMPTS if structured else ARTICLE_SUMMARY_PROMPTS
+    digest = hashlib.sha256()
+    for lang in Language:
+        digest.update(summary_prompts[lang].encode())
+        digest.update(SYSTEM_PROMPTS[lang].encode())
+    if translated:
+        translation_prompt = STRUCTURED_TRANSLATION_PROMPT if structured else TRANSLATION_PROMPT
+        digest.update(TRANSLATION_SYSTEM_PROMPT.encode())
+        digest.update(translation_prompt.encode())
+    return digest.hexdigest()[:12]
+
+
+DIGEST_SYSTEM_PROMPT = """You are a research editor writing short digests of recent machine learning papers for a Telegram channel."""
+
+DIGEST_MAP_PROMPT = """Summarize these {count} papers concisely, one short paragraph per paper, focusing on key findings{focus}. Keep each paper's link.
+
+{papers}
+"""
+
+DIGEST_REDUCE_PROMPT = """Write an overall {period} digest of the recent papers summarized below, highlighting important trends{focus}. Mention the most notable papers with their links.
+
+{summaries}
+"""
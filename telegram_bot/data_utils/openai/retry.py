@@ -0,0 +1,115 @@
+"""Module for the OpenAI retry policy and the process-wide circuit breaker."""
+
+import logging
+import time
+from typing import Optional
+
+from tenacity import RetryCallState, wait_random_exponential
+
+
+class CircuitBreaker:
+    """
+    Stops calls to an API that keeps failing.
+
+    After ``failure_threshold`` consecutive failures (5xx, 429, timeouts) the
+    breaker opens and every call fails fast for ``reset_timeout`` seconds, or
+    for the server's Retry-After if that is longer. Then a single probe call is
+    let through: its success closes the breaker, its failure opens it again.
+    A probe that does not report back within ``reset_timeout`` is replaced by
+    a new one.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a probe call
+            logger: Optional logger instance
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.logger = logger or logging.getLogger(__name__)
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_until = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the open breaker lets a probe call through."""
+        return max(0.0, self._opened_until - time.monotonic())
+
+    def allow_call(self) -> bool:
+        """
+        Check whether a call may be made now.
+
+        Returns:
+            bool: False while the breaker is open or a probe call is already in flight
+        """
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now >= self._opened_until:
+            self.state = self.HALF_OPEN
+            self._opened_until = now + self.reset_timeout
+            self.logger.info("OpenAI circuit breaker half-open, sending a probe call")
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self.state != self.CLOSED:
+            self.logger.info("OpenAI circuit breaker closed")
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """
+        Count a failed call, opening the breaker once failures are sustained.
+
+        Args:
+            retry_after: Server's retry hint of the failed call, in seconds
+        """
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            open_for = max(self.reset_timeout, retry_after or 0.0)
+            self._opened_until = time.monotonic() + open_for
+            if self.state != self.OPEN:
+                self.logger.warning(
+                    f"OpenAI circuit breaker open for {open_for:.1f}s after {self._failures} failures"
+                )
+            self.state = self.OPEN
+
+
+class WaitRetryAfterOrJitter:
+    """
+    Tenacity wait strategy honouring the server's Retry-After.
+
+    Falls back to exponential backoff with full jitter, so concurrent callers
+    that failed together do not retry in lockstep.
+    """
+
+    def __init__(self, multiplier: float = 1.0, max_wait: float = 60.0) -> None:
+        self.max_wait = max_wait
+        self._jitter = wait_random_exponential(multiplier=multiplier, max=max_wait)
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_wait)
+        return self._jitter(retry_state)
+
+
+# Shared by every OpenAIClient of the process, so an outage seen by one caller stops all of them
+openai_circuit_breaker = CircuitBreaker()
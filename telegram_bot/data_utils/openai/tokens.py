@@ -0,0 +1,77 @@
+"""Module for token counting and token-budgeted input truncation."""
+
+from functools import lru_cache
+import re
+
+import tiktoken
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Truncation prefers to cut at the last paragraph or sentence break
+# inside this fraction of the budget, so the input does not end mid-sentence.
+_BOUNDARY_WINDOW = 0.2
+_BOUNDARY_RE = re.compile(r"\n\s*\n|(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoding for a model, loading it once per process.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        tiktoken.Encoding: The model encoding, or the default one for unknown models
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count the tokens a text takes for a given model.
+
+    Args:
+        text: Text to count
+        model: OpenAI model name
+
+    Returns:
+        int: Number of tokens
+    """
+    return len(get_encoding(model).encode(text, disallowed_special=()))
+
+
+def truncate_to_budget(text: str, max_tokens: int, model: str) -> str:
+    """
+    Deterministically truncate a text to a token budget.
+
+    The text is cut at the budget, then moved back to the last paragraph or
+    sentence break if one is close enough to the end.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: OpenAI model name
+
+    Returns:
+        str: The text itself if it fits, otherwise its truncated prefix
+    """
+    if max_tokens <= 0:
+        return ""
+
+    encoding = get_encoding(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    head = encoding.decode(tokens[:max_tokens])
+
+    window_start = int(len(head) * (1 - _BOUNDARY_WINDOW))
+    last_break = None
+    for match in _BOUNDARY_RE.finditer(head, window_start):
+        last_break = match.start()
+    if last_break:
+        head = head[:last_break]
+    return head.rstrip()
@@ -0,0 +1,348 @@
+"""Module for recording OpenAI token usage and enforcing a daily token budget."""
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from telegram_bot.db.db_api.storages.base import BaseConnection
+
+# Whether OpenAI calls made in the current task serve a waiting user.
+# Background jobs switch it off with ``background_usage``.
+_interactive: ContextVar[bool] = ContextVar("openai_interactive", default=True)
+
+
+@contextmanager
+def background_usage() -> Iterator[None]:
+    """Mark OpenAI calls made inside the block, and tasks it spawns, as background work."""
+    token = _interactive.set(False)
+    try:
+        yield
+    finally:
+        _interactive.reset(token)
+
+
+def is_interactive() -> bool:
+    """Whether OpenAI calls in the current context serve a waiting user."""
+    return _interactive.get()
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class UsageRecord:
+    """Token usage of a single OpenAI call, or a count of summaries served from the database."""
+    model: str
+    purpose: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+    cache_hit: bool = False
+    calls: int = 1
+    interactive: bool = field(default_factory=is_interactive)
+    created_at: datetime = field(default_factory=_utc_now)
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_row(self) -> Tuple:
+        """Convert the record to query parameters of the insert statement."""
+        return (
+            self.created_at,
+            self.model,
+            self.purpose,
+            self.prompt_tokens,
+            self.completion_tokens,
+            round(self.latency_ms),
+            self.cache_hit,
+            self.interactive,
+            self.calls,
+        )
+
+
+class UsageLedger:
+    """
+    Buffers usage records in memory and writes them to Postgres in batches.
+
+    ``record`` never touches the database, so it can be called on every
+    request; the buffer is flushed every ``flush_interval`` seconds or as
+    soon as it holds ``batch_size`` records. Cache hits are only counted,
+    and written as one row per model and purpose on every flush. The day's token total is
+    re-read from the table after every periodic flush, so it covers the
+    usage of all processes.
+    """
+
+    def __init__(
+        self,
+        db: BaseConnection,
+        flush_interval: float = 10.0,
+        batch_size: int = 200,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            db: Database connection instance implementing BaseConnection
+            flush_interval: Seconds between periodic flushes
+            batch_size: Number of buffered records that triggers an early flush
+            logger: Optional logger instance
+        """
+        self.db = db
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+        self._buffer: List[UsageRecord] = []
+        # (model, purpose, interactive) -> summaries served from the database since the last flush
+        self._cache_hits: Dict[Tuple[str, str, bool], int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+        self._day = _utc_now().date()
+        self._tokens_today = 0
+
+    async def init_table(self) -> None:
+        """
+        Create openai_usage table if it doesn't exist and load today's token total.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS openai_usage (
+            created_at TIMESTAMP NOT NULL,
+            model TEXT NOT NULL,
+            purpose TEXT NOT NULL,
+            prompt_tokens INTEGER NOT NULL,
+            completion_tokens INTEGER NOT NULL,
+            latency_ms INTEGER NOT NULL,
+            cache_hit BOOLEAN NOT NULL,
+            interactive BOOLEAN NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 1
+        );
+        ALTER TABLE openai_usage ADD COLUMN IF NOT EXISTS calls INTEGER NOT NULL DEFAULT 1;
+        CREATE INDEX IF NOT EXISTS openai_usage_created_at_idx
+            ON openai_usage USING BRIN (created_at);
+        """
+        await self.db._execute(create_table_sql)
+        await self.refresh_tokens_today()
+
+    async def refresh_tokens_today(self) -> None:
+        """
+        Re-read today's token total from openai_usage.
+
+        The bot and every worker replica keep their own ledger, so the total
+        is re-read after each periodic flush to include the usage the other
+        processes have written.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sql = """
+        SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0) AS tokens
+        FROM openai_usage
+        WHERE created_at >= $1;
+        """
+        # Held so records cannot move from the buffer to the table while the total is read
+        async with self._flush_lock:
+            day = _utc_now().date()
+            result = await self.db._fetchrow(sql, (datetime.combine(day, datetime.min.time()),))
+            self._day = day
+            self._tokens_today = result.data['tokens'] + sum(
+                record.total_tokens for record in self._buffer if record.created_at.date() == day
+            )
+
+    @property
+    def tokens_today(self) -> int:
+        """Tokens used since UTC midnight, including records not flushed yet."""
+        self._roll_day()
+        return self._tokens_today
+
+    def _roll_day(self) -> None:
+        today = _utc_now().date()
+        if today != self._day:
+            self._day = today
+            self._tokens_today = 0
+
+    def record(self, record: UsageRecord) -> None:
+        """
+        Buffer a usage record.
+
+        Args:
+            record: Usage of one call
+        """
+        self._roll_day()
+        self._tokens_today += record.total_tokens
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    def record_cache_hit(self, model: str, purpose: str) -> None:
+        """
+        Count a result served from the database instead of an OpenAI call.
+
+        Args:
+            model: Model the call would have used
+            purpose: What the call would have been made for
+        """
+        key = (model, purpose, is_interactive())
+        self._cache_hits[key] = self._cache_hits.get(key, 0) + 1
+
+    async def flush(self) -> None:
+        """
+        Write buffered records with a single batched insert.
+
+        Records are put back into the buffer if the insert fails, so they are
+        retried on the next flush.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        async with self._flush_lock:
+            cache_hits, self._cache_hits = self._cache_hits, {}
+            self._buffer.extend(
+                UsageRecord(model=model, purpose=purpose, cache_hit=True, interactive=interactive, calls=calls)
+                for (model, purpose, interactive), calls in cache_hits.items()
+            )
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            sql = """
+            INSERT INTO openai_usage (
+                created_at, model, purpose, prompt_tokens, completion_tokens,
+                latency_ms, cache_hit, interactive, calls
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9);
+            """
+            try:
+                await self.db._execute(sql, [record.to_row() for record in batch])
+            except Exception as e:
+                self.logger.error(f"Error writing {len(batch)} usage records: {e}")
+                self._buffer = batch + self._buffer
+
+    def start(self) -> None:
+        """Start flushing the buffer periodically if it is not running yet."""
+        if self._periodic_task is None or self._periodic_task.done():
+            self._periodic_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write the remaining records."""
+        if self._periodic_task is not None:
+            self._periodic_task.cancel()
+            await asyncio.gather(self._periodic_task, return_exceptions=True)
+            self._periodic_task = None
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            try:
+                await self.refresh_tokens_today()
+            except Exception as e:
+                self.logger.error(f"Error reading today's token usage: {e}")
+
+
+class DailyTokenBudget:
+    """
+    Throttles background OpenAI calls as the day's token usage approaches a budget.
+
+    Below ``slowdown_ratio`` of the budget calls pass immediately. Above it,
+    background calls are delayed progressively, up to ``max_delay`` seconds
+    right before the limit, and once the budget is spent they are paused
+    until UTC midnight. Interactive calls are never held back.
+    """
+
+    def __init__(
+        self,
+        ledger: UsageLedger,
+        daily_tokens: int,
+        slowdown_ratio: float = 0.8,
+        max_delay: float = 30.0,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            ledger: Ledger the day's usage is read from
+            daily_tokens: Tokens allowed per UTC day
+            slowdown_ratio: Fraction of the budget after which background calls are delayed
+            max_delay: Longest delay before a background call while under the budget
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If daily_tokens is not positive or slowdown_ratio is not in (0, 1]
+        """
+        if daily_tokens <= 0:
+            raise ValueError("Daily token budget must be positive")
+        if not 0.0 < slowdown_ratio <= 1.0:
+            raise ValueError("Slowdown ratio must be between 0.0 and 1.0")
+
+        self.ledger = ledger
+        self.daily_tokens = daily_tokens
+        self.slowdown_ratio = slowdown_ratio
+        self.max_delay = max_delay
+        self.logger = logger or logging.getLogger(__name__)
+
+    def delay(self) -> Optional[float]:
+        """
+        Get how long a background call should wait before it is sent.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the budget is spent
+        """
+        used = self.ledger.tokens_today / self.daily_tokens
+        if used >= 1.0:
+            return None
+        if used < self.slowdown_ratio:
+            return 0.0
+        return self.max_delay * (used - self.slowdown_ratio) / (1.0 - self.slowdown_ratio)
+
+    async def admit(self) -> None:
+        """
+        Wait until the current call may be sent under the budget.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if is_interactive():
+            return
+
+        while True:
+            delay = self.delay()
+            if delay is None:
+                now = _utc_now()
+                until_midnight = (datetime.combine(now.date() + timedelta(days=1), datetime.min.time()) - now)
+                self.logger.warning(
+                    f"Daily token budget of {self.daily_tokens} spent, "
+                    f"pausing background summarization for {until_midnight}"
+                )
+                await asyncio.sleep(min(until_midnight.total_seconds(), 300.0))
+                continue
+            if delay > 0:
+                self.logger.info(
+                    f"{self.ledger.tokens_today}/{self.daily_tokens} daily tokens used, "
+                    f"delaying background call by {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+            return
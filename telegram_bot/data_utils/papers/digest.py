@@ -0,0 +1,308 @@
+"""Module for map-reduce digests over many papers."""
+
+import asyncio
+import hashlib
+import logging
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from telegram_bot.data_utils.openai import OpenAIClient, background_usage
+from telegram_bot.data_utils.openai.prompts import (
+    DIGEST_MAP_PROMPT,
+    DIGEST_REDUCE_PROMPT,
+    DIGEST_SYSTEM_PROMPT
+)
+from telegram_bot.data_utils.openai.tokens import count_tokens, truncate_to_budget
+from telegram_bot.db.db_api.storages.base import BaseConnection
+from telegram_bot.models import SummaryFields
+
+if TYPE_CHECKING:
+    from telegram_bot.data_utils.huggingface.huggingface_db import HuggingFaceDB
+
+DIGEST_PERIODS: Dict[str, int] = {
+    "daily": 1,
+    "weekly": 7,
+}
+
+
+class DigestEngine:
+    """
+    Summarizes a list of papers with a map step over token-sized batches and a reduce step.
+
+    Map batches run concurrently, up to ``max_concurrency`` at a time, and are
+    packed to ``batch_token_budget`` prompt tokens rather than a fixed number
+    of papers. If the map summaries are too long for one reduce prompt, they
+    are reduced in groups first. Every completion is cached by a hash of its
+    prompt, in memory and in the ``digest_cache`` table if a database is
+    given, so a digest that fails in the reduce step does not redo the map
+    when it is retried.
+    """
+
+    def __init__(
+        self,
+        openai_client: OpenAIClient,
+        db: Optional[BaseConnection] = None,
+        max_concurrency: int = 4,
+        batch_token_budget: int = 3000,
+        paper_token_budget: int = 400,
+        reduce_token_budget: int = 6000,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            openai_client: Client used for the completions
+            db: Optional database connection used to persist intermediate results
+            max_concurrency: Maximum number of map completions running at once
+            batch_token_budget: Maximum tokens of paper text in one map prompt
+            paper_token_budget: Maximum tokens of a single paper's abstract or summary
+            reduce_token_budget: Maximum tokens of summaries in one reduce prompt
+            logger: Optional logger instance
+        """
+        self.openai_client = openai_client
+        self.db = db
+        self.batch_token_budget = batch_token_budget
+        self.paper_token_budget = paper_token_budget
+        self.reduce_token_budget = reduce_token_budget
+        self.logger = logger or logging.getLogger(__name__)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._memory_cache: Dict[str, str] = {}
+        self._table_ready = False
+
+    async def init_table(self) -> None:
+        """
+        Create digest_cache table if it doesn't exist.
+
+        Called before the first cache lookup, so callers do not need to.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.db is None or self._table_ready:
+            return
+        create_table_sql = """
+        CREATE TABLE IF NOT EXISTS digest_cache (
+            cache_key TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+        await self.db._execute(create_table_sql)
+        self._table_ready = True
+
+    def _paper_text(self, paper: Dict) -> str:
+        """
+        Format a paper for a map prompt, truncating its content to the per-paper budget.
+
+        The structured summary fields are used when the paper has them, as they
+        are shorter than the abstract, otherwise the abstract.
+
+        Args:
+            paper: Paper with title, url (or link), abstract and optional summary_fields
+
+        Returns:
+            str: Paper text
+        """
+        fields: Optional[SummaryFields] = paper.get('summary_fields')
+        content = fields.render() if fields else f"Abstract: {paper.get('abstract') or ''}"
+        content = truncate_to_budget(content, self.paper_token_budget, self.openai_client.model)
+        link = paper.get('url') or paper.get('link') or ""
+        return f"Title: {paper['title']}\nLink: {link}\n{content}"
+
+    def pack(self, texts: List[str], token_budget: int) -> List[List[str]]:
+        """
+        Pack texts in order into groups that fit a token budget.
+
+        A text larger than the budget gets a group of its own.
+
+        Args:
+            texts: Texts to pack
+            token_budget: Maximum tokens of a group
+
+        Returns:
+            List[List[str]]: Groups of texts
+        """
+        groups: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text, self.openai_client.model)
+            if current and current_tokens + tokens > token_budget:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _complete(self, prompt: str, purpose: str) -> str:
+        """
+        Get a completion for a prompt, reusing a cached one if the same prompt was completed before.
+
+        Args:
+            prompt: User prompt
+            purpose: What the call is made for, recorded in the usage ledger
+
+        Returns:
+            str: Completion content
+        """
+        key = hashlib.sha256(
+            f"{self.openai_client.model}\n{DIGEST_SYSTEM_PROMPT}\n{prompt}".encode()
+        ).hexdigest()
+        if key in self._memory_cache:
+            return self._memory_cache[key]
+        if self.db is not None:
+            await self.init_table()
+            result = await self.db._fetchrow("SELECT content FROM digest_cache WHERE cache_key = $1;", (key,))
+            if result.data:
+                self._memory_cache[key] = result.data['content']
+                return result.data['content']
+
+        async with self._semaphore:
+            content = await self.openai_client.generate_chat_completion([
+                {"role": "system", "content": DIGEST_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ], purpose=purpose)
+
+        self._memory_cache[key] = content
+        if self.db is not None:
+            sql = """
+            INSERT INTO digest_cache (cache_key, content)
+            VALUES ($1, $2)
+            ON CONFLICT (cache_key) DO NOTHING;
+            """
+            await self.db._execute(sql, (key, content))
+        return content
+
+    async def _map(self, papers: List[Dict], focus: str) -> List[str]:
+        """
+        Summarize token-sized batches of papers concurrently.
+
+        Args:
+            papers: Papers to summarize
+            focus: Focus clause appended to the prompts
+
+        Returns:
+            List[str]: Batch summaries in paper order
+        """
+        batches = self.pack([self._paper_text(paper) for paper in papers], self.batch_token_budget)
+        self.logger.info(f"Summarizing {len(papers)} papers in {len(batches)} batches")
+        return list(await asyncio.gather(*(
+            self._complete(
+                DIGEST_MAP_PROMPT.format(count=len(batch), focus=focus, papers="\n\n".join(batch)),
+                purpose="digest_map"
+            )
+            for batch in batches
+        )))
+
+    async def _reduce(self, summaries: List[str], period: str, focus: str) -> str:
+        """
+        Combine batch summaries into one digest, reducing them in groups first if they do not fit one prompt.
+
+        Args:
+            summaries: Batch summaries
+            period: Digest period used in the prompt, e.g. "daily"
+            focus: Focus clause appended to the prompts
+
+        Returns:
+            str: The digest
+        """
+        groups = self.pack(summaries, self.reduce_token_budget)
+        while len(groups) > 1:
+            summaries = list(await asyncio.gather(*(
+                self._complete(
+                    DIGEST_REDUCE_PROMPT.format(period=period, focus=focus, summaries="\n\n".join(group)),
+                    purpose="digest_reduce"
+                )
+                for group in groups
+            )))
+            groups = self.pack(summaries, self.reduce_token_budget)
+        return await self._complete(
+            DIGEST_REDUCE_PROMPT.format(period=period, focus=focus, summaries="\n\n".join(groups[0])),
+            purpose="digest_reduce"
+        )
+
+    async def summarize(self, papers: List[Dict], period: str = "", focus: Optional[str] = None) -> str:
+        """
+        Summarize a list of papers into one digest.
+
+        Args:
+            papers: Papers with title, url (or link) and abstract
+            period: Digest period used in the prompt, e.g. "daily"
+            focus: Optional topic the digest should focus on
+
+        Returns:
+            str: The digest
+
+        Raises:
+            ValueError: If no papers are given
+            OpenAIError: If a completion fails; completed batches are reused on retry
+        """
+        if not papers:
+            raise ValueError("Papers cannot be empty")
+        focus_clause = f" and {focus}" if focus else ""
+        summaries = await self._map(papers, focus_clause)
+        return await self._reduce(summaries, period, focus_clause)
+
+    async def build_digest(
+        self,
+        hf_db: "HuggingFaceDB",
+        period: str = "daily",
+        end_date: Optional[date] = None,
+        max_papers: int = 50,
+        focus: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Build the digest of the papers published in a day or a week.
+
+        Args:
+            hf_db: Database access to the papers
+            period: "daily" or "weekly"
+            end_date: Last day of the period (defaults to today)
+            max_papers: Maximum number of papers, most upvoted first
+            focus: Optional topic the digest should focus on
+
+        Returns:
+            Optional[str]: The digest or None if no papers were published in the period
+
+        Raises:
+            ValueError: If the period is not supported
+        """
+        if period not in DIGEST_PERIODS:
+            raise ValueError(f"Unsupported digest period: {period}")
+
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=DIGEST_PERIODS[period] - 1)
+        papers = await hf_db.get_papers_by_date_range(start_date.isoformat(), end_date.isoformat())
+        if not papers:
+            return None
+
+        papers = sorted(papers, key=lambda paper: paper.get('upvotes') or 0, reverse=True)[:max_papers]
+        papers = await self._with_summary_fields(hf_db, papers)
+        with background_usage():
+            return await self.summarize(papers, period=period, focus=focus)
+
+    async def _with_summary_fields(self, hf_db: "HuggingFaceDB", papers: List[Dict]) -> List[Dict]:
+        """
+        Attach the stored English summary fields to papers, in one query.
+
+        Args:
+            hf_db: Database access to the papers
+            papers: Papers with id
+
+        Returns:
+            List[Dict]: Copies of the papers with summary_fields, None for papers without them
+        """
+        sql = """
+        SELECT paper_id, summary_fields -> 'en' AS fields
+        FROM paper_summaries
+        WHERE paper_id = ANY($1::TEXT[]) AND summary_fields -> 'en' IS NOT NULL;
+        """
+        result = await hf_db.db._fetch(sql, ([paper['id'] for paper in papers],))
+        fields = {row['paper_id']: SummaryFields(**row['fields']) for row in result.data}
+        return [{**paper, 'summary_fields': fields.get(paper['id'])} for paper in papers]
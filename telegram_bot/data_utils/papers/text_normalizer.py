@@ -0,0 +1,142 @@
+"""Module for normalizing paper texts before embedding them."""
+
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import FrozenSet, Iterable, List, Optional
+
+import nltk
+
+from telegram_bot.data import config
+
+logger = logging.getLogger(__name__)
+
+# Words, including inner hyphens and apostrophes, and standalone punctuation.
+# Splits like nltk's word_tokenize for the texts we embed, without needing punkt.
+_TOKEN_RE = re.compile(r"\w+(?:[-'’]\w+)*|[^\w\s]")
+
+
+@lru_cache(maxsize=None)
+def load_stopwords(data_dir: str = config.NLTK_DATA_DIR, language: str = "english") -> FrozenSet[str]:
+    """
+    Load the stopword list once per process from the local NLTK data directory.
+
+    The list is downloaded into that directory only if it is missing there,
+    images bundle it at build time.
+
+    Args:
+        data_dir: Directory with the NLTK data
+        language: Stopword list language
+
+    Returns:
+        FrozenSet[str]: Lowercase stopwords
+    """
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+    try:
+        words = nltk.corpus.stopwords.words(language)
+    except LookupError:
+        logger.warning(f"NLTK stopwords not found in {data_dir}, downloading them")
+        nltk.download("stopwords", download_dir=data_dir, quiet=True)
+        words = nltk.corpus.stopwords.words(language)
+    return frozenset(word.lower() for word in words)
+
+
+class TextNormalizer:
+    """Removes stopwords and caps the length of texts with a precompiled tokenizer and a preloaded stopword set."""
+
+    def __init__(self, stop_words: Optional[FrozenSet[str]] = None) -> None:
+        """
+        Initialize the normalizer.
+
+        Args:
+            stop_words: Stopwords to remove (defaults to the English NLTK list)
+        """
+        self.stop_words = stop_words if stop_words is not None else load_stopwords()
+
+    def tokens(self, text: str) -> List[str]:
+        """
+        Split a text into tokens without its stopwords.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            List[str]: Remaining tokens
+        """
+        stop_words = self.stop_words
+        return [token for token in _TOKEN_RE.findall(text) if token.lower() not in stop_words]
+
+    def normalize(self, text: str, max_words: Optional[int] = None) -> str:
+        """
+        Remove the stopwords of a text and keep at most ``max_words`` tokens.
+
+        Args:
+            text: Text to normalize
+            max_words: Optional maximum number of tokens
+
+        Returns:
+            str: Normalized text
+        """
+        tokens = self.tokens(text)
+        if max_words is not None:
+            tokens = tokens[:max_words]
+        return " ".join(tokens)
+
+    def normalize_batch(
+        self,
+        texts: Iterable[str],
+        max_words: Optional[int] = None,
+        processes: Optional[int] = None,
+        chunksize: int = 64
+    ) -> List[str]:
+        """
+        Normalize many texts, optionally spread over a process pool.
+
+        Pool workers load the stopword set once when they start, not per text.
+        A pool only pays off for thousands of texts, so by default the batch is
+        processed in the calling process.
+
+        Args:
+            texts: Texts to normalize
+            max_words: Optional maximum number of tokens per text
+            processes: Number of worker processes, None or 1 to normalize in this process
+            chunksize: Number of texts sent to a worker at once
+
+        Returns:
+            List[str]: Normalized texts in input order
+        """
+        if not processes or processes <= 1:
+            return [self.normalize(text, max_words) for text in texts]
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self.stop_words,)
+        ) as pool:
+            return list(pool.map(_normalize_in_worker, texts, repeat(max_words), chunksize=chunksize))
+
+
+_worker_normalizer: Optional[TextNormalizer] = None
+
+
+def _init_worker(stop_words: FrozenSet[str]) -> None:
+    global _worker_normalizer
+    _worker_normalizer = TextNormalizer(stop_words)
+
+
+def _normalize_in_worker(text: str, max_words: Optional[int] = None) -> str:
+    return _worker_normalizer.normalize(text, max_words)
+
+
+@lru_cache(maxsize=None)
+def get_text_normalizer() -> TextNormalizer:
+    """
+    Get the process-wide normalizer, loading its resources on first use.
+
+    Returns:
+        TextNormalizer: Shared normalizer
+    """
+    return TextNormalizer()
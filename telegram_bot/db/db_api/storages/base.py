@@ -1,4 +1,6 @@
 import typing
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AbstractAsyncContextManager
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -52,3 +54,30 @@ class BaseConnection:
         con: Any | None = None,
     ) -> None:
         raise NotImplementedError
+
+    async def _copy_records(
+        self,
+        table: str,
+        records: Iterable[tuple[Any, ...]],
+        columns: list[str],
+        con: Any | None = None,
+    ) -> None:
+        raise NotImplementedError
+
+    def _transaction(self) -> AbstractAsyncContextManager[Any]:
+        raise NotImplementedError
+
+    def _listen(
+        self,
+        channel: str,
+        callback: Callable[[Any, int, str, str], None],
+    ) -> AbstractAsyncContextManager[Any]:
+        raise NotImplementedError
+
+    def _iterate(
+        self,
+        sql: str,
+        params: tuple[Any, ...] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        raise NotImplementedError
@@ -1,5 +1,7 @@
 import json
 import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
 from typing import Any, TypeVar
 
 import asyncpg
@@ -165,3 +167,77 @@ class PostgresConnection(BaseConnection):
                 "Finished query to DB",
                 spent_time_ms=(time.monotonic() - st) * 1000,
             )
+
+    async def _copy_records(
+        self,
+        table: str,
+        records: Iterable[tuple[Any, ...]],
+        columns: list[str],
+        con: asyncpg.Connection | None = None,
+    ) -> None:
+        st = time.monotonic()
+        # Records are not bound to the logger, a COPY batch can hold millions of values
+        request_logger = self._logger.bind(table=table, columns=columns)
+        request_logger.debug("Copying records to DB")
+        try:
+            if con is None:
+                async with self._pool.acquire() as local_con:
+                    await local_con.copy_records_to_table(table, records=records, columns=columns)
+            else:
+                await con.copy_records_to_table(table, records=records, columns=columns)
+        except Exception as e:
+            request_logger = request_logger.bind(error=e)
+            request_logger.exception("Error while copying records")
+            raise
+        finally:
+            request_logger.debug(
+                "Finished copying records to DB",
+                spent_time_ms=(time.monotonic() - st) * 1000,
+            )
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        async with self._pool.acquire() as connection:
+            async with connection.transaction():
+                yield connection
+
+    @asynccontextmanager
+    async def _listen(
+        self,
+        channel: str,
+        callback: Callable[[asyncpg.Connection, int, str, str], None],
+    ) -> AsyncIterator[asyncpg.Connection]:
+        # LISTEN holds its connection, it is taken out of the pool until the block exits
+        async with self._pool.acquire() as connection:
+            await connection.add_listener(channel, callback)
+            try:
+                yield connection
+            finally:
+                await connection.remove_listener(channel, callback)
+
+    async def _iterate(
+        self,
+        sql: str,
+        params: tuple[Any, ...] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        # Rows are read through a server-side cursor, only one batch is held in memory at a time
+        st = time.monotonic()
+        request_logger = self._logger.bind(sql=sql, params=params)
+        request_logger.debug("Iterating query from DB")
+        try:
+            async with self._pool.acquire() as connection:
+                await self.apply_connection_types_codecs(connection)
+                async with connection.transaction(isolation="repeatable_read", readonly=True):
+                    cursor = await connection.cursor(sql, *(params or ()))
+                    while rows := await cursor.fetch(batch_size):
+                        yield [{**row} for row in rows]
+        except Exception as e:
+            request_logger = request_logger.bind(error=e)
+            request_logger.exception("Error while iterating query")
+            raise
+        finally:
+            request_logger.debug(
+                "Finished iterating query from DB",
+                spent_time_ms=(time.monotonic() - st) * 1000,
+            )
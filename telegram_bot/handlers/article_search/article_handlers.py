@@ -1,20 +1,35 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from aiogram_dialog import DialogManager
 
 from telegram_bot.states.article import ArticleSG
 
-import asyncio
-from telegram_bot.data_utils.huggingface import HuggingFaceAPI
+from telegram_bot.data_utils.huggingface import HuggingFaceManager, get_huggingface_manager
 
-# Initialize HuggingFaceAPI
-huggingface_api = HuggingFaceAPI()
+ARTICLES_LIMIT = 30
 
-async def fetch_articles() -> List[Dict[str, Any]]:
-    await huggingface_api.fetch_daily_papers()
-    return huggingface_api.papers_data
+# Latest articles, read from the database the first time the dialog is shown
+articles: List[Dict[str, Any]] = []
+# Created once, every manager starts its own background tasks
+manager: Optional[HuggingFaceManager] = None
 
-# Get articles
-articles: List[Dict[str, Any]] = asyncio.run(fetch_articles())
+async def load_articles(dialog_manager: DialogManager) -> None:
+    """
+    Read the latest articles stored by the ingestion worker, once.
+
+    Args:
+        dialog_manager (DialogManager): Dialog manager instance
+    Returns:
+        None
+    """
+    global manager
+    if articles:
+        return
+    if manager is None:
+        manager = await get_huggingface_manager(
+            db_pool=dialog_manager.middleware_data.get("db_pool"),
+            redis=dialog_manager.middleware_data.get("cache_pool"),
+        )
+    articles[:] = await manager.get_latest_papers(limit=ARTICLES_LIMIT)
 
 async def get_article_by_index(index: int) -> Dict[str, Any]:
     """
@@ -41,6 +56,7 @@ async def actions(dialog_manager: DialogManager, **kwargs) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Product information for the current index
     """
+    await load_articles(dialog_manager)
     index = dialog_manager.dialog_data.get("index", 0)
     article = await get_article_by_index(index)
     state = dialog_manager.current_context().state
@@ -10,7 +10,7 @@ from aiogram.types import CallbackQuery
 from typing import Any
 
 from telegram_bot.states.article import ArticleSG
-from .article_handlers import actions, previous_article, next_article, language_selected
+from .article_handlers import actions, previous_article, next_article, language_selected, feed_selected
 
 
 dialog = Dialog(
@@ -29,6 +29,12 @@ dialog = Dialog(
             Button(Const("Next article ▶️"), id="next_article", on_click=next_article),
         ),
         Url(text=Const("Link to article"), url=Format("{url}"), id="url"),
+        Row(
+            Button(Const("🆕 New"), id="feed_new", on_click=feed_selected),
+            Button(Const("🔥 Day"), id="feed_day", on_click=feed_selected),
+            Button(Const("📈 Week"), id="feed_week", on_click=feed_selected),
+            Button(Const("🏆 Month"), id="feed_month", on_click=feed_selected),
+        ),
         state=ArticleSG.main_english,
         getter=actions,
     ),
@@ -39,6 +45,12 @@ dialog = Dialog(
             Button(Const("Следующая статья ▶️"), id="next_article", on_click=next_article),
         ),
         Url(text=Const("Ссылка на статью"), url=Format("{url}"), id="url"),
+        Row(
+            Button(Const("🆕 Новые"), id="feed_new", on_click=feed_selected),
+            Button(Const("🔥 День"), id="feed_day", on_click=feed_selected),
+            Button(Const("📈 Неделя"), id="feed_week", on_click=feed_selected),
+            Button(Const("🏆 Месяц"), id="feed_month", on_click=feed_selected),
+        ),
         state=ArticleSG.main_russian,
         getter=actions,
     )
@@ -1,21 +1,47 @@
-from typing import Dict, Any, List, Optional
-from aiogram_dialog import DialogManager
+import asyncio
+import html
+import logging
+from typing import Dict, Any, List, Tuple
+from aiogram_dialog import BaseDialogManager, DialogManager
+from aiogram.fsm.state import State
 from aiogram.types import CallbackQuery
 from aiogram_dialog.widgets.kbd import Button
 
+from telegram_bot.data import config
 from telegram_bot.states.article import ArticleSG
 from telegram_bot.data_utils.huggingface import get_huggingface_manager
+from telegram_bot.data_utils.openai import Language
+from telegram_bot.utils.throttled_updater import ThrottledUpdater
+
+logger = logging.getLogger(__name__)
 
 class ArticleState:
-    """Class to store global state"""
+    """Class to store global state shared by every dialog"""
     def __init__(self):
         self.manager = None
-        self.articles: List[Dict[str, Any]] = []
-        self.current_language: str = "en"
 
-# Global state
+# Global state; the feed, language and loaded articles of each user live in dialog_data
 state = ArticleState()
 
+LANGUAGES = {"en": Language.EN, "ru": Language.RU}
+
+# Articles loaded at once, the next page is loaded when navigating past the last one
+ARTICLES_PAGE_SIZE = 10
+
+# Partial summaries being streamed, keyed by (paper_id, language code)
+streaming_summaries: Dict[Tuple[str, str], str] = {}
+# Running stream tasks, keyed by (user_id, paper_id)
+streaming_tasks: Dict[Tuple[int, str], asyncio.Task] = {}
+
+SUMMARY_PENDING_NOTES = {
+    "en": "⏳ The summary is being prepared, open the article again in a moment.",
+    "ru": "⏳ Обзор готовится, откройте статью ещё раз через минуту.",
+}
+
+def article_window(language: str) -> State:
+    """Get the article window of a language."""
+    return ArticleSG.main_english if language == "en" else ArticleSG.main_russian
+
 async def language_selected(c: CallbackQuery, button: Button, manager: DialogManager):
     """
     Handle language selection and initialize articles in selected language.
@@ -32,47 +58,102 @@ async def language_selected(c: CallbackQuery, button: Button, manager: DialogMan
     
     # Initialize manager if needed
     if state.manager is None:
-        state.manager = await get_huggingface_manager()
+        state.manager = await get_huggingface_manager(
+            db_pool=manager.middleware_data.get("db_pool"),
+            redis=manager.middleware_data.get("cache_pool"),
+        )
     
     # Get fresh articles in selected language
-    state.articles = await state.manager.get_latest_papers(limit=10, lang=language)
-    state.current_language = language
+    manager.dialog_data["article_ids"] = await load_articles(manager.dialog_data)
     
     await c.answer()
-    print(f"Language selected: {language}")
-    await manager.switch_to(ArticleSG.main_english if language == "en" else ArticleSG.main_russian)
+    logger.debug(f"Language selected: {language}")
+    await manager.switch_to(article_window(language))
+
+async def load_articles(dialog_data: Dict[str, Any], offset: int = 0) -> List[str]:
+    """
+    Get the ids of a page of the feed selected in a dialog.
+
+    Trending feeds fall back to the latest papers while their leaderboard is still empty.
+    The feed of the first page is kept in dialog_data["source"], so the next pages come
+    from the same source.
+
+    Args:
+        dialog_data: Data of the user's dialog, with the selected "feed" and "language"
+        offset: Number of articles of the feed to skip
+
+    Returns:
+        List[str]: Paper ids of the page, in feed order
+    """
+    language = dialog_data.get("language", "en")
+    if offset == 0:
+        dialog_data["source"] = dialog_data.get("feed", "new")
+    source = dialog_data["source"]
+    if source != "new":
+        articles = await state.manager.get_trending_papers(
+            period=source, limit=ARTICLES_PAGE_SIZE, offset=offset, lang=language
+        )
+        if articles or offset:
+            return [article["id"] for article in articles]
+        dialog_data["source"] = "new"
+    articles = await state.manager.get_latest_papers(limit=ARTICLES_PAGE_SIZE, offset=offset, lang=language)
+    return [article["id"] for article in articles]
+
+async def feed_selected(c: CallbackQuery, button: Button, manager: DialogManager):
+    """
+    Handle feed selection and show the first article of the feed.
+
+    Args:
+        c: Callback query
+        button: Button widget that triggered the callback, its id is "feed_<feed>"
+        manager: Dialog manager instance
+    """
+    feed = button.widget_id.removeprefix("feed_")
+    manager.dialog_data["feed"] = feed
+    manager.dialog_data["index"] = 0
+    if state.manager is not None:
+        manager.dialog_data["article_ids"] = await load_articles(manager.dialog_data)
+
+    await c.answer()
+    await manager.switch_to(article_window(manager.dialog_data.get("language", "en")))
 
-async def get_article_by_index(index: int) -> Dict[str, Any]:
+async def get_article_by_index(dialog_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Get article information by index.
+    Get information of the article at the dialog's current index.
     
     Args:
-        index: Index of the article in the articles list
+        dialog_data: Data of the user's dialog, with "article_ids", "index" and "language"
     
     Returns:
         Dict[str, Any]: Article information including title, authors, summary, etc.
     """
-    if not state.articles:
+    article_ids = dialog_data.get("article_ids") or []
+    info = None
+    if article_ids:
+        # Ensure index is within bounds
+        index = max(0, min(dialog_data.get("index", 0), len(article_ids) - 1))
+        info = await state.manager.get_paper_info(article_ids[index], lang=dialog_data.get("language", "en"))
+    if info is None:
         return {
             "index": 0,
             "id": "",
             "title": "Please select a language first",
             "authors": "",
+            "abstract": "",
             "summary": "Use the language selector above",
+            "summary_fields": None,
             "url": "",
         }
     
-    # Ensure index is within bounds
-    index = max(0, min(index, len(state.articles) - 1))
-    article = state.articles[index]
-    
     return {
         "index": index,
-        "id": article["id"],
-        "title": article["title"],
-        "authors": article["authors"],
-        "summary": article["summary"],
-        "url": article["url"],
+        "id": article_ids[index],
+        "title": info["title"],
+        "authors": info["authors"],
+        "abstract": info["abstract"],
+        "summary": info["summary"],
+        "summary_fields": info["summary_fields"],
+        "url": info["url"],
     }
 
 async def actions(dialog_manager: DialogManager, **kwargs) -> Dict[str, Any]:
@@ -86,16 +167,95 @@ async def actions(dialog_manager: DialogManager, **kwargs) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Article information for display
     """
-    index = dialog_manager.dialog_data.get("index", 0)
-    article = await get_article_by_index(index)
+    language = dialog_manager.dialog_data.get("language", "en")
+    article = await get_article_by_index(dialog_manager.dialog_data)
+
+    if article["id"] and not article["summary"]:
+        await request_article_summary(dialog_manager, article)
+
+    partial = streaming_summaries.get((article["id"], language))
+    if article["summary_fields"]:
+        body = article["summary_fields"].render_html()
+    elif article["summary"]:
+        body = article["summary"]
+    elif partial:
+        body = f"{html.escape(partial)} ▌"
+    else:
+        # Show the abstract until the prioritized summary lands
+        pending_note = SUMMARY_PENDING_NOTES.get(language, SUMMARY_PENDING_NOTES["en"])
+        body = f"{html.escape(article['abstract'])}\n\n<i>{pending_note}</i>"
 
     html_text = (
         f"<b>{article['title']}</b>\n\n"
-        f"{article['summary']}"
+        f"{body}"
     )
 
     return {**article, "html_text": html_text}
 
+async def request_article_summary(dialog_manager: DialogManager, article: Dict[str, Any]) -> None:
+    """
+    Start producing the missing summary of the shown article.
+
+    With STREAM_SUMMARIES the summary is streamed into the open dialog,
+    otherwise the paper is moved to the front of the summary queue.
+
+    Args:
+        dialog_manager: Dialog manager instance
+        article: Article shown in the dialog
+    """
+    if not config.STREAM_SUMMARIES:
+        # The getter runs on every re-render, request each paper once per dialog
+        requested = dialog_manager.dialog_data.setdefault("requested_summaries", [])
+        if article["id"] not in requested:
+            await state.manager.request_summary(article["id"])
+            requested.append(article["id"])
+        return
+
+    task_key = (dialog_manager.event.from_user.id, article["id"])
+    if task_key not in streaming_tasks:
+        task = asyncio.create_task(
+            stream_summary_into_dialog(
+                dialog_manager.bg(), article, dialog_manager.dialog_data.get("language", "en")
+            )
+        )
+        streaming_tasks[task_key] = task
+        task.add_done_callback(lambda _: streaming_tasks.pop(task_key, None))
+
+async def stream_summary_into_dialog(bg: BaseDialogManager, article: Dict[str, Any], language: str) -> None:
+    """
+    Create a missing summary and re-render the dialog as its text streams in.
+
+    Re-renders are throttled to STREAM_EDIT_INTERVAL to stay inside Telegram's
+    message edit rate limits. Viewers of a paper already being summarized
+    elsewhere wait for the shared result instead of streaming.
+
+    Args:
+        bg: Background dialog manager of the user viewing the article
+        article: Article shown in the dialog
+        language: Language code of the summary
+    """
+    key = (article["id"], language)
+    updater: ThrottledUpdater[str] = ThrottledUpdater(
+        lambda _: bg.update({}),
+        interval=config.STREAM_EDIT_INTERVAL,
+    )
+
+    def on_progress(text: str) -> None:
+        streaming_summaries[key] = text
+        updater.push(text)
+
+    try:
+        # The final re-render reads the saved summary back
+        await state.manager.get_or_create_summary(
+            article["id"], article["abstract"], LANGUAGES[language], on_progress=on_progress
+        )
+    except Exception as e:
+        logger.error(f"Error streaming summary for paper {article['id']}: {e}")
+    finally:
+        await updater.flush()
+        streaming_summaries.pop(key, None)
+        await bg.update({})
+
 async def previous_article(c: CallbackQuery, b: Button, dialog_manager: DialogManager) -> None:
     """
     Handle navigation to previous article.
@@ -106,13 +266,17 @@ async def previous_article(c: CallbackQuery, b: Button, dialog_manager: DialogMa
         dialog_manager: Dialog manager instance
     """
     index = dialog_manager.dialog_data.get("index", 0)
-    if state.articles:
-        dialog_manager.dialog_data["index"] = index - 1 if index > 0 else len(state.articles) - 1
-    await dialog_manager.switch_to(ArticleSG.main_english if state.current_language == "en" else ArticleSG.main_russian)
+    article_ids = dialog_manager.dialog_data.get("article_ids") or []
+    if article_ids:
+        dialog_manager.dialog_data["index"] = index - 1 if index > 0 else len(article_ids) - 1
+    await dialog_manager.switch_to(article_window(dialog_manager.dialog_data.get("language", "en")))
 
 async def next_article(c: CallbackQuery, b: Button, dialog_manager: DialogManager) -> None:
     """
     Handle navigation to next article.
+
+    Past the last loaded article the next page of the feed is loaded,
+    navigation wraps to the first article once the feed is exhausted.
     
     Args:
         c: Callback query
@@ -120,6 +284,9 @@ async def next_article(c: CallbackQuery, b: Button, dialog_manager: DialogManage
         dialog_manager: Dialog manager instance
     """
     index = dialog_manager.dialog_data.get("index", 0)
-    if state.articles:
-        dialog_manager.dialog_data["index"] = index + 1 if index < len(state.articles) - 1 else 0
-    await dialog_manager.switch_to(ArticleSG.main_english if state.current_language == "en" else ArticleSG.main_russian)
\ No newline at end of file
+    article_ids = dialog_manager.dialog_data.get("article_ids") or []
+    if article_ids:
+        if index >= len(article_ids) - 1:
+            article_ids.extend(await load_articles(dialog_manager.dialog_data, offset=len(article_ids)))
+        dialog_manager.dialog_data["index"] = index + 1 if index < len(article_ids) - 1 else 0
+    await dialog_manager.switch_to(article_window(dialog_manager.dialog_data.get("language", "en")))
\ No newline at end of file
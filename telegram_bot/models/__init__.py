@@ -1 +1,3 @@
 from .base import BaseModel as BaseModel
+from .paper import PaperRecord as PaperRecord
+from .summary import SummaryFields as SummaryFields
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import orjson
+
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a HuggingFace UTC timestamp like "2024-10-30T12:00:00.000Z" into a naive datetime."""
+    try:
+        # fromisoformat is a C fast path but rejects the "Z" suffix before Python 3.11
+        return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+    except ValueError:
+        return datetime.strptime(value, _TIMESTAMP_FORMAT)
+
+
+@dataclass(slots=True)
+class PaperRecord:
+    """A daily_papers entry normalized to the columns of the papers table, in column order."""
+
+    id: str
+    url: str
+    title: str
+    authors: str
+    abstract: str
+    paper_published_at: datetime
+    published_at: datetime
+    upvotes: int
+    num_comments: int
+    thumbnail: str
+    media_urls: str
+    submitted_by: str
+
+    @classmethod
+    def from_daily_paper(cls, entry: dict[str, Any]) -> "PaperRecord":
+        paper = entry["paper"]
+        return cls(
+            id=paper["id"],
+            url=f"https://arxiv.org/pdf/{paper['id']}",
+            title=paper["title"],
+            authors=", ".join(author["name"] for author in paper["authors"] if not author.get("hidden", False)),
+            abstract=paper["summary"],
+            paper_published_at=parse_timestamp(paper["publishedAt"]),
+            published_at=parse_timestamp(entry["publishedAt"]),
+            upvotes=int(paper["upvotes"]),
+            num_comments=int(entry.get("numComments", 0)),
+            thumbnail=entry.get("thumbnail", ""),
+            media_urls=", ".join(entry.get("mediaUrls", [])),
+            submitted_by=entry["submittedBy"]["fullname"],
+        )
+
+    @classmethod
+    def decode_daily_papers(cls, body: bytes | str) -> list["PaperRecord"]:
+        """Decode a raw daily_papers response body into records."""
+        return [cls.from_daily_paper(entry) for entry in orjson.loads(body)]
+
+    def as_row(self) -> tuple[Any, ...]:
+        """Values in papers column order, ready for executemany or COPY."""
+        return (
+            self.id, self.url, self.title, self.authors, self.abstract,
+            self.paper_published_at, self.published_at, self.upvotes, self.num_comments,
+            self.thumbnail, self.media_urls, self.submitted_by,
+        )
@@ -0,0 +1,57 @@
+import html
+import re
+
+import orjson
+import pydantic
+
+from .base import BaseModel
+
+SUMMARY_FIELD_LABELS = (
+    ("objective", "🎯 Objective"),
+    ("method", "🔬 Method"),
+    ("results", "📊 Results"),
+)
+
+# Matches a (possibly unterminated) string value of a summary field in partial JSON.
+_PARTIAL_FIELD_RE = re.compile(r'"(objective|method|results)"\s*:\s*"((?:[^"\\]|\\.)*)')
+
+
+class SummaryFields(BaseModel):
+    objective: str = ""
+    method: str = ""
+    results: str = ""
+
+    @classmethod
+    def from_json(cls, raw: str) -> "SummaryFields | None":
+        try:
+            return cls.model_validate(orjson.loads(raw))
+        except (orjson.JSONDecodeError, pydantic.ValidationError):
+            return None
+
+    @classmethod
+    def from_partial_json(cls, raw: str) -> "SummaryFields":
+        """Extract the fields received so far from a JSON object that is still streaming."""
+        fields = {}
+        for name, value in _PARTIAL_FIELD_RE.findall(raw):
+            # Drop a dangling escape character cut in the middle of the stream
+            if value.endswith("\\") and not value.endswith("\\\\"):
+                value = value[:-1]
+            try:
+                fields[name] = orjson.loads(f'"{value}"')
+            except orjson.JSONDecodeError:
+                fields[name] = value
+        return cls(**fields)
+
+    def render(self) -> str:
+        return "\n".join(
+            f"{label}: {getattr(self, name)}"
+            for name, label in SUMMARY_FIELD_LABELS
+            if getattr(self, name)
+        )
+
+    def render_html(self) -> str:
+        return "\n\n".join(
+            f"<b>{label}</b>: {html.escape(getattr(self, name))}"
+            for name, label in SUMMARY_FIELD_LABELS
+            if getattr(self, name)
+        )
@@ -2,3 +2,5 @@ from . import chunks as chunks
 from . import connect_to_services as connect_to_services
 from . import logging as logging
 from . import smart_session as smart_session
+from . import single_flight as single_flight
+from . import throttled_updater as throttled_updater
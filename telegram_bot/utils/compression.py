@@ -0,0 +1,45 @@
+"""Compression of stored blobs with zstd, reading back older zlib blobs."""
+
+import zlib
+from typing import Tuple
+
+import zstandard
+
+ZSTD_LEVEL = 10
+
+
+def compress(data: bytes) -> Tuple[str, bytes]:
+    """
+    Compress bytes with zstd.
+
+    Every replica writes the same codec, so stored blobs do not depend on
+    which host produced them.
+
+    Args:
+        data: Bytes to compress
+
+    Returns:
+        Tuple[str, bytes]: Codec name and compressed bytes
+    """
+    return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    """
+    Decompress bytes stored by compress, including zlib blobs stored before zstd was required.
+
+    Args:
+        codec: Codec name returned by compress
+        data: Compressed bytes
+
+    Returns:
+        bytes: Original bytes
+
+    Raises:
+        ValueError: If the codec is unknown
+    """
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown compression codec: {codec}")
@@ -0,0 +1,165 @@
+"""On-disk cache of HTTP responses for conditional requests."""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedResponse:
+    """Validators and compressed body of a cached response."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    path: pathlib.Path
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers asking the server to answer 304 if the response is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Stores response bodies compressed on disk with their ETag and Last-Modified.
+
+    Each response is a single file: a JSON header line with the URL and the
+    validators, followed by the zlib-compressed body, written atomically.
+    The total size is capped, and the least recently used files are evicted
+    first. Recency survives restarts through the files' modification times.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 256 * 2**20,
+        logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        Initialize the cache, indexing the files already in the directory.
+
+        Args:
+            directory: Directory to store the responses in, created if missing
+            max_bytes: Maximum total size of the stored files
+            logger: Optional logger instance
+        """
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        # File name -> size, least recently used first
+        self._index: OrderedDict[str, int] = OrderedDict()
+        files = sorted(self.directory.glob("*.cache"), key=lambda path: path.stat().st_mtime)
+        for path in files:
+            self._index[path.name] = path.stat().st_size
+        self._size = sum(self._index.values())
+
+    @staticmethod
+    def _file_name(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest() + ".cache"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Get the validators of a cached response, marking it as recently used.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Optional[CachedResponse]: Cached response or None if the URL is not cached
+        """
+        name = self._file_name(url)
+        if name not in self._index:
+            return None
+        path = self.directory / name
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+            os.utime(path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Dropping unreadable HTTP cache entry for {url}: {e}")
+            self._remove(name)
+            return None
+        self._index.move_to_end(name)
+        return CachedResponse(url=url, etag=header.get("etag"), last_modified=header.get("last_modified"), path=path)
+
+    def read(self, cached: CachedResponse) -> bytes:
+        """
+        Read and decompress the body of a cached response.
+
+        Args:
+            cached: Cached response returned by get
+
+        Returns:
+            bytes: Response body
+
+        Raises:
+            OSError: If the file cannot be read
+            zlib.error: If the body is truncated or corrupt
+        """
+        with open(cached.path, "rb") as f:
+            f.readline()
+            return zlib.decompress(f.read())
+
+    def discard(self, cached: CachedResponse) -> None:
+        """
+        Remove a cached response, e.g. one whose body turned out to be corrupt.
+
+        Args:
+            cached: Cached response returned by get
+
+        Returns:
+            None
+        """
+        self._remove(cached.path.name)
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Store a response, evicting the least recently used ones over the size cap.
+
+        Responses without validators are not stored, they could never be revalidated.
+
+        Args:
+            url: Request URL
+            body: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            None
+        """
+        if not etag and not last_modified:
+            return
+        header = json.dumps({"url": url, "etag": etag, "last_modified": last_modified, "stored_at": time.time()})
+        data = header.encode() + b"\n" + zlib.compress(body, 6)
+        name = self._file_name(url)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.directory / name)
+
+        self._size += len(data) - self._index.pop(name, 0)
+        self._index[name] = len(data)
+        while self._size > self.max_bytes and len(self._index) > 1:
+            self._remove(next(iter(self._index)))
+
+    def _remove(self, name: str) -> None:
+        self._size -= self._index.pop(name, 0)
+        try:
+            (self.directory / name).unlink()
+        except FileNotFoundError:
+            pass
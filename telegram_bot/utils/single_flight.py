@@ -0,0 +1,204 @@
+"""Single-flight coordination of concurrent calls sharing the same key."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Dict, Generic, Optional, TypeVar
+
+from redis.asyncio import Redis
+
+T = TypeVar("T")
+
+# Delete the lock only if it is still owned by the caller.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Extend the lock only if it is still owned by the caller.
+_RENEW_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class _LeaderCancelled(Exception):
+    """Set on the shared future when the caller running the call is cancelled."""
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls for the same key into one in-flight call.
+
+    Within a process, callers that arrive while a call for their key is
+    running await the same future. If the caller running the call is
+    cancelled, its waiters are not: one of them runs the call instead.
+    When a Redis client is given, a short
+    ``SET NX PX`` lock extends this across replicas: the lock holder runs the
+    call and renews the lock every third of its TTL until the call returns,
+    while the other replicas poll ``wait_for_remote`` for the shared result
+    until the lock is released or expires. A holder that dies stops renewing,
+    so its lock expires after at most one TTL.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        lock_ttl: float = 30.0,
+        poll_interval: float = 0.25,
+        key_prefix: str = "single_flight",
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """
+        Initialize the coordinator.
+
+        Args:
+            redis: Optional Redis client used for the cross-replica lock
+            lock_ttl: Lock lifetime in seconds, renewed while the call runs; bounds how
+                long a dead holder blocks others
+            poll_interval: Delay in seconds between checks for a remote result
+            key_prefix: Prefix for the Redis lock keys
+            logger: Optional logger instance
+        """
+        self._redis = redis
+        self._lock_ttl_ms = int(lock_ttl * 1000)
+        self._poll_interval = poll_interval
+        self._key_prefix = key_prefix
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.logger = logger or logging.getLogger(__name__)
+
+    @property
+    def inflight_count(self) -> int:
+        """Number of keys with a call currently in flight in this process."""
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        wait_for_remote: Optional[Callable[[], Awaitable[Optional[T]]]] = None,
+    ) -> T:
+        """
+        Run ``fn`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory performing the actual work
+            wait_for_remote: Coroutine factory returning the result produced by
+                another replica, or None while it is not available yet
+
+        Returns:
+            T: The shared result
+
+        Raises:
+            Exception: Whatever ``fn`` raised, propagated to every waiter
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The leader's caller went away; the first waiter to wake up takes over.
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        # Avoid "exception was never retrieved" warnings when nobody waited.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await self._run(key, fn, wait_for_remote)
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        wait_for_remote: Optional[Callable[[], Awaitable[Optional[T]]]],
+    ) -> T:
+        """
+        Run ``fn`` under the Redis lock, or wait for the replica holding it.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory performing the actual work
+            wait_for_remote: Coroutine factory returning a remote result or None
+
+        Returns:
+            T: The result computed here or by another replica
+        """
+        if self._redis is None:
+            return await fn()
+
+        lock_key = f"{self._key_prefix}:{key}"
+        token = uuid.uuid4().hex
+        while True:
+            if await self._redis.set(lock_key, token, nx=True, px=self._lock_ttl_ms):
+                heartbeat = asyncio.create_task(self._renew_periodically(lock_key, token))
+                try:
+                    return await fn()
+                finally:
+                    heartbeat.cancel()
+                    await asyncio.gather(heartbeat, return_exceptions=True)
+                    await self._release(lock_key, token)
+
+            self.logger.debug(f"Waiting for another replica to finish {key}")
+            deadline = time.monotonic() + self._lock_ttl_ms / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self._poll_interval)
+                if wait_for_remote is not None:
+                    result = await wait_for_remote()
+                    if result is not None:
+                        return result
+                if not await self._redis.exists(lock_key):
+                    # Holder finished without a usable result or died; retry the lock.
+                    break
+
+    async def _renew_periodically(self, lock_key: str, token: str) -> None:
+        """
+        Keep extending the lock while the call runs, so it never expires under a live holder.
+
+        Args:
+            lock_key: Redis key of the lock
+            token: Ownership token set when acquiring the lock
+        """
+        while True:
+            await asyncio.sleep(self._lock_ttl_ms / 3000)
+            try:
+                if not await self._redis.eval(_RENEW_LOCK_SCRIPT, 1, lock_key, token, self._lock_ttl_ms):
+                    self.logger.warning(f"Lost lock {lock_key} while the call was running")
+                    return
+            except Exception as e:
+                # Retried on the next beat; the lock outlives a missed renewal.
+                self.logger.warning(f"Failed to renew lock {lock_key}: {e}")
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        """
+        Release the lock if it is still held by this caller.
+
+        Args:
+            lock_key: Redis key of the lock
+            token: Ownership token set when acquiring the lock
+        """
+        try:
+            await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            # The lock expires on its own, so a failed release is not fatal.
+            self.logger.warning(f"Failed to release lock {lock_key}: {e}")
@@ -0,0 +1,64 @@
+"""Throttling of progressive updates, such as streamed message edits."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ThrottledUpdater(Generic[T]):
+    """
+    Forwards the latest pushed value to ``callback`` at most once per ``interval``.
+
+    ``push`` never waits for the callback, intermediate values pushed while an
+    update is pending are dropped in favour of the newest one. Used to keep
+    progressive message edits inside Telegram's edit rate limits.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[T], Awaitable[None]],
+        interval: float,
+    ) -> None:
+        """
+        Initialize the updater.
+
+        Args:
+            callback: Coroutine function receiving the latest value
+            interval: Minimum seconds between two callback calls
+        """
+        self._callback = callback
+        self._interval = interval
+        self._latest: T | None = None
+        self._dirty = False
+        self._last_sent = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    def push(self, value: T) -> None:
+        """Store the latest value and schedule sending it, without waiting for the callback."""
+        self._latest = value
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait for the pending update, then send the latest value if it is still unsent."""
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._dirty:
+            await self._send()
+
+    async def _drain(self) -> None:
+        while self._dirty:
+            delay = self._last_sent + self._interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._send()
+
+    async def _send(self) -> None:
+        value = self._latest
+        self._dirty = False
+        self._last_sent = time.monotonic()
+        await self._callback(value)  # type: ignore[arg-type]
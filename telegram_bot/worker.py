@@ -0,0 +1,216 @@
+"""
+Ingestion worker: fetches papers, refreshes their metrics and creates summaries.
+
+The bot only serves what this process stores. Periodic jobs are leased in
+Postgres (job_leases), so with several worker replicas each job still runs on
+one replica at a time; the summary queue is drained by every replica, as its
+rows are claimed one by one.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+import tenacity
+from redis.asyncio import Redis
+
+from telegram_bot import utils
+from telegram_bot.data import config
+from telegram_bot.data_utils.huggingface import HuggingFaceManager, get_huggingface_manager
+from telegram_bot.data_utils.huggingface.job_lease import JobLease
+
+# Upper bound of the delay between lease checks, so a job is picked up soon after it is due
+POLL_INTERVAL = 60.0
+
+
+class LeasedJob:
+    """Runs a job every interval, on whichever worker replica holds its lease."""
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[Any]],
+        interval: float,
+        leases: JobLease,
+        holder: str,
+        logger: structlog.typing.FilteringBoundLogger,
+        lease_ttl: float = 300.0,
+        retry_after: float = 60.0,
+    ) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            name: Job name, also the lease key
+            run: Coroutine function running the job once
+            interval: Seconds between the starts of two successful runs
+            leases: Lease storage shared by the replicas
+            holder: Unique name of this replica
+            logger: Logger instance
+            lease_ttl: Seconds the lease is taken for, renewed while the job runs
+            retry_after: Seconds before a failed run is retried
+        """
+        self.name = name
+        self.run = run
+        self.interval = interval
+        self.leases = leases
+        self.holder = holder
+        self.logger = logger.bind(job=name)
+        self.lease_ttl = lease_ttl
+        self.retry_after = retry_after
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Schedule the job in the background if it is not scheduled yet."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._schedule(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancel the job and give its lease up."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.leases.release(self.name, self.holder)
+
+    async def run_once(self) -> bool:
+        """
+        Run the job if its lease is free, keeping the lease until the job is due again.
+
+        Returns:
+            bool: True if the job ran on this replica
+        """
+        if not await self.leases.acquire(self.name, self.holder, self.lease_ttl):
+            return False
+
+        started = asyncio.get_running_loop().time()
+        job = asyncio.create_task(self.run(), name=f"{self.name}-run")
+        heartbeat = asyncio.create_task(self._heartbeat(job), name=f"{self.name}-lease")
+        try:
+            await asyncio.wait({job})
+        finally:
+            heartbeat.cancel()
+            job.cancel()
+            await asyncio.gather(heartbeat, job, return_exceptions=True)
+
+        if job.cancelled():
+            self.logger.warning("Lost the job lease, the run was cancelled")
+            return True
+        elapsed = asyncio.get_running_loop().time() - started
+        if job.exception() is not None:
+            self.logger.error("Job failed", error=str(job.exception()))
+            hold = self.retry_after
+        else:
+            self.logger.info("Job finished", spent_time_s=round(elapsed, 1))
+            # The next run is due one interval after this one started
+            hold = max(self.interval - elapsed, 0.0)
+        await self.leases.renew(self.name, self.holder, hold)
+        return True
+
+    async def _heartbeat(self, job: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            if not await self.leases.renew(self.name, self.holder, self.lease_ttl):
+                job.cancel()
+                return
+
+    async def _schedule(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Failed to check the job lease", error=str(e))
+            await asyncio.sleep(min(self.interval, POLL_INTERVAL))
+
+
+def create_jobs(
+    manager: HuggingFaceManager,
+    leases: JobLease,
+    holder: str,
+    logger: structlog.typing.FilteringBoundLogger,
+) -> list[LeasedJob]:
+    def job(name: str, run: Callable[[], Awaitable[Any]], interval: float) -> LeasedJob:
+        return LeasedJob(name, run, interval, leases, holder, logger, lease_ttl=config.JOB_LEASE_TTL)
+
+    jobs = [job("sync_papers", manager.sync_papers_and_summaries, config.INGEST_SYNC_INTERVAL)]
+    if config.METRICS_REFRESH_INTERVAL > 0:
+        jobs.append(job("metrics_refresh", manager.metrics_refresh.run_once, config.METRICS_REFRESH_INTERVAL))
+    if config.SUMMARY_BACKFILL:
+        jobs.append(job("summary_backfill", manager.summary_backfill.run_pass, manager.summary_backfill.idle_interval))
+    return jobs
+
+
+async def run_worker() -> None:
+    logger: structlog.typing.FilteringBoundLogger = utils.logging.setup_logger().bind(type="worker")
+
+    logger.debug("Connecting to PostgreSQL", db="main")
+    try:
+        db_pool = await utils.connect_to_services.wait_postgres(
+            logger=utils.logging.setup_logger().bind(type="db"),
+            host=config.POSTGRES_HOST,
+            port=config.POSTGRES_PORT,
+            user=config.POSTGRES_USER,
+            password=config.POSTGRES_PASSWORD,
+            database=config.POSTGRES_DB,
+        )
+    except tenacity.RetryError:
+        logger.exception("Failed to connect to PostgreSQL", db="main")
+        exit(1)
+
+    redis_pool: Redis | None = None  # type: ignore[type-arg]
+    if config.USE_CACHE:
+        try:
+            redis_pool = await utils.connect_to_services.wait_redis_pool(
+                logger=utils.logging.setup_logger().bind(type="cache"),
+                host=config.CACHE_HOST,
+                password=config.CACHE_PASSWORD,
+                port=config.CACHE_PORT,
+                database=0,
+            )
+        except tenacity.RetryError:
+            logger.exception("Failed to connect to Redis")
+            exit(1)
+
+    manager = await get_huggingface_manager(db_pool=db_pool, redis=redis_pool)
+    await manager.summary_backfill.checkpoints.init_table()
+    leases = JobLease(manager.hf_db.db)
+    await leases.init_table()
+
+    holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    jobs = create_jobs(manager, leases, holder, logger)
+    for job in jobs:
+        job.start()
+    # The queue also receives the bot's requests for papers users opened, whatever LAZY_SUMMARIES is
+    manager.summary_scheduler.start()
+    logger.info("Started ingestion worker", holder=holder, jobs=[job.name for job in jobs])
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+    await stopping.wait()
+
+    logger.debug("Stopping ingestion worker")
+    for job in jobs:
+        await job.stop()
+    await manager.summary_scheduler.stop()
+    await manager.usage_ledger.stop()
+    await db_pool.close()
+    if redis_pool is not None:
+        await redis_pool.close()
+    logger.info("Stopped ingestion worker")
+
+
+def main() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()